@@ -1,20 +1,52 @@
 from flask import Flask, request, session
 
 from app.config import Config
-from app.extensions import db, login_manager, migrate, babel, bcrypt
+from app.extensions import db, login_manager, babel, bcrypt
 
 
-def create_app():
+def create_app(test_config=None):
     app = Flask(__name__)
     app.config.from_object(Config)
+    if test_config:
+        app.config.update(test_config)
+
+    from app.services.startup_profile import StartupProfile
+
+    # STARTUP_PROFILE=1: час і нові імпорти кожного кроку фабрики
+    profile = StartupProfile(app.config.get("STARTUP_PROFILE", False))
 
     # ---- Extensions ----
-    db.init_app(app)
-    login_manager.init_app(app)
-    migrate.init_app(app, db)
-    bcrypt.init_app(app)
+    with profile.step("database"):
+        from app.services import db_routing, db_tuning, instrumentation
+
+        db_tuning.configure(app)
+        db.init_app(app)
+        with app.app_context():
+            db_tuning.init_app(app, db.engines)
+            db_routing.init_app(app)
+            instrumentation.init_app(app, db_routing.all_engines())
+
+    with profile.step("migrate"):
+        # Flask-Migrate тягне alembic (~0.1 с), а потрібен лише `flask db`,
+        # яка сама ініціалізує його (див. commands.MigrateGroup)
+        if app.config.get("MIGRATE_ALWAYS"):
+            from flask_migrate import Migrate
+
+            Migrate(app, db)
 
-    login_manager.login_view = "auth.login"
+    with profile.step("auth"):
+        login_manager.init_app(app)
+        bcrypt.init_app(app)
+
+        login_manager.login_view = "auth.login"
+
+    with profile.step("caches"):
+        from app.services import entitlements, fragment_cache, goal_trash, user_cache
+
+        goal_trash.init_app(app)
+        user_cache.init_app(app)
+        entitlements.init_app(app)
+        fragment_cache.init_app(app)
 
     # ✅ Flask-Babel 4 locale selector
     def get_locale():
@@ -24,25 +56,42 @@ def create_app():
 
         return request.accept_languages.best_match(app.config.get("LANGUAGES", ["uk"])) or "uk"
 
-    babel.init_app(app, locale_selector=get_locale)
+    with profile.step("babel"):
+        # каталог мови читається з першим запитом цією мовою і далі береться з кешу
+        babel.init_app(app, locale_selector=get_locale)
 
     # ---- Blueprints ----
-    from app.routes.main import main_bp
-    from app.routes.auth import auth_bp
-    from app.routes.goals import goals_bp
-    from app.routes.tasks import tasks_bp
-    from app.routes.calendar import calendar_bp
-    from app.routes.i18n import i18n_bp
-    from app.routes.stats import stats_bp
-    from app.routes.billing import billing_bp
-
-    app.register_blueprint(main_bp)
-    app.register_blueprint(auth_bp)
-    app.register_blueprint(goals_bp)
-    app.register_blueprint(tasks_bp)
-    app.register_blueprint(calendar_bp)
-    app.register_blueprint(i18n_bp)
-    app.register_blueprint(stats_bp)
-    app.register_blueprint(billing_bp)
+    with profile.step("blueprints"):
+        from app.routes.main import main_bp
+        from app.routes.auth import auth_bp
+        from app.routes.goals import goals_bp
+        from app.routes.tasks import tasks_bp
+        from app.routes.calendar import calendar_bp
+        from app.routes.i18n import i18n_bp
+        from app.routes.stats import stats_bp
+        from app.routes.billing import billing_bp
+        from app.routes.api import api_bp
+        from app.routes.ops import ops_bp
+
+        app.register_blueprint(main_bp)
+        app.register_blueprint(auth_bp)
+        app.register_blueprint(goals_bp)
+        app.register_blueprint(tasks_bp)
+        app.register_blueprint(calendar_bp)
+        app.register_blueprint(i18n_bp)
+        app.register_blueprint(stats_bp)
+        app.register_blueprint(billing_bp)
+        app.register_blueprint(api_bp)
+        app.register_blueprint(ops_bp)
+
+    # ---- CLI ----
+    with profile.step("cli"):
+        from app.commands import register_commands
+
+        register_commands(app)
+
+    if profile.enabled:
+        app.extensions["startup_profile"] = profile
+        app.logger.warning("startup profile:\n%s", profile.report())
 
     return app
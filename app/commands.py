@@ -0,0 +1,197 @@
+import time
+from datetime import date, datetime
+
+import click
+from flask.cli import AppGroup, ScriptInfo
+
+from app.extensions import db
+from app.models.user import User
+from app.services import (
+    callback_inbox, entitlements, fragment_cache, goal_counters, goal_trash, rollover, rollup, search, streaks,
+)
+
+stats_cli = AppGroup("stats", help="Stats maintenance commands.")
+billing_cli = AppGroup("billing", help="Billing background jobs.")
+goals_cli = AppGroup("goals", help="Goal background jobs.")
+tasks_cli = AppGroup("tasks", help="Task background jobs.")
+
+
+@stats_cli.command("rebuild-rollup")
+@click.option("--user-id", type=int, default=None, help="Rebuild only this user.")
+def rebuild_rollup(user_id):
+    """Backfill the daily completion rollup from existing tasks."""
+    written = rollup.rebuild(user_id=user_id)
+    # серії рахуються з rollup, тож перераховуються ліниво при наступному читанні
+    streaks.forget(user_id)
+    db.session.commit()
+    click.echo(f"Rollup rebuilt: {written} buckets")
+
+
+@stats_cli.command("rebuild-goal-counters")
+@click.option("--goal-id", type=int, default=None, help="Rebuild only this goal.")
+def rebuild_goal_counters(goal_id):
+    """Recompute goal progress counters from existing tasks."""
+    updated = goal_counters.rebuild(goal_id=goal_id)
+    click.echo(f"Goal counters rebuilt: {updated} goals")
+
+
+@stats_cli.command("sweep-fragments")
+def sweep_fragments():
+    """Delete expired and surplus cached week/calendar fragments (filesystem backend)."""
+    removed = fragment_cache.sweep()
+    click.echo(f"Fragments removed: {removed}")
+
+
+@stats_cli.command("reconcile-streaks")
+@click.option("--user-id", type=int, default=None, help="Check only this user.")
+@click.option("--fix", is_flag=True, help="Overwrite mismatched state with the recomputed one.")
+def reconcile_streaks(user_id, fix):
+    """Verify stored streaks against the task table."""
+    query = db.session.query(User.id).order_by(User.id)
+    if user_id is not None:
+        query = query.filter(User.id == user_id)
+
+    mismatched = 0
+    for (uid,) in query.all():
+        diff = streaks.reconcile(uid, fix=fix)
+        if diff is None:
+            continue
+        mismatched += 1
+        stored, expected = diff
+        click.echo(f"user {uid}: stored {stored} != expected {expected}")
+
+    if fix:
+        db.session.commit()
+    click.echo(f"Streaks checked: {mismatched} mismatched" + (" (fixed)" if fix and mismatched else ""))
+
+
+@billing_cli.command("process-callbacks")
+@click.option("--batch-size", type=int, default=100, show_default=True)
+@click.option("--loop", is_flag=True, help="Keep polling instead of draining once.")
+@click.option("--interval", type=float, default=1.0, show_default=True, help="Seconds between polls when idle.")
+def process_callbacks(batch_size, loop, interval):
+    """Apply queued Fondy callbacks to payments and users."""
+    total = 0
+    while True:
+        handled = callback_inbox.process_batch(batch_size)
+        total += handled
+        if handled:
+            continue
+        if not loop:
+            break
+        time.sleep(interval)
+    click.echo(f"Callbacks processed: {total}")
+
+
+def _parse_now(value):
+    return datetime.fromisoformat(value) if value else None
+
+
+@billing_cli.command("expire-pro")
+@click.option("--now", "now", default=None, help="Pretend the current UTC time is this ISO timestamp.")
+@click.option("--dry-run", is_flag=True, help="Only count expired users.")
+def expire_pro(now, dry_run):
+    """Downgrade users whose Pro period has ended (one UPDATE)."""
+    count = entitlements.sweep(now=_parse_now(now), dry_run=dry_run)
+    click.echo(f"Expired Pro users: {count}" + (" (dry run)" if dry_run else ""))
+
+
+@billing_cli.command("entitlement")
+@click.argument("user_id", type=int)
+@click.option("--now", "now", default=None, help="Pretend the current UTC time is this ISO timestamp.")
+def show_entitlement(user_id, now):
+    """Print a user's effective plan."""
+    entitlement = entitlements.for_user(user_id, now=_parse_now(now), fresh=True)
+    expires = entitlement.expires_at.isoformat() if entitlement.expires_at else "-"
+    click.echo(f"user {user_id}: {entitlement.plan} until {expires}")
+
+
+@goals_cli.command("purge-deleted")
+@click.option("--chunk-size", type=int, default=1000, show_default=True, help="Rows deleted per transaction.")
+@click.option("--pause", type=float, default=0.05, show_default=True, help="Seconds between chunks, so other writers get the lock.")
+@click.option("--loop", is_flag=True, help="Keep polling instead of draining once.")
+@click.option("--interval", type=float, default=5.0, show_default=True, help="Seconds between polls when idle.")
+def purge_deleted(chunk_size, pause, loop, interval):
+    """Remove soft-deleted goals and their tasks in small transactions."""
+    total = 0
+    while True:
+        deleted = goal_trash.purge_batch(chunk_size)
+        total += deleted
+        if deleted:
+            time.sleep(pause)
+            continue
+        if not loop:
+            break
+        time.sleep(interval)
+    click.echo(f"Rows purged: {total}")
+
+
+@tasks_cli.command("rollover")
+@click.option("--today", "today", default=None, help="Pretend today is this ISO date.")
+@click.option("--dry-run", is_flag=True, help="Only report what would be moved.")
+@click.option("--chunk-size", type=int, default=1000, show_default=True, help="Tasks moved per transaction.")
+@click.option("--time-limit", type=float, default=None, help="Stop after this many seconds; the next run continues.")
+@click.option("--pause", type=float, default=0.0, show_default=True, help="Seconds between chunks.")
+def rollover_tasks(today, dry_run, chunk_size, time_limit, pause):
+    """Move unfinished past tasks of opted-in users to today."""
+    today = date.fromisoformat(today) if today else date.today()
+    if dry_run:
+        rows = rollover.report(today)
+        for row in rows:
+            click.echo(f"user {row.user_id}: {row.tasks} tasks since {row.oldest.isoformat()}")
+        click.echo(f"Tasks to roll over: {sum(row.tasks for row in rows)} (dry run)")
+        return
+
+    result = rollover.run(today, chunk_size=chunk_size, time_limit=time_limit, pause=pause)
+    click.echo(
+        f"Tasks rolled over: {result.tasks} for {result.users} users"
+        + ("" if result.finished else " (time limit reached)")
+    )
+
+
+@tasks_cli.command("rebuild-search-index")
+def rebuild_search_index():
+    """Refill the full-text index from task and goal titles."""
+    rows = search.rebuild()
+    click.echo(f"Search index rebuilt: {rows} rows")
+
+
+class MigrateGroup(click.Group):
+    """``flask db`` from Flask-Migrate, imported only when the command runs.
+
+    The app factory skips Flask-Migrate (alembic is the slowest import at
+    boot), so the group sets it up on the loaded app before delegating.
+    """
+
+    def _commands(self):
+        from flask_migrate.cli import db as db_cli
+
+        return db_cli
+
+    def list_commands(self, ctx):
+        return self._commands().list_commands(ctx)
+
+    def get_command(self, ctx, name):
+        return self._commands().get_command(ctx, name)
+
+    def parse_args(self, ctx, args):
+        # -d/--directory, -x та колбек, що кладе їх у g, беремо з оригінальної групи
+        db_cli = self._commands()
+        self.params, self.callback = db_cli.params, db_cli.callback
+        return super().parse_args(ctx, args)
+
+    def invoke(self, ctx):
+        app = ctx.ensure_object(ScriptInfo).load_app()
+        if "migrate" not in app.extensions:
+            from flask_migrate import Migrate
+
+            Migrate(app, db)
+        return super().invoke(ctx)
+
+
+def register_commands(app):
+    app.cli.add_command(stats_cli)
+    app.cli.add_command(billing_cli)
+    app.cli.add_command(goals_cli)
+    app.cli.add_command(tasks_cli)
+    app.cli.add_command(MigrateGroup("db", help="Perform database migrations."))
@@ -17,6 +17,58 @@ class Config:
     SQLALCHEMY_DATABASE_URI = os.environ.get("DATABASE_URL", f"sqlite:///{DB_PATH}")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # ✅ optional read replica for read-only views; a writer reads from primary for this long
+    REPLICA_DATABASE_URL = os.environ.get("REPLICA_DATABASE_URL")
+    REPLICA_STICKY_SECONDS = float(os.environ.get("REPLICA_STICKY_SECONDS", "5"))
+
+    # ✅ engine tuning (app/services/db_tuning.py); empty value = leave the driver default
+    SQLITE_JOURNAL_MODE = os.environ.get("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_SYNCHRONOUS = os.environ.get("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_BUSY_TIMEOUT_MS = os.environ.get("SQLITE_BUSY_TIMEOUT_MS", "5000")
+    SQLITE_MMAP_SIZE = os.environ.get("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))
+    SQLITE_CACHE_SIZE = os.environ.get("SQLITE_CACHE_SIZE", "-65536")  # від'ємне = KiB
+    DB_POOL_SIZE = os.environ.get("DB_POOL_SIZE", "10")
+    DB_MAX_OVERFLOW = os.environ.get("DB_MAX_OVERFLOW", "20")
+    DB_POOL_RECYCLE = os.environ.get("DB_POOL_RECYCLE", "1800")
+    DB_POOL_PRE_PING = os.environ.get("DB_POOL_PRE_PING", "1")
+
+    # ✅ per-process user cache (flask-login user_loader), seconds; 0 disables.
+    # Скидається лише в процесі, що змінив користувача: зміни з CLI та інших воркерів видно через TTL
+    USER_CACHE_TTL = float(os.environ.get("USER_CACHE_TTL", "5"))
+    USER_CACHE_SIZE = int(os.environ.get("USER_CACHE_SIZE", "10000"))
+
+    # ✅ cached plan/expiry per user, seconds; per-process like the user cache, checkout reads fresh
+    ENTITLEMENT_CACHE_TTL = float(os.environ.get("ENTITLEMENT_CACHE_TTL", "5"))
+
+    # ✅ rendered week/calendar grids: memory | filesystem | redis | none
+    FRAGMENT_CACHE_BACKEND = os.environ.get("FRAGMENT_CACHE_BACKEND", "memory")
+    FRAGMENT_CACHE_SIZE = int(os.environ.get("FRAGMENT_CACHE_SIZE", "512"))
+    FRAGMENT_CACHE_TTL = int(os.environ.get("FRAGMENT_CACHE_TTL", "86400"))
+    FRAGMENT_CACHE_DIR = os.environ.get("FRAGMENT_CACHE_DIR", os.path.join(BASE_DIR, ".cache", "fragments"))
+    # filesystem: старші файли понад цю кількість видаляються (також flask stats sweep-fragments)
+    FRAGMENT_CACHE_DIR_MAX_FILES = int(os.environ.get("FRAGMENT_CACHE_DIR_MAX_FILES", "10000"))
+    FRAGMENT_CACHE_REDIS_URL = os.environ.get("FRAGMENT_CACHE_REDIS_URL", "redis://localhost:6379/0")
+
+    # ✅ opt-in Server-Timing headers, /ops/metrics and N+1 warnings (same statement >= N times per request)
+    INSTRUMENTATION_ENABLED = os.environ.get("INSTRUMENTATION", "").lower() in ("1", "true", "yes", "on")
+    INSTRUMENTATION_N_PLUS_ONE = int(os.environ.get("INSTRUMENTATION_N_PLUS_ONE", "5"))
+
+    # ✅ agenda: open tasks due within AGENDA_DAYS, at most AGENDA_LIMIT per list
+    AGENDA_DAYS = int(os.environ.get("AGENDA_DAYS", "7"))
+    AGENDA_LIMIT = int(os.environ.get("AGENDA_LIMIT", "20"))
+
+    # ✅ search: SEARCH_LIMIT results, ranked among the newest SEARCH_CANDIDATES matches
+    SEARCH_LIMIT = int(os.environ.get("SEARCH_LIMIT", "20"))
+    SEARCH_CANDIDATES = int(os.environ.get("SEARCH_CANDIDATES", "1000"))
+
+    # ✅ STARTUP_PROFILE=1 logs time and imports of every create_app step
+    STARTUP_PROFILE = os.environ.get("STARTUP_PROFILE", "").lower() in ("1", "true", "yes", "on")
+    # ✅ Flask-Migrate is set up only for `flask db`, unless forced (e.g. flask_migrate.upgrade() from a script)
+    MIGRATE_ALWAYS = os.environ.get("MIGRATE_ALWAYS", "").lower() in ("1", "true", "yes", "on")
+
+    # ✅ /ops/* endpoints are disabled unless a token is set
+    OPS_TOKEN = os.environ.get("OPS_TOKEN")
+
     # ✅ i18n
     BABEL_DEFAULT_LOCALE = "uk"
     LANGUAGES = ["uk", "en", "pl", "de", "es"]
@@ -25,6 +77,12 @@ class Config:
     FONDY_MERCHANT_ID = os.environ.get("FONDY_MERCHANT_ID")
     FONDY_SECRET_KEY = os.environ.get("FONDY_SECRET_KEY")
     FONDY_API_URL = os.environ.get("FONDY_API_URL", "https://pay.fondy.eu/api/checkout/url")
+    # ✅ HTTP client: keep-alive pool, separate connect/read timeouts, retries with jitter
+    FONDY_POOL_SIZE = int(os.environ.get("FONDY_POOL_SIZE", "10"))
+    FONDY_CONNECT_TIMEOUT = float(os.environ.get("FONDY_CONNECT_TIMEOUT", "3"))
+    FONDY_READ_TIMEOUT = float(os.environ.get("FONDY_READ_TIMEOUT", "10"))
+    FONDY_MAX_RETRIES = int(os.environ.get("FONDY_MAX_RETRIES", "2"))
+    FONDY_RETRY_BACKOFF = float(os.environ.get("FONDY_RETRY_BACKOFF", "0.2"))
     PRO_AMOUNT = int(os.environ.get("PRO_AMOUNT", "49900"))
     PRO_CURRENCY = os.environ.get("PRO_CURRENCY", "UAH")
     PRO_DURATION_DAYS = int(os.environ.get("PRO_DURATION_DAYS", "30"))
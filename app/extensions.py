@@ -1,12 +1,13 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager
-from flask_migrate import Migrate
 from flask_babel import Babel
 from flask_bcrypt import Bcrypt
 
-db = SQLAlchemy()
+from app.services.db_routing import RoutingSession
+
+# ✅ reads of @replica_reads views may go to the "replica" bind
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 login_manager = LoginManager()
-migrate = Migrate()
 
 # ✅ i18n
 babel = Babel()
@@ -1,3 +1,8 @@
 from .user import User
 from .goal import Goal
 from .task import Task
+from .daily_completion import DailyCompletion
+from .recurring_task import RecurringTask
+from .user_streak import UserStreak
+from .payment_callback import PaymentCallback
+from . import search
@@ -0,0 +1,16 @@
+from app.extensions import db
+
+
+class DailyCompletion(db.Model):
+    """Pre-aggregated number of completed tasks per user, day and goal."""
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
+    goal_id = db.Column(db.Integer, db.ForeignKey("goal.id"), nullable=False, index=True)
+    day = db.Column(db.Date, nullable=False)
+    count = db.Column(db.Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        db.UniqueConstraint("user_id", "day", "goal_id", name="uq_daily_completion_user_day_goal"),
+    )
@@ -6,8 +6,16 @@ class Goal(db.Model):
     title = db.Column(db.String(200), nullable=False)
     description = db.Column(db.Text, nullable=True)
 
-    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False, index=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
 
+    # лічильники прогресу для /goals; ведуться services/goal_counters разом із задачами
+    task_count = db.Column(db.Integer, default=0, server_default="0", nullable=False)
+    done_count = db.Column(db.Integer, default=0, server_default="0", nullable=False)
+    last_completed_at = db.Column(db.DateTime, nullable=True)
+
+    # м'яке видалення: ціль і її задачі приховані одразу, рядки прибирає `flask goals purge-deleted`
+    deleted_at = db.Column(db.DateTime, nullable=True, index=True)
+
     # ✅ щоб Task мав доступ як t.goal
     tasks = db.relationship("Task", backref="goal", lazy=True, cascade="all, delete-orphan")
@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from app.extensions import db
+
+
+class PaymentCallback(db.Model):
+    """Raw Fondy server callback, applied later by the inbox worker.
+
+    One row per (order_id, order_status): provider retries of the same
+    notification collapse into the existing row.
+    """
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    order_id = db.Column(db.String(64), nullable=False)
+    order_status = db.Column(db.String(32), nullable=False, default="")
+    payload = db.Column(db.Text, nullable=False)
+
+    received_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    processed_at = db.Column(db.DateTime, nullable=True)
+    error = db.Column(db.String(255), nullable=True)
+
+    __table_args__ = (
+        db.UniqueConstraint("order_id", "order_status", name="uq_payment_callback_order_status"),
+        # воркер вибирає необроблені в порядку надходження
+        db.Index("ix_payment_callback_processed_at_id", "processed_at", "id"),
+    )
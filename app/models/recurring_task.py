@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from app.extensions import db
+
+
+class RecurringTask(db.Model):
+    """A rule that produces one task per matching day.
+
+    Occurrences are expanded on the fly for the viewed range; a ``Task`` row
+    with ``recurrence_id`` is written only once an occurrence is toggled.
+    """
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False, index=True)
+    goal_id = db.Column(db.Integer, db.ForeignKey("goal.id"), nullable=False, index=True)
+
+    title = db.Column(db.String(200), nullable=False)
+    task_type = db.Column(db.String(20), nullable=True)
+
+    # daily | weekdays | interval (кожні interval_days днів від starts_on)
+    rule = db.Column(db.String(16), nullable=False, default="daily")
+    interval_days = db.Column(db.Integer, nullable=True)
+
+    starts_on = db.Column(db.Date, nullable=False)
+    ends_on = db.Column(db.Date, nullable=True)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
@@ -0,0 +1,76 @@
+"""Full-text index over task and goal titles; plain DDL, no ORM model.
+
+SQLite keeps a FTS5 table in sync with triggers, so every write path
+(forms, bulk API, rollover, purge) is covered. Rows are keyed by rowid:
+``task.id * 2`` for tasks and ``goal.id * 2 + 1`` for goals. PostgreSQL
+needs no copy: expression GIN indexes over ``to_tsvector('simple', …)``
+are maintained by the database itself.
+
+A batch migration that recreates ``task`` or ``goal`` on SQLite drops the
+triggers with the old table: create them again and run
+``flask tasks rebuild-search-index``. ``migrations/env.py`` hides these
+objects from autogenerate, which would otherwise propose dropping them.
+"""
+from sqlalchemy import DDL, event
+
+from ..extensions import db
+
+SQLITE_TABLE = "search_index"
+
+_task_row = (
+    "new.id * 2, new.title, '', 'u' || new.user_id, 'task', new.id, new.goal_id"
+)
+_goal_row = (
+    "new.id * 2 + 1, new.title, coalesce(new.description, ''), 'u' || new.user_id, 'goal', new.id, new.id"
+)
+_insert = f"INSERT INTO {SQLITE_TABLE}(rowid, title, body, owner, kind, ref_id, goal_id) VALUES"
+
+SQLITE_DDL = [
+    # owner — токен 'u<user_id>': фільтр власника йде через той самий повнотекстовий індекс
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_TABLE} USING fts5(
+        title, body, owner, kind UNINDEXED, ref_id UNINDEXED, goal_id UNINDEXED,
+        tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS task_search_insert AFTER INSERT ON task BEGIN
+        {_insert} ({_task_row});
+    END""",
+    # зміна is_done, planned_for чи rollover індекс не чіпає
+    f"""CREATE TRIGGER IF NOT EXISTS task_search_update AFTER UPDATE OF title, user_id, goal_id ON task BEGIN
+        DELETE FROM {SQLITE_TABLE} WHERE rowid = old.id * 2;
+        {_insert} ({_task_row});
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS task_search_delete AFTER DELETE ON task BEGIN
+        DELETE FROM {SQLITE_TABLE} WHERE rowid = old.id * 2;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS goal_search_insert AFTER INSERT ON goal BEGIN
+        {_insert} ({_goal_row});
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS goal_search_update AFTER UPDATE OF title, description, user_id ON goal BEGIN
+        DELETE FROM {SQLITE_TABLE} WHERE rowid = old.id * 2 + 1;
+        {_insert} ({_goal_row});
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS goal_search_delete AFTER DELETE ON goal BEGIN
+        DELETE FROM {SQLITE_TABLE} WHERE rowid = old.id * 2 + 1;
+    END""",
+]
+
+# ті самі вирази мають стояти в запитах пошуку, інакше індекс не спрацює
+TASK_TSVECTOR = "to_tsvector('simple', title)"
+GOAL_TSVECTOR = "to_tsvector('simple', title || ' ' || coalesce(description, ''))"
+
+POSTGRESQL_INDEXES = ("ix_task_title_search", "ix_goal_search")
+
+POSTGRESQL_DDL = [
+    f"CREATE INDEX IF NOT EXISTS {POSTGRESQL_INDEXES[0]} ON task USING gin ({TASK_TSVECTOR})",
+    f"CREATE INDEX IF NOT EXISTS {POSTGRESQL_INDEXES[1]} ON goal USING gin ({GOAL_TSVECTOR})",
+]
+
+for _statement in SQLITE_DDL:
+    event.listen(db.metadata, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+for _statement in POSTGRESQL_DDL:
+    event.listen(db.metadata, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+event.listen(
+    db.metadata,
+    "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {SQLITE_TABLE}").execute_if(dialect="sqlite"),
+)
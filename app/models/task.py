@@ -1,5 +1,9 @@
 from datetime import datetime
+
+from sqlalchemy import event, inspect, select
+
 from ..extensions import db
+from .goal import Goal
 
 class Task(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -16,5 +20,56 @@ class Task(db.Model):
     due_date = db.Column(db.Date, nullable=True, index=True)
 
     goal_id = db.Column(db.Integer, db.ForeignKey("goal.id"), nullable=False)
+    # копія goal.user_id: week/calendar/stats читають задачі без join і без IN-списку
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     completed_at = db.Column(db.DateTime, nullable=True, index=True)
+
+    # заповнено лише для збереженого входження повторюваної задачі
+    recurrence_id = db.Column(db.Integer, db.ForeignKey("recurring_task.id"), nullable=True)
+
+    # початковий planned_for задачі, перенесеної rollover-ом
+    rolled_over_from = db.Column(db.Date, nullable=True)
+
+    # складені індекси під запити week/calendar (діапазон planned_for)
+    # та goal_detail/видалення цілі (задачі однієї цілі)
+    __table_args__ = (
+        db.Index("ix_task_user_id_planned_for", "user_id", "planned_for"),
+        db.Index("ix_task_goal_id_planned_for", "goal_id", "planned_for"),
+        db.Index("ix_task_goal_id_is_done_completed_at", "goal_id", "is_done", "completed_at"),
+        db.UniqueConstraint("recurrence_id", "planned_for", name="uq_task_recurrence_id_planned_for"),
+        # частковий індекс лише відкритих задач із дедлайном: agenda та прострочені на /goals;
+        # goal_id у хвості — підрахунки не читають саму таблицю
+        db.Index(
+            "ix_task_open_user_id_due_date",
+            "user_id",
+            "due_date",
+            "goal_id",
+            sqlite_where=db.text("is_done = 0 AND due_date IS NOT NULL"),
+            postgresql_where=db.text("NOT is_done AND due_date IS NOT NULL"),
+        ),
+        # відкриті задачі за planned_for: rollover бачить лише прострочені, не всю історію
+        db.Index(
+            "ix_task_open_user_id_planned_for",
+            "user_id",
+            "planned_for",
+            sqlite_where=db.text("is_done = 0"),
+            postgresql_where=db.text("NOT is_done"),
+        ),
+    )
+
+
+def _goal_owner(connection, goal_id):
+    return connection.execute(select(Goal.user_id).where(Goal.id == goal_id)).scalar()
+
+
+@event.listens_for(Task, "before_insert")
+def _fill_user_id(mapper, connection, task):
+    if task.user_id is None and task.goal_id is not None:
+        task.user_id = _goal_owner(connection, task.goal_id)
+
+
+@event.listens_for(Task, "before_update")
+def _follow_goal_owner(mapper, connection, task):
+    if inspect(task).attrs.goal_id.history.has_changes():
+        task.user_id = _goal_owner(connection, task.goal_id)
@@ -10,3 +10,14 @@ class User(db.Model, UserMixin):
 
     is_pro = db.Column(db.Boolean, default=False, nullable=False)
     pro_until = db.Column(db.DateTime, nullable=True)
+
+    # лічильник змін планера: кеш фрагментів і ETag залежать від нього
+    data_version = db.Column(db.Integer, default=0, server_default="0", nullable=False)
+
+    # нічний flask tasks rollover переносить незроблені минулі задачі на сьогодні
+    rollover_tasks = db.Column(db.Boolean, default=False, server_default="0", nullable=False)
+
+    # вибірка простроченого Pro для flask billing expire-pro
+    __table_args__ = (
+        db.Index("ix_user_is_pro_pro_until", "is_pro", "pro_until"),
+    )
@@ -0,0 +1,15 @@
+from app.extensions import db
+
+
+class UserStreak(db.Model):
+    """Latest run of active days and the longest run, kept in step with the rollup.
+
+    A day is active when it has at least one completed task. The current
+    streak is ``run_start..last_active_day`` while ``last_active_day`` is today.
+    """
+
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), primary_key=True)
+
+    run_start = db.Column(db.Date, nullable=True)
+    last_active_day = db.Column(db.Date, nullable=True)
+    longest = db.Column(db.Integer, nullable=False, default=0)
@@ -0,0 +1,506 @@
+import base64
+import json
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta
+from functools import wraps
+
+from flask import Blueprint, current_app, jsonify, request
+from flask_login import current_user
+from sqlalchemy import and_, insert, or_, update
+
+from app.extensions import db
+from app.models.goal import Goal
+from app.models.recurring_task import RecurringTask
+from app.models.task import Task
+from app.routes.tasks import TASK_TYPES
+from app.services import (
+    agenda, data_version, fragment_cache, goal_counters, http_cache, recurrence, rollup, search, stats_summary,
+    streaks, task_status,
+)
+
+api_bp = Blueprint("api", __name__, url_prefix="/api/v1")
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 500
+MAX_AGENDA_DAYS = 60
+MAX_SEARCH_LIMIT = 50
+MAX_BATCH = 500
+TASK_TYPE_KEYS = {key for key, _label in TASK_TYPES}
+MAX_TITLE_LENGTH = Task.__table__.c.title.type.length
+# правила розгортаються в Python, тож діапазон /tasks обмежений
+MAX_TASK_RANGE_DAYS = 366
+
+GOAL_FIELDS = {
+    "id": Goal.id,
+    "title": Goal.title,
+    "description": Goal.description,
+    "created_at": Goal.created_at,
+}
+
+TASK_FIELDS = {
+    "id": Task.id,
+    "title": Task.title,
+    "is_done": Task.is_done,
+    "planned_for": Task.planned_for,
+    "task_type": Task.task_type,
+    "due_date": Task.due_date,
+    "goal_id": Task.goal_id,
+    "recurrence_id": Task.recurrence_id,
+    "created_at": Task.created_at,
+    "completed_at": Task.completed_at,
+}
+
+
+class ApiError(Exception):
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+
+
+@api_bp.errorhandler(ApiError)
+def _api_error(exc: ApiError):
+    return jsonify(error=exc.message), exc.status
+
+
+def api_login_required(view):
+    """Like ``login_required``, but answers 401 JSON instead of redirecting."""
+
+    @wraps(view)
+    def wrapped(*args, **kwargs):
+        if not current_user.is_authenticated:
+            raise ApiError("unauthorized", 401)
+        return view(*args, **kwargs)
+
+    return wrapped
+
+
+def _parse_date_arg(name: str, default=None):
+    value = request.args.get(name)
+    if not value:
+        return default
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise ApiError(f"{name} must be YYYY-MM-DD")
+
+
+def _parse_limit() -> int:
+    try:
+        limit = int(request.args.get("limit", DEFAULT_LIMIT))
+    except ValueError:
+        raise ApiError("limit must be an integer")
+    return max(1, min(limit, MAX_LIMIT))
+
+
+def _parse_fields(allowed):
+    raw = request.args.get("fields")
+    if not raw:
+        return list(allowed)
+    fields = [f.strip() for f in raw.split(",") if f.strip()]
+    unknown = [f for f in fields if f not in allowed]
+    if unknown:
+        raise ApiError(f"unknown fields: {', '.join(unknown)}")
+    return fields
+
+
+def encode_cursor(*values) -> str:
+    raw = json.dumps([v.isoformat() if isinstance(v, date) else v for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, *parsers):
+    """Decode a cursor, passing each value through its parser; any mismatch is ``invalid cursor``."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, TypeError):
+        raise ApiError("invalid cursor")
+    if not isinstance(values, list) or len(values) != len(parsers):
+        raise ApiError("invalid cursor")
+    try:
+        return [parse(value) for parse, value in zip(parsers, values)]
+    except (ValueError, TypeError):
+        raise ApiError("invalid cursor")
+
+
+def _cursor_id(value) -> int:
+    if not _is_id(value):
+        raise ValueError("cursor id must be an integer")
+    return value
+
+
+def _json_list(key: str):
+    body = request.get_json(silent=True)
+    items = body.get(key) if isinstance(body, dict) else None
+    if not isinstance(items, list) or not items:
+        raise ApiError(f"{key} must be a non-empty list")
+    if len(items) > MAX_BATCH:
+        raise ApiError(f"at most {MAX_BATCH} {key} per request")
+    return items
+
+
+def _is_id(value) -> bool:
+    # bool — теж int (True == 1), а списки/об'єкти навіть не хешуються
+    return type(value) is int
+
+
+def _optional_date(item, key):
+    value = item.get(key)
+    if value in (None, ""):
+        return None
+    return date.fromisoformat(value)
+
+
+def _serialize(value):
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def _page(rows, fields, limit, cursor_of, **extra):
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    data = [{f: _serialize(getattr(row, f)) for f in fields} for row in rows]
+    next_cursor = encode_cursor(*cursor_of(rows[-1])) if has_more else None
+    return jsonify(data=data, next_cursor=next_cursor, **extra)
+
+
+def _occurrences(start, end, goal_id):
+    """Unsaved occurrences of recurring rules in ``start..end``, as ``week_view`` shows them."""
+    saved = (
+        db.session.query(Task.recurrence_id, Task.planned_for)
+        .filter(Task.user_id == current_user.id, Task.recurrence_id.isnot(None))
+        .filter(Task.planned_for >= start, Task.planned_for <= end)
+        .all()
+    )
+    return [
+        {
+            "recurrence_id": item.recurrence_id,
+            "goal_id": item.goal_id,
+            "title": item.title,
+            "task_type": item.task_type,
+            "planned_for": day.isoformat(),
+            "is_done": False,
+        }
+        for day, items in sorted(recurrence.expand(current_user.id, start, end, saved).items())
+        for item in items
+        if goal_id is None or item.goal_id == goal_id
+    ]
+
+
+@api_bp.get("/goals")
+@api_login_required
+def list_goals():
+    fields = _parse_fields(GOAL_FIELDS)
+    limit = _parse_limit()
+
+    columns = {**{f: GOAL_FIELDS[f] for f in fields}, "id": Goal.id}
+    query = (
+        db.session.query(*[column.label(name) for name, column in columns.items()])
+        .filter(Goal.user_id == current_user.id)
+    )
+
+    cursor = request.args.get("cursor")
+    if cursor:
+        (last_id,) = decode_cursor(cursor, _cursor_id)
+        query = query.filter(Goal.id < last_id)
+
+    rows = query.order_by(Goal.id.desc()).limit(limit + 1).all()
+    return _page(rows, fields, limit, lambda row: (row.id,))
+
+
+@api_bp.get("/tasks")
+@api_login_required
+def list_tasks():
+    """Saved tasks in ``from..to``, keyset-paginated.
+
+    The first page (no ``cursor``) also lists ``occurrences``: recurring
+    tasks of the range that were never toggled and so have no id yet.
+    """
+    start = _parse_date_arg("from", date.today())
+    end = _parse_date_arg("to", start + timedelta(days=6))
+    if end < start:
+        raise ApiError("to must not be before from")
+    if (end - start).days >= MAX_TASK_RANGE_DAYS:
+        raise ApiError(f"from..to must span at most {MAX_TASK_RANGE_DAYS} days")
+
+    fields = _parse_fields(TASK_FIELDS)
+    limit = _parse_limit()
+
+    # id і planned_for потрібні для курсора, навіть якщо клієнт їх не просив
+    columns = {**{f: TASK_FIELDS[f] for f in fields}, "id": Task.id, "planned_for": Task.planned_for}
+    query = (
+        db.session.query(*[column.label(name) for name, column in columns.items()])
+        .filter(Task.user_id == current_user.id)
+        .filter(Task.planned_for >= start, Task.planned_for <= end)
+    )
+
+    goal_id = request.args.get("goal_id", type=int)
+    if goal_id is not None:
+        query = query.filter(Task.goal_id == goal_id)
+
+    cursor = request.args.get("cursor")
+    if cursor:
+        last_day, last_id = decode_cursor(cursor, date.fromisoformat, _cursor_id)
+        query = query.filter(
+            or_(
+                Task.planned_for > last_day,
+                and_(Task.planned_for == last_day, Task.id > last_id),
+            )
+        )
+
+    rows = query.order_by(Task.planned_for.asc(), Task.id.asc()).limit(limit + 1).all()
+    extra = {} if cursor else {"occurrences": _occurrences(start, end, goal_id)}
+    return _page(rows, fields, limit, lambda row: (row.planned_for, row.id), **extra)
+
+
+@api_bp.post("/recurring/<int:rule_id>/<day>/toggle")
+@api_login_required
+def toggle_occurrence(rule_id, day):
+    """Flip or set ``is_done`` of one occurrence, saving it as a task first if needed."""
+    rule = RecurringTask.query.filter_by(id=rule_id, user_id=current_user.id).first()
+    try:
+        day = date.fromisoformat(day)
+    except ValueError:
+        day = None
+    if rule is None or day is None or not recurrence.occurs_on(rule, day):
+        raise ApiError("occurrence not found", 404)
+
+    body = request.get_json(silent=True)
+    target = body.get("done") if isinstance(body, dict) else None
+    if target is not None and not isinstance(target, bool):
+        raise ApiError("done must be a boolean")
+
+    task = recurrence.materialize(rule, day)
+    task_status.set_done(task, (not task.is_done) if target is None else target)
+    return jsonify(id=task.id, is_done=task.is_done)
+
+
+@api_bp.get("/stats")
+@api_login_required
+def stats():
+    today = date.today()
+    totals = stats_summary.summary(current_user.id, today)
+
+    return jsonify(
+        today=today.isoformat(),
+        completed_today=totals["completed_today"],
+        completed_week=totals["completed_week"],
+        completed_month=totals["completed_month"],
+        streak=totals["streak"],
+        longest_streak=totals["longest_streak"],
+        daily_from=totals["start"].isoformat(),
+        daily=totals["daily"],
+        goals_30d=[
+            {"goal_id": goal_id, "count": count}
+            for goal_id, count in sorted(totals["goal_counts_30"].items(), key=lambda item: item[1], reverse=True)
+        ],
+    )
+
+
+@api_bp.get("/agenda")
+@api_login_required
+def agenda_view():
+    """Overdue open tasks and those due in the next ``days`` days."""
+    days = request.args.get("days", type=int)
+    if days is not None and not 0 <= days <= MAX_AGENDA_DAYS:
+        raise ApiError(f"days must be between 0 and {MAX_AGENDA_DAYS}")
+
+    today = date.today()
+    version = data_version.current(current_user.id)
+    etag = http_cache.planner_etag("agenda", current_user.id, version, today, days)
+    cached = http_cache.not_modified(etag)
+    if cached is not None:
+        return cached
+
+    # той самий день і та сама версія даних — той самий список
+    key = fragment_cache.make_key("agenda", current_user.id, today, days, version)
+    body = fragment_cache.fetch(key)
+    if body is None:
+        result = agenda.build(current_user.id, today, days=days)
+        body = json.dumps({
+            "today": today.isoformat(),
+            "days": result.days,
+            "overdue": [_agenda_item(item) for item in result.overdue],
+            "overdue_total": result.overdue_total,
+            "due_soon": [_agenda_item(item) for item in result.due_soon],
+            "due_soon_total": result.due_soon_total,
+        })
+        fragment_cache.store(key, body)
+
+    return http_cache.with_etag(current_app.response_class(body, mimetype="application/json"), etag)
+
+
+def _agenda_item(item):
+    return {**item._asdict(), "due_date": item.due_date.isoformat()}
+
+
+@api_bp.get("/search")
+@api_login_required
+def search_view():
+    """Ranked prefix search over the user's tasks and goals.
+
+    ``title`` and ``snippet`` are escaped HTML with matches wrapped in ``<mark>``.
+    """
+    query = request.args.get("q", "")
+    if not search.terms(query):
+        raise ApiError("q must contain at least one word")
+    try:
+        limit = int(request.args.get("limit", current_app.config.get("SEARCH_LIMIT", 20)))
+    except ValueError:
+        raise ApiError("limit must be an integer")
+    limit = max(1, min(limit, MAX_SEARCH_LIMIT))
+
+    version = data_version.current(current_user.id)
+    etag = http_cache.planner_etag("search", current_user.id, version, query, limit)
+    cached = http_cache.not_modified(etag)
+    if cached is not None:
+        return cached
+
+    hits = search.search(current_user.id, query, limit=limit)
+    return http_cache.with_etag(jsonify(data=[
+        {**hit._asdict(), "title": str(hit.title), "snippet": str(hit.snippet)}
+        for hit in hits
+    ]), etag)
+
+
+@api_bp.post("/tasks/bulk")
+@api_login_required
+def bulk_create_tasks():
+    """Create many tasks in one transaction; the response has one result per input item."""
+    items = _json_list("tasks")
+
+    goal_ids = {item.get("goal_id") for item in items if isinstance(item, dict) and _is_id(item.get("goal_id"))}
+    owned = {
+        goal_id
+        for (goal_id,) in db.session.query(Goal.id)
+        .filter(Goal.user_id == current_user.id, Goal.id.in_(goal_ids))
+    }
+
+    results = [None] * len(items)
+    rows, positions = [], []
+    now = datetime.utcnow()
+
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            results[index] = {"index": index, "status": "error", "error": "item must be an object"}
+            continue
+        title = item.get("title")
+        title = title.strip() if isinstance(title, str) else ""
+        if not title:
+            results[index] = {"index": index, "status": "error", "error": "title is required"}
+            continue
+        if len(title) > MAX_TITLE_LENGTH:
+            results[index] = {"index": index, "status": "error", "error": "title too long"}
+            continue
+        task_type = item.get("task_type") or None
+        # той самий перелік, що й у формі; список чи об'єкт інакше зірвав би весь INSERT
+        if task_type is not None and (not isinstance(task_type, str) or task_type not in TASK_TYPE_KEYS):
+            results[index] = {"index": index, "status": "error", "error": "unknown task_type"}
+            continue
+        if not _is_id(item.get("goal_id")) or item["goal_id"] not in owned:
+            results[index] = {"index": index, "status": "error", "error": "goal not found"}
+            continue
+        try:
+            planned_for = _optional_date(item, "planned_for")
+            due_date = _optional_date(item, "due_date")
+        except (TypeError, ValueError):
+            results[index] = {"index": index, "status": "error", "error": "dates must be YYYY-MM-DD"}
+            continue
+
+        rows.append(dict(
+            title=title,
+            goal_id=item["goal_id"],
+            user_id=current_user.id,
+            planned_for=planned_for,
+            task_type=task_type,
+            due_date=due_date,
+            is_done=False,
+            created_at=now,
+        ))
+        positions.append(index)
+
+    if rows:
+        # один executemany з RETURNING замість N окремих INSERT
+        new_ids = db.session.scalars(
+            insert(Task).returning(Task.id, sort_by_parameter_order=True),
+            rows,
+        ).all()
+        for index, task_id in zip(positions, new_ids):
+            results[index] = {"index": index, "status": "created", "id": task_id}
+        for goal_id, created in Counter(row["goal_id"] for row in rows).items():
+            goal_counters.record(goal_id, total=created)
+
+        data_version.bump(current_user.id)
+        db.session.commit()
+
+    return jsonify(results=results)
+
+
+@api_bp.post("/tasks/bulk-toggle")
+@api_login_required
+def bulk_toggle_tasks():
+    """Flip ``is_done`` for many tasks, or set it when ``done`` is given."""
+    ids = _json_list("ids")
+    body = request.get_json(silent=True)
+    target = body.get("done")
+    if target is not None and not isinstance(target, bool):
+        raise ApiError("done must be a boolean")
+
+    wanted = [task_id for task_id in ids if _is_id(task_id)]
+    tasks = {
+        row.id: row
+        for row in db.session.query(
+            Task.id, Task.goal_id, Task.is_done, Task.completed_at, Task.planned_for, Task.created_at
+        ).filter(Task.user_id == current_user.id, Task.id.in_(wanted))
+    }
+
+    now = datetime.utcnow()
+    updates = []
+    deltas = defaultdict(int)
+    results = []
+    seen = {}
+
+    for task_id in ids:
+        if not _is_id(task_id):
+            results.append({"id": task_id, "status": "not_found"})
+            continue
+        # повторний id у тому самому запиті не перемикається вдруге
+        if task_id in seen:
+            results.append(seen[task_id])
+            continue
+
+        row = tasks.get(task_id)
+        if row is None:
+            seen[task_id] = {"id": task_id, "status": "not_found"}
+            results.append(seen[task_id])
+            continue
+
+        is_done = (not row.is_done) if target is None else target
+        if is_done != row.is_done:
+            if is_done:
+                updates.append({"id": row.id, "is_done": True, "completed_at": now})
+                deltas[(row.goal_id, now.date())] += 1
+            else:
+                updates.append({"id": row.id, "is_done": False, "completed_at": None})
+                deltas[(row.goal_id, rollup.completion_day(row))] -= 1
+
+        seen[task_id] = {"id": task_id, "status": "ok", "is_done": is_done}
+        results.append(seen[task_id])
+
+    if updates:
+        db.session.execute(update(Task), updates)
+        for (goal_id, day), delta in deltas.items():
+            rollup.record(current_user.id, goal_id, day, delta)
+        streaks.touch(current_user.id, [day for _, day in deltas])
+        goal_deltas = defaultdict(int)
+        for (goal_id, _day), delta in deltas.items():
+            goal_deltas[goal_id] += delta
+        for goal_id, delta in goal_deltas.items():
+            goal_counters.record(goal_id, done=delta)
+
+        data_version.bump(current_user.id)
+        db.session.commit()
+
+    return jsonify(results=results)
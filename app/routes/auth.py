@@ -4,13 +4,14 @@ from flask_babel import _
 from sqlalchemy.exc import OperationalError
 from app.extensions import db, bcrypt, login_manager
 from app.models.user import User
+from app.services import user_cache
 
 auth_bp = Blueprint("auth", __name__)
 
 @login_manager.user_loader
 def load_user(user_id):
     try:
-        return User.query.get(int(user_id))
+        return user_cache.load(int(user_id))
     except OperationalError:
         return None
 
@@ -8,15 +8,12 @@ from flask_babel import _
 
 from app.extensions import db
 from app.models.payment import Payment
-from app.models.user import User
-from app.services.fondy import create_checkout_url, verify_signature
+from app.services import callback_inbox, entitlements, user_cache
+from app.services.callback_inbox import APPROVED_STATUSES
 
 
 billing_bp = Blueprint("billing", __name__)
 
-APPROVED_STATUSES = {"approved", "success", "successful", "paid"}
-FAILED_STATUSES = {"declined", "expired", "reversed", "failure", "failed", "rejected"}
-
 
 def _is_fake_enabled() -> bool:
     provider = (current_app.config.get("BILLING_PROVIDER") or "").lower()
@@ -52,7 +49,8 @@ def create_fondy_payment():
 
     merchant_id = str(merchant_id).strip()
 
-    if current_user.is_pro and current_user.pro_until and current_user.pro_until > datetime.utcnow():
+    # свіже читання: воркер колбеків міг щойно увімкнути Pro в іншому процесі
+    if entitlements.for_user(current_user.id, fresh=True).is_pro:
         flash(_("You already have an active Pro subscription"), "info")
         return redirect(url_for("billing.billing_overview"))
 
@@ -88,6 +86,9 @@ def create_fondy_payment():
         "server_callback_url": callback_url,
     }
 
+    # fondy (HTTP-пул, потоки) імпортується лише тут і в колбеку, не при старті застосунку
+    from app.services.fondy import create_checkout_url
+
     try:
         checkout_url = create_checkout_url(payload)
     except Exception as exc:
@@ -101,6 +102,8 @@ def create_fondy_payment():
 
 @billing_bp.post("/billing/fondy/callback")
 def fondy_callback():
+    from app.services.fondy import verify_signature
+
     payload = _extract_fondy_payload()
     secret_key = current_app.config.get("FONDY_SECRET_KEY")
     if not secret_key:
@@ -109,38 +112,11 @@ def fondy_callback():
     if not verify_signature(payload, secret_key):
         return "invalid signature", 400
 
-    order_id = payload.get("order_id")
-    if not order_id:
+    if not payload.get("order_id"):
         return "missing order_id", 400
 
-    payment = Payment.query.filter_by(order_id=order_id).first()
-    if not payment:
-        return "payment not found", 404
-
-    status = (payload.get("order_status") or "").lower()
-    if payment.status == "paid":
-        return "ok", 200
-
-    if status in APPROVED_STATUSES:
-        payment.status = "paid"
-        try:
-            payment.amount = int(payload.get("amount", payment.amount) or payment.amount)
-        except (TypeError, ValueError):
-            pass
-        payment.currency = payload.get("currency", payment.currency)
-
-        user = db.session.get(User, payment.user_id)
-        if user:
-            user.is_pro = True
-            duration_days = current_app.config.get("PRO_DURATION_DAYS")
-            user.pro_until = datetime.utcnow() + timedelta(days=duration_days)
-        db.session.commit()
-        return "ok", 200
-
-    if status in FAILED_STATUSES or status:
-        payment.status = "failed"
-        db.session.commit()
-
+    # лише записуємо в inbox; статуси застосовує `flask billing process-callbacks`
+    callback_inbox.record(payload)
     return "ok", 200
 
 
@@ -196,9 +172,12 @@ def fake_activate():
     )
     db.session.add(payment)
 
+    user_id = current_user.id
     current_user.is_pro = True
     current_user.pro_until = datetime.utcnow() + timedelta(days=duration_days)
     db.session.commit()
+    user_cache.invalidate(user_id)
+    entitlements.invalidate(user_id)
 
     flash(_("Payment successful, Pro activated"), "success")
     return redirect(url_for("billing.billing_overview"))
@@ -218,6 +197,7 @@ def billing_overview():
         duration_days=duration_days,
         provider=provider,
         fake_enabled=_is_fake_enabled(),
+        entitlement=entitlements.for_user(current_user.id),
     )
 
 
@@ -1,16 +1,18 @@
 from datetime import date
-from calendar import monthrange
 from collections import defaultdict
 
 from flask import Blueprint, render_template, request
 from flask_login import login_required, current_user
+from flask_babel import get_locale
 
-from app.models.goal import Goal
 from app.models.task import Task
+from app.services.db_routing import replica_reads
+from app.services import calendar_layout, data_version, fragment_cache, http_cache, recurrence
 
 calendar_bp = Blueprint("calendar", __name__)
 
 @calendar_bp.get("/calendar")
+@replica_reads
 @login_required
 def month_view():
     # ?ym=2026-01 (за замовчуванням поточний місяць)
@@ -22,58 +24,54 @@ def month_view():
         today = date.today()
         year, month = today.year, today.month
 
-    first_day = date(year, month, 1)
-    last_day = date(year, month, monthrange(year, month)[1])
+    layout = calendar_layout.month(year, month)
+    first_day, last_day = layout.first_day, layout.last_day
 
-    goals = Goal.query.filter_by(user_id=current_user.id).all()
-    goal_ids = [g.id for g in goals]
+    today = date.today()
+    version = data_version.current(current_user.id)
+    etag = http_cache.planner_etag("calendar", current_user.id, version, first_day, today)
+    cached = http_cache.not_modified(etag)
+    if cached is not None:
+        return cached
 
-    tasks = []
-    tasks_by_day = defaultdict(list)
+    cache_key = fragment_cache.make_key("calendar", current_user.id, first_day, today, get_locale(), version)
+    grid = fragment_cache.fetch(cache_key)
+    if grid is None:
+        grid = _render_month_grid(layout.cells, first_day, last_day, today)
+        fragment_cache.store(cache_key, grid)
 
-    if goal_ids:
-        tasks = (
-            Task.query
-            .filter(Task.goal_id.in_(goal_ids))
-            .filter(Task.planned_for >= first_day, Task.planned_for <= last_day)
-            .order_by(Task.planned_for.asc(), Task.id.desc())
-            .all()
-        )
-        for t in tasks:
-            if t.planned_for:
-                tasks_by_day[t.planned_for].append(t)
+    page = render_template(
+        "calendar.html",
+        year=year,
+        month=month,
+        first_day=first_day,
+        grid=grid,
+        prev_ym=layout.prev_ym,
+        next_ym=layout.next_ym,
+    )
+    return http_cache.with_etag(page, etag)
 
-    # календарна сітка (понеділок-початок)
-    start_weekday = first_day.weekday()  # Mon=0
-    days_in_month = last_day.day
 
-    cells = []
-    for _ in range(start_weekday):
-        cells.append(None)
-    for d in range(1, days_in_month + 1):
-        cells.append(date(year, month, d))
-    while len(cells) % 7 != 0:
-        cells.append(None)
+def _render_month_grid(cells, first_day, last_day, today):
+    tasks_by_day = defaultdict(list)
 
-    # prev/next
-    prev_year, prev_month = year, month - 1
-    if prev_month == 0:
-        prev_month = 12
-        prev_year -= 1
+    tasks = (
+        Task.query
+        .filter(Task.user_id == current_user.id)
+        .filter(Task.planned_for >= first_day, Task.planned_for <= last_day)
+        .order_by(Task.planned_for.asc(), Task.id.desc())
+        .all()
+    )
+    for t in tasks:
+        if t.planned_for:
+            tasks_by_day[t.planned_for].append(t)
 
-    next_year, next_month = year, month + 1
-    if next_month == 13:
-        next_month = 1
-        next_year += 1
+    for day, items in recurrence.expand(current_user.id, first_day, last_day, tasks).items():
+        tasks_by_day[day].extend(items)
 
     return render_template(
-        "calendar.html",
-        year=year,
-        month=month,
-        first_day=first_day,
+        "_calendar_grid.html",
         cells=cells,
         tasks_by_day=tasks_by_day,
-        prev_ym=f"{prev_year:04d}-{prev_month:02d}",
-        next_ym=f"{next_year:04d}-{next_month:02d}",
-        today=date.today(),
+        today=today,
     )
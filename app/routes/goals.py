@@ -1,24 +1,37 @@
+from datetime import date, datetime
+
 from flask import Blueprint, render_template, request, redirect, url_for, flash
 from flask_login import login_required, current_user
 from flask_babel import _
+from sqlalchemy import and_, or_
 
 from app.extensions import db
 from app.models.goal import Goal
+from app.models.recurring_task import RecurringTask
 from app.models.task import Task
+from app.services.db_routing import replica_reads
+from app.services import data_version, goal_counters, goal_trash, recurrence, search
 
 goals_bp = Blueprint("goals", __name__)
 
+# задач на сторінку в кожному зі списків goal_detail
+TASKS_PAGE_SIZE = 50
+
 @goals_bp.get("/goals")
+@replica_reads
 @login_required
 def list_goals():
-    goals = (
-        Goal.query
-        .filter_by(user_id=current_user.id)
-        .order_by(Goal.id.desc())
-        .all()
-    )
+    goals = goal_counters.with_progress(current_user.id, date.today())
     return render_template("goals.html", goals=goals)
 
+@goals_bp.get("/goals/search")
+@replica_reads
+@login_required
+def search_goals():
+    query = request.args.get("q", "").strip()
+    hits = search.search(current_user.id, query) if query else []
+    return render_template("goal_search.html", query=query, hits=hits)
+
 @goals_bp.route("/goals/create", methods=["GET", "POST"])
 @login_required
 def create_goal():
@@ -32,6 +45,8 @@ def create_goal():
 
         goal = Goal(title=title, description=description, user_id=current_user.id)
         db.session.add(goal)
+        # ціль з'являється у формі тижня, тож це теж зміна планера
+        data_version.bump(current_user.id)
         db.session.commit()
 
         flash(_("Goal created ✅"), "success")
@@ -40,11 +55,134 @@ def create_goal():
     return render_template("goal_create.html")
 
 @goals_bp.get("/goals/<int:goal_id>")
+@replica_reads
 @login_required
 def goal_detail(goal_id):
     goal = Goal.query.filter_by(id=goal_id, user_id=current_user.id).first_or_404()
-    tasks = Task.query.filter_by(goal_id=goal.id).order_by(Task.id.desc()).all()
-    return render_template("goal_detail.html", goal=goal, tasks=tasks)
+
+    # відкриті — новіші першими; курсор ?open_before=<id>
+    open_query = Task.query.filter(Task.goal_id == goal.id, Task.is_done.is_(False))
+    open_before = request.args.get("open_before", type=int)
+    if open_before:
+        open_query = open_query.filter(Task.id < open_before)
+    open_tasks = open_query.order_by(Task.id.desc()).limit(TASKS_PAGE_SIZE + 1).all()
+
+    # виконані — за часом виконання; курсор ?done_at=<iso>&done_id=<id>
+    # (старі задачі без completed_at ідуть у кінці, курсор для них — лише done_id)
+    done_query = Task.query.filter(Task.goal_id == goal.id, Task.is_done.is_(True))
+    done_at = _parse_datetime(request.args.get("done_at", ""))
+    done_id = request.args.get("done_id", type=int)
+    if done_id and done_at:
+        done_query = done_query.filter(or_(
+            Task.completed_at < done_at,
+            and_(Task.completed_at == done_at, Task.id < done_id),
+            Task.completed_at.is_(None),
+        ))
+    elif done_id:
+        done_query = done_query.filter(Task.completed_at.is_(None), Task.id < done_id)
+    done_tasks = (
+        done_query
+        .order_by(Task.completed_at.desc().nulls_last(), Task.id.desc())
+        .limit(TASKS_PAGE_SIZE + 1)
+        .all()
+    )
+
+    open_next = open_tasks[TASKS_PAGE_SIZE - 1].id if len(open_tasks) > TASKS_PAGE_SIZE else None
+    done_next = None
+    if len(done_tasks) > TASKS_PAGE_SIZE:
+        last = done_tasks[TASKS_PAGE_SIZE - 1]
+        done_next = {"done_id": last.id}
+        if last.completed_at:
+            done_next["done_at"] = last.completed_at.isoformat()
+
+    rules = RecurringTask.query.filter_by(goal_id=goal.id).order_by(RecurringTask.id.asc()).all()
+    return render_template(
+        "goal_detail.html",
+        goal=goal,
+        open_tasks=open_tasks[:TASKS_PAGE_SIZE],
+        done_tasks=done_tasks[:TASKS_PAGE_SIZE],
+        open_next=open_next,
+        done_next=done_next,
+        # сторінка відкрита з курсора — є куди повернутись
+        paged=bool(open_before or done_id),
+        rules=rules,
+    )
+
+
+def _parse_date(value: str):
+    """Parse YYYY-MM-DD -> date або None."""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+def _parse_datetime(value: str):
+    """Parse ISO datetime -> datetime або None."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+@goals_bp.post("/goals/<int:goal_id>/recurring")
+@login_required
+def create_recurring(goal_id):
+    goal = Goal.query.filter_by(id=goal_id, user_id=current_user.id).first_or_404()
+
+    title = request.form.get("title", "").strip()
+    rule = request.form.get("rule", "daily").strip()
+    starts_on = _parse_date(request.form.get("starts_on", "").strip()) or date.today()
+    ends_on = _parse_date(request.form.get("ends_on", "").strip())
+    try:
+        interval_days = int(request.form.get("interval_days") or 0) or None
+    except ValueError:
+        interval_days = None
+
+    if not title:
+        flash(_("Title") + " ❌", "danger")
+        return redirect(url_for("goals.goal_detail", goal_id=goal.id))
+    if (
+        rule not in recurrence.RULES
+        or (rule == "interval" and (interval_days is None or interval_days < 1))
+        or (ends_on and ends_on < starts_on)
+    ):
+        flash(_("Repeat rule") + " ❌", "danger")
+        return redirect(url_for("goals.goal_detail", goal_id=goal.id))
+
+    db.session.add(RecurringTask(
+        user_id=current_user.id,
+        goal_id=goal.id,
+        title=title,
+        task_type=request.form.get("task_type", "").strip() or None,
+        rule=rule,
+        interval_days=interval_days if rule == "interval" else None,
+        starts_on=starts_on,
+        ends_on=ends_on,
+    ))
+    data_version.bump(current_user.id)
+    db.session.commit()
+
+    flash(_("Task added ✅"), "success")
+    return redirect(url_for("goals.goal_detail", goal_id=goal.id))
+
+
+@goals_bp.post("/goals/<int:goal_id>/recurring/<int:rule_id>/delete")
+@login_required
+def delete_recurring(goal_id, rule_id):
+    rule = RecurringTask.query.filter_by(id=rule_id, goal_id=goal_id, user_id=current_user.id).first_or_404()
+
+    # збережені входження лишаються звичайними задачами
+    Task.query.filter_by(recurrence_id=rule.id).update({"recurrence_id": None}, synchronize_session=False)
+    db.session.delete(rule)
+    data_version.bump(current_user.id)
+    db.session.commit()
+
+    return redirect(url_for("goals.goal_detail", goal_id=goal_id))
 
 
 @goals_bp.post("/goals/<int:goal_id>/delete")
@@ -52,10 +190,8 @@ def goal_detail(goal_id):
 def delete_goal(goal_id):
     goal = Goal.query.filter_by(id=goal_id, user_id=current_user.id).first_or_404()
 
-    # ✅ видаляємо всі tasks цієї цілі (щоб не було foreign key проблем)
-    Task.query.filter_by(goal_id=goal.id).delete()
-
-    db.session.delete(goal)
+    # ✅ лише позначка: задачі великої цілі видаляються частинами у фоні
+    goal_trash.soft_delete(goal, current_user.id)
     db.session.commit()
 
     flash(_("Goal deleted ✅"), "success")
@@ -0,0 +1,45 @@
+import hmac
+
+from flask import Blueprint, Response, abort, current_app, jsonify, request
+
+from app.extensions import db
+from app.services import callback_inbox, db_tuning, instrumentation, user_cache
+
+ops_bp = Blueprint("ops", __name__, url_prefix="/ops")
+
+
+@ops_bp.before_request
+def _require_token():
+    # без OPS_TOKEN службові ендпоінти вимкнені
+    token = current_app.config.get("OPS_TOKEN")
+    if not token:
+        abort(404)
+    if not hmac.compare_digest(request.headers.get("X-Ops-Token", ""), token):
+        abort(403)
+
+
+@ops_bp.get("/user-cache")
+def user_cache_stats():
+    return jsonify(user_cache.get_cache().stats())
+
+
+@ops_bp.get("/callback-inbox")
+def callback_inbox_stats():
+    return jsonify(callback_inbox.metrics())
+
+
+@ops_bp.get("/db")
+def db_settings():
+    report = dict(current_app.extensions.get("db_tuning", {}))
+    if db.engine.dialect.name == "sqlite":
+        with db.engine.connect() as connection:
+            report["effective"] = db_tuning.effective_pragmas(connection)
+    return jsonify(report)
+
+
+@ops_bp.get("/metrics")
+def metrics():
+    registry = instrumentation.get_metrics()
+    if registry is None:
+        abort(404)
+    return Response(registry.render(), mimetype="text/plain; version=0.0.4")
@@ -1,12 +1,18 @@
 from datetime import date, timedelta, datetime
 
-from flask import Blueprint, render_template, request, redirect, url_for, flash
+from flask import Blueprint, abort, render_template, request, redirect, url_for, flash
 from flask_login import login_required, current_user
-from flask_babel import _
+from flask_babel import _, get_locale
 
 from app.extensions import db
 from app.models.goal import Goal
+from app.models.recurring_task import RecurringTask
 from app.models.task import Task
+from app.models.user import User
+from app.services.db_routing import replica_reads
+from app.services import (
+    agenda, data_version, fragment_cache, goal_counters, http_cache, recurrence, task_status, user_cache,
+)
 
 tasks_bp = Blueprint("tasks", __name__)
 
@@ -27,6 +33,7 @@ def _parse_date(value: str):
 
 
 @tasks_bp.get("/week")
+@replica_reads
 @login_required
 def week_view():
     # старт тижня (понеділок)
@@ -34,24 +41,40 @@ def week_view():
     start = today - timedelta(days=today.weekday())
     end = start + timedelta(days=6)
 
+    version = data_version.current(current_user.id)
+    etag = http_cache.planner_etag("week", current_user.id, version, today)
+    cached = http_cache.not_modified(etag)
+    if cached is not None:
+        return cached
+
+    cache_key = fragment_cache.make_key("week", current_user.id, start, end, today, get_locale(), version)
+    grid = fragment_cache.fetch(cache_key)
+    if grid is None:
+        grid = _render_week_grid(today, start, end)
+        fragment_cache.store(cache_key, grid)
+
+    return http_cache.with_etag(render_template("week.html", grid=grid), etag)
+
+
+def _render_week_grid(today, start, end):
     goals = Goal.query.filter_by(user_id=current_user.id).order_by(Goal.id.desc()).all()
-    goal_ids = [g.id for g in goals]
 
-    tasks = []
     tasks_by_day = {start + timedelta(days=i): [] for i in range(7)}
 
-    if goal_ids:
-        tasks = (
-            Task.query
-            .filter(Task.goal_id.in_(goal_ids))
-            .filter(Task.planned_for >= start, Task.planned_for <= end)
-            .order_by(Task.planned_for.asc(), Task.id.desc())
-            .all()
-        )
+    tasks = (
+        Task.query
+        .filter(Task.user_id == current_user.id)
+        .filter(Task.planned_for >= start, Task.planned_for <= end)
+        .order_by(Task.planned_for.asc(), Task.id.desc())
+        .all()
+    )
+
+    for t in tasks:
+        if t.planned_for in tasks_by_day:
+            tasks_by_day[t.planned_for].append(t)
 
-        for t in tasks:
-            if t.planned_for in tasks_by_day:
-                tasks_by_day[t.planned_for].append(t)
+    for day, items in recurrence.expand(current_user.id, start, end, tasks).items():
+        tasks_by_day[day].extend(items)
 
     weekday_names = {
         0: _("Mon"),
@@ -66,13 +89,17 @@ def week_view():
     days = [start + timedelta(days=i) for i in range(7)]
 
     return render_template(
-        "week.html",
+        "_week_grid.html",
         days=days,
         today=today,
         goals=goals,
         tasks_by_day=tasks_by_day,
         weekday_names=weekday_names,
         task_types=TASK_TYPES,
+        # фрагмент кешується на (день, версія даних), тож і agenda рахується раз на них
+        agenda=agenda.build(current_user.id, today),
+        # не з current_user: той може бути знімком із кешу користувачів
+        rollover_tasks=db.session.query(User.rollover_tasks).filter(User.id == current_user.id).scalar(),
     )
 
 
@@ -98,6 +125,7 @@ def create_task():
     task = Task(
         title=title,
         goal_id=goal.id,
+        user_id=goal.user_id,
         planned_for=planned_for,
         task_type=task_type,
         due_date=due_date,
@@ -105,6 +133,8 @@ def create_task():
     )
 
     db.session.add(task)
+    goal_counters.record(goal.id, total=1)
+    data_version.bump(current_user.id)
     db.session.commit()
 
     flash(_("Task added ✅"), "success")
@@ -114,16 +144,37 @@ def create_task():
 @tasks_bp.post("/tasks/<int:task_id>/toggle")
 @login_required
 def toggle_task(task_id):
-    task = (
-        Task.query
-        .join(Goal)
-        .filter(Task.id == task_id, Goal.user_id == current_user.id)
-        .first_or_404()
-    )
+    task = Task.query.filter_by(id=task_id, user_id=current_user.id).first_or_404()
+    task_status.set_done(task, not task.is_done)
+    return redirect(request.referrer or url_for("tasks.week_view"))
 
-    task.is_done = not task.is_done
-    task.completed_at = datetime.utcnow() if task.is_done else None
 
-    db.session.commit()
+@tasks_bp.post("/recurring/<int:rule_id>/<day>/toggle")
+@login_required
+def toggle_occurrence(rule_id, day):
+    rule = RecurringTask.query.filter_by(id=rule_id, user_id=current_user.id).first_or_404()
+    day = _parse_date(day)
+    if not day or not recurrence.occurs_on(rule, day):
+        abort(404)
+
+    # входження зберігається в task лише зараз, при першій зміні
+    task = recurrence.materialize(rule, day)
+    task_status.set_done(task, not task.is_done)
+    return redirect(request.referrer or url_for("tasks.week_view"))
 
+
+@tasks_bp.post("/settings/rollover")
+@login_required
+def toggle_rollover():
+    # форма надсилає бажаний стан: інвертувати закешований знімок current_user не можна
+    enabled = request.form.get("enabled")
+    if enabled not in ("0", "1"):
+        abort(400)
+    User.query.filter_by(id=current_user.id).update(
+        {User.rollover_tasks: enabled == "1"}, synchronize_session=False
+    )
+    # перемикач живе у закешованій сітці тижня
+    data_version.bump(current_user.id)
+    db.session.commit()
+    user_cache.invalidate(current_user.id)
     return redirect(request.referrer or url_for("tasks.week_view"))
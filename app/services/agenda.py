@@ -0,0 +1,74 @@
+from datetime import date, timedelta
+from typing import List, NamedTuple, Optional
+
+from flask import current_app
+from sqlalchemy import false, func
+
+from app.extensions import db
+from app.models.goal import Goal
+from app.models.task import Task
+
+
+class AgendaItem(NamedTuple):
+    id: int
+    title: str
+    due_date: date
+    goal_id: int
+    goal_title: str
+
+
+class Agenda(NamedTuple):
+    today: date
+    days: int
+    overdue: List[AgendaItem]
+    overdue_total: int
+    due_soon: List[AgendaItem]
+    due_soon_total: int
+
+
+def open_with_due(user_id: int):
+    """Filters served by the partial index ``ix_task_open_user_id_due_date``.
+
+    SQLite uses a partial index only when the query repeats its WHERE terms,
+    so ``is_done = 0`` must stay an equality (``IS 0`` would not match).
+    """
+    return (Task.user_id == user_id, Task.is_done == false(), Task.due_date.isnot(None))
+
+
+def _items(user_id: int, *conditions, limit: int) -> List[AgendaItem]:
+    rows = (
+        db.session.query(Task.id, Task.title, Task.due_date, Task.goal_id, Goal.title)
+        .join(Goal, Goal.id == Task.goal_id)
+        .filter(*open_with_due(user_id), *conditions)
+        .order_by(Task.due_date.asc(), Task.id.asc())
+        .limit(limit)
+        .all()
+    )
+    return [AgendaItem(*row) for row in rows]
+
+
+def _count(user_id: int, *conditions) -> int:
+    return (
+        db.session.query(func.count(Task.id))
+        .filter(*open_with_due(user_id), *conditions)
+        .scalar()
+    )
+
+
+def build(user_id: int, today: date, days: Optional[int] = None, limit: Optional[int] = None) -> Agenda:
+    """Open tasks past their due date, and those due within ``days`` days from today."""
+    days = current_app.config.get("AGENDA_DAYS", 7) if days is None else days
+    limit = current_app.config.get("AGENDA_LIMIT", 20) if limit is None else limit
+    horizon = today + timedelta(days=days)
+
+    # кожен запит — діапазон по частковому індексу, без обходу всіх відкритих задач
+    overdue = (Task.due_date < today,)
+    due_soon = (Task.due_date >= today, Task.due_date <= horizon)
+    return Agenda(
+        today=today,
+        days=days,
+        overdue=_items(user_id, *overdue, limit=limit),
+        overdue_total=_count(user_id, *overdue),
+        due_soon=_items(user_id, *due_soon, limit=limit),
+        due_soon_total=_count(user_id, *due_soon),
+    )
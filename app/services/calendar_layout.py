@@ -0,0 +1,58 @@
+from calendar import monthrange
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+
+
+class MonthLayout(NamedTuple):
+    first_day: date
+    last_day: date
+    # тижні з понеділка; None — клітинка поза місяцем
+    cells: Tuple[Optional[date], ...]
+    prev_ym: str
+    next_ym: str
+
+
+class HeatmapLayout(NamedTuple):
+    start: date
+    span: int
+    # тижні-стовпці з індексами в масиві днів; None — порожня клітинка
+    weeks: Tuple[Tuple[Optional[int], ...], ...]
+    labels: Tuple[str, ...]
+
+
+@lru_cache(maxsize=256)
+def month(year: int, month: int) -> MonthLayout:
+    """Monday-first grid of one month plus the ``?ym=`` values of its neighbours."""
+    first_day = date(year, month, 1)
+    days_in_month = monthrange(year, month)[1]
+
+    cells = [None] * first_day.weekday()
+    cells.extend(date(year, month, d) for d in range(1, days_in_month + 1))
+    cells.extend([None] * (-len(cells) % 7))
+
+    prev_year, prev_month = (year - 1, 12) if month == 1 else (year, month - 1)
+    next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+    return MonthLayout(
+        first_day=first_day,
+        last_day=date(year, month, days_in_month),
+        cells=tuple(cells),
+        prev_ym=f"{prev_year:04d}-{prev_month:02d}",
+        next_ym=f"{next_year:04d}-{next_month:02d}",
+    )
+
+
+@lru_cache(maxsize=64)
+def heatmap(start: date, span: int) -> HeatmapLayout:
+    """Week columns for ``span`` days from ``start``; cells index a ``span``-long array."""
+    lead = start.weekday()
+    slots = [None] * lead + list(range(span))
+    slots.extend([None] * (-len(slots) % 7))
+
+    return HeatmapLayout(
+        start=start,
+        span=span,
+        weeks=tuple(tuple(slots[i:i + 7]) for i in range(0, len(slots), 7)),
+        labels=tuple((start + timedelta(days=i)).isoformat() for i in range(span)),
+    )
@@ -0,0 +1,136 @@
+import json
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from flask import current_app
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+
+from app.extensions import db
+from app.models.payment import Payment
+from app.models.payment_callback import PaymentCallback
+from app.models.user import User
+
+APPROVED_STATUSES = {"approved", "success", "successful", "paid"}
+FAILED_STATUSES = {"declined", "expired", "reversed", "failure", "failed", "rejected"}
+
+
+def _insert_stmt():
+    dialect = db.session.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        return None
+    return insert(PaymentCallback)
+
+
+def record(payload: Dict[str, Any]) -> None:
+    """Store a verified callback; a repeated (order_id, status) is a no-op."""
+    values = dict(
+        order_id=str(payload["order_id"])[:64],
+        order_status=(payload.get("order_status") or "").lower()[:32],
+        payload=json.dumps(payload, sort_keys=True),
+        received_at=datetime.utcnow(),
+    )
+
+    stmt = _insert_stmt()
+    if stmt is not None:
+        db.session.execute(stmt.values(**values).on_conflict_do_nothing(
+            index_elements=["order_id", "order_status"],
+        ))
+        db.session.commit()
+        return
+
+    db.session.add(PaymentCallback(**values))
+    try:
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+
+
+def _apply(payment: Payment, callbacks, now: datetime) -> None:
+    """Fold all pending callbacks of one order into its payment."""
+    if payment.status == "paid":
+        return
+
+    approved = [c for c in callbacks if c.order_status in APPROVED_STATUSES]
+    if approved:
+        data = json.loads(approved[0].payload)
+        payment.status = "paid"
+        try:
+            payment.amount = int(data.get("amount", payment.amount) or payment.amount)
+        except (TypeError, ValueError):
+            pass
+        payment.currency = data.get("currency", payment.currency)
+
+        user = db.session.get(User, payment.user_id)
+        if user:
+            user.is_pro = True
+            user.pro_until = now + timedelta(days=current_app.config.get("PRO_DURATION_DAYS"))
+        return
+
+    if any(c.order_status in FAILED_STATUSES or c.order_status for c in callbacks):
+        payment.status = "failed"
+
+
+def process_batch(limit: int = 100) -> int:
+    """Apply up to ``limit`` pending callbacks in one transaction. Returns how many were handled."""
+    now = datetime.utcnow()
+    pending = (
+        PaymentCallback.query
+        .filter(PaymentCallback.processed_at.is_(None))
+        .order_by(PaymentCallback.id.asc())
+        .limit(limit)
+        # PostgreSQL: кілька воркерів не беруть ті самі рядки; SQLite ігнорує
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    if not pending:
+        return 0
+
+    by_order: Dict[str, list] = {}
+    for callback in pending:
+        by_order.setdefault(callback.order_id, []).append(callback)
+
+    payments = {
+        p.order_id: p
+        for p in Payment.query.filter(Payment.order_id.in_(list(by_order)))
+    }
+
+    for order_id, callbacks in by_order.items():
+        payment = payments.get(order_id)
+        if payment is None:
+            for callback in callbacks:
+                callback.error = "payment not found"
+        else:
+            _apply(payment, callbacks, now)
+        for callback in callbacks:
+            callback.processed_at = now
+
+    # воркер — окремий процес: кеші веб-воркерів звідси не скинути,
+    # новий план вони побачать, коли мине USER_CACHE_TTL
+    db.session.commit()
+    return len(pending)
+
+
+def metrics(now: Optional[datetime] = None) -> Dict[str, Any]:
+    now = now or datetime.utcnow()
+    depth, oldest = (
+        db.session.query(func.count(PaymentCallback.id), func.min(PaymentCallback.received_at))
+        .filter(PaymentCallback.processed_at.is_(None))
+        .one()
+    )
+    errors = (
+        db.session.query(func.count(PaymentCallback.id))
+        .filter(PaymentCallback.error.isnot(None))
+        .scalar()
+    )
+    last_processed = db.session.query(func.max(PaymentCallback.processed_at)).scalar()
+    return {
+        "depth": depth,
+        "lag_seconds": round((now - oldest).total_seconds(), 3) if oldest else 0.0,
+        "errors": errors,
+        "last_processed_at": last_processed.isoformat() if last_processed else None,
+    }
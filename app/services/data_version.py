@@ -0,0 +1,16 @@
+from app.extensions import db
+from app.models.user import User
+
+
+def current(user_id: int) -> int:
+    """Read the version straight from the database; the cached user may lag behind."""
+    return db.session.query(User.data_version).filter(User.id == user_id).scalar() or 0
+
+
+def bump(user_id: int) -> None:
+    """Mark the user's planner data as changed, inside the caller's transaction."""
+    (
+        User.query
+        .filter(User.id == user_id)
+        .update({User.data_version: User.data_version + 1}, synchronize_session=False)
+    )
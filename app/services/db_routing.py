@@ -0,0 +1,99 @@
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+from flask import current_app, g, has_request_context, session
+from flask_sqlalchemy.session import Session
+from sqlalchemy import create_engine
+
+STICKY_KEY = "_db_primary_until"
+
+
+class RoutingSession(Session):
+    """Sends reads of ``@replica_reads`` views to the replica bind.
+
+    Flushes and DML always use the primary; after a write the rest of the
+    request, and the same client for ``REPLICA_STICKY_SECONDS``, stay there.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None:
+            if self._flushing or getattr(clause, "is_dml", False):
+                _mark_write()
+            elif _replica_allowed():
+                engine = replica_engine()
+                if engine is not None:
+                    return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def _mark_write() -> None:
+    if has_request_context():
+        g._db_wrote = True
+
+
+def _replica_allowed() -> bool:
+    if not has_request_context() or not g.get("_db_replica"):
+        return False
+    if g.get("_db_wrote") or g.get("_db_force_primary"):
+        return False
+    # щойно записав — читає своє з primary, поки репліка не наздогнала
+    return session.get(STICKY_KEY, 0) <= time.time()
+
+
+def replica_reads(view):
+    """Allow the view's reads to go to the replica."""
+
+    @wraps(view)
+    def wrapped(*args, **kwargs):
+        g._db_replica = True
+        return view(*args, **kwargs)
+
+    return wrapped
+
+
+@contextmanager
+def use_primary():
+    """Force the primary inside a replica-routed view, e.g. before read-then-write."""
+    previous = g.get("_db_force_primary") if has_request_context() else None
+    if has_request_context():
+        g._db_force_primary = True
+    try:
+        yield
+    finally:
+        if has_request_context():
+            g._db_force_primary = previous
+
+
+def replica_engine():
+    return current_app.extensions.get("db_replica")
+
+
+def all_engines():
+    engines = list(current_app.extensions["sqlalchemy"].engines.values())
+    if replica_engine() is not None:
+        engines.append(replica_engine())
+    return engines
+
+
+def init_app(app) -> None:
+    """Create the replica engine from ``REPLICA_DATABASE_URL``, if set.
+
+    It is not a Flask-SQLAlchemy bind: models keep one metadata, and only
+    the routing session knows the replica exists.
+    """
+    from app.services import db_tuning
+
+    url = app.config.get("REPLICA_DATABASE_URL")
+    if not url:
+        return
+
+    engine = create_engine(url, **db_tuning.engine_options(app.config, url=url))
+    app.extensions["db_replica"] = engine
+    app.extensions["db_tuning"]["replica"] = db_tuning.tune_engine(engine, app.config)
+
+    @app.after_request
+    def _stick_to_primary(response):
+        if g.get("_db_wrote"):
+            session[STICKY_KEY] = time.time() + app.config.get("REPLICA_STICKY_SECONDS", 5)
+        return response
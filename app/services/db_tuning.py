@@ -0,0 +1,125 @@
+import logging
+import re
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+_PRAGMA_VALUE = re.compile(r"^-?[A-Za-z0-9_]+$")
+
+# (config key, PRAGMA name) у порядку застосування; journal_mode першим
+SQLITE_PRAGMAS = (
+    ("SQLITE_JOURNAL_MODE", "journal_mode"),
+    ("SQLITE_SYNCHRONOUS", "synchronous"),
+    ("SQLITE_BUSY_TIMEOUT_MS", "busy_timeout"),
+    ("SQLITE_MMAP_SIZE", "mmap_size"),
+    ("SQLITE_CACHE_SIZE", "cache_size"),
+)
+
+
+def _is_set(value) -> bool:
+    return value is not None and str(value).strip() != ""
+
+
+def _flag(value) -> bool:
+    return str(value).strip().lower() in ("1", "true", "yes", "on")
+
+
+def sqlite_pragmas(config) -> Dict[str, str]:
+    pragmas = {}
+    for key, pragma in SQLITE_PRAGMAS:
+        value = config.get(key)
+        if not _is_set(value):
+            continue
+        value = str(value).strip()
+        # значення підставляється в SQL, тож лише слова й числа
+        if not _PRAGMA_VALUE.match(value):
+            raise ValueError(f"{key} has an invalid value: {value!r}")
+        pragmas[pragma] = value
+    return pragmas
+
+
+def engine_options(config, url=None) -> Dict[str, Any]:
+    """``SQLALCHEMY_ENGINE_OPTIONS`` for ``url`` (the main database by default); explicit options win."""
+    backend = make_url(url or config["SQLALCHEMY_DATABASE_URI"]).get_backend_name()
+    options: Dict[str, Any] = {}
+
+    if backend == "postgresql":
+        for key, option in (("DB_POOL_SIZE", "pool_size"), ("DB_MAX_OVERFLOW", "max_overflow"), ("DB_POOL_RECYCLE", "pool_recycle")):
+            if _is_set(config.get(key)):
+                options[option] = int(config[key])
+        if _is_set(config.get("DB_POOL_PRE_PING")):
+            options["pool_pre_ping"] = _flag(config["DB_POOL_PRE_PING"])
+    elif backend == "sqlite" and _is_set(config.get("SQLITE_BUSY_TIMEOUT_MS")):
+        # pysqlite чекає на блокування сам, ще до того як спрацює PRAGMA busy_timeout
+        options["connect_args"] = {"timeout": int(config["SQLITE_BUSY_TIMEOUT_MS"]) / 1000}
+
+    options.update(config.get("SQLALCHEMY_ENGINE_OPTIONS") or {})
+    return options
+
+
+def _on_connect(pragmas: Dict[str, str]):
+    def apply(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma, value in pragmas.items():
+                cursor.execute(f"PRAGMA {pragma}={value}")
+        finally:
+            cursor.close()
+
+    return apply
+
+
+def configure(app) -> None:
+    """Set engine options for the main database and every bind; call before ``db.init_app``."""
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options(app.config)
+
+    binds = {}
+    for key, value in (app.config.get("SQLALCHEMY_BINDS") or {}).items():
+        if isinstance(value, str):
+            value = {"url": value, **engine_options(app.config, url=value)}
+        binds[key] = value
+    app.config["SQLALCHEMY_BINDS"] = binds
+
+
+def tune_engine(engine, config) -> Dict[str, Any]:
+    """Attach SQLite PRAGMAs to ``engine``; returns what was applied."""
+    report: Dict[str, Any] = {"backend": engine.dialect.name}
+
+    if engine.dialect.name == "sqlite":
+        pragmas = sqlite_pragmas(config)
+        if pragmas:
+            event.listen(engine, "connect", _on_connect(pragmas))
+        report["pragmas"] = pragmas
+    else:
+        pool = engine.pool
+        report["pool"] = {
+            "class": type(pool).__name__,
+            "size": pool.size() if hasattr(pool, "size") else None,
+            "max_overflow": getattr(pool, "_max_overflow", None),
+            "recycle": getattr(pool, "_recycle", None),
+            "pre_ping": getattr(pool, "_pre_ping", None),
+        }
+    return report
+
+
+def init_app(app, engines) -> Dict[str, Any]:
+    """Tune every engine and log the effective settings once."""
+    report = tune_engine(engines[None], app.config)
+    binds = {key: tune_engine(engine, app.config) for key, engine in engines.items() if key is not None}
+    if binds:
+        report["binds"] = binds
+
+    app.extensions["db_tuning"] = report
+    # create_app іде на кожен воркер, CLI-команду і тест: WARNING лише разом із профілем старту, звіт є в /ops/db
+    level = logging.WARNING if app.config.get("STARTUP_PROFILE") else logging.INFO
+    app.logger.log(level, "database tuning: %s", report)
+    return report
+
+
+def effective_pragmas(connection) -> Dict[str, Any]:
+    """Read the PRAGMAs back from a live SQLite connection."""
+    return {
+        pragma: connection.exec_driver_sql(f"PRAGMA {pragma}").scalar()
+        for _, pragma in SQLITE_PRAGMAS
+    }
@@ -0,0 +1,79 @@
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+from flask import current_app
+from sqlalchemy import or_, update
+
+from app.extensions import db
+from app.models.user import User
+from app.services.user_cache import UserCache
+
+
+class Entitlement(NamedTuple):
+    plan: str
+    expires_at: Optional[datetime]
+
+    @property
+    def is_pro(self) -> bool:
+        return self.plan == "pro"
+
+
+FREE = Entitlement("free", None)
+
+
+def init_app(app) -> None:
+    app.extensions["entitlements"] = UserCache(
+        ttl=app.config.get("ENTITLEMENT_CACHE_TTL", 5),
+        maxsize=app.config.get("USER_CACHE_SIZE", 10_000),
+    )
+
+
+def _cache() -> UserCache:
+    return current_app.extensions["entitlements"]
+
+
+def evaluate(is_pro: bool, pro_until: Optional[datetime], now: datetime) -> Entitlement:
+    """Effective plan; Pro needs a ``pro_until`` in the future, as checkout always sets one."""
+    if is_pro and pro_until and pro_until > now:
+        return Entitlement("pro", pro_until)
+    return FREE
+
+
+def for_user(user_id: int, now: Optional[datetime] = None, fresh: bool = False) -> Entitlement:
+    """Effective plan at ``now``; the row is read at most once per cache TTL unless ``fresh``.
+
+    The plan is also changed by other processes (callback worker,
+    ``flask billing expire-pro``) whose ``invalidate`` never reaches this
+    one, so the TTL is short and decisions that take money pass ``fresh``.
+    """
+    now = now or datetime.utcnow()
+    cache = _cache()
+    snapshot = None if fresh else cache.get(user_id)
+    if snapshot is None:
+        row = db.session.query(User.is_pro, User.pro_until).filter(User.id == user_id).first()
+        snapshot = {"is_pro": bool(row and row.is_pro), "pro_until": row.pro_until if row else None}
+        cache.put(user_id, snapshot)
+    # закешований Pro сам стає Free, коли минає pro_until — без звернення до БД
+    return evaluate(snapshot["is_pro"], snapshot["pro_until"], now)
+
+
+def invalidate(user_id: int) -> None:
+    """Drop the cached plan in this process; call it next to ``user_cache.invalidate``."""
+    _cache().invalidate(user_id)
+
+
+def sweep(now: Optional[datetime] = None, dry_run: bool = False) -> int:
+    """Downgrade every expired Pro user with one UPDATE. Returns how many were (or would be) changed."""
+    now = now or datetime.utcnow()
+    expired = (User.is_pro.is_(True), or_(User.pro_until.is_(None), User.pro_until <= now))
+
+    if dry_run:
+        return db.session.query(db.func.count(User.id)).filter(*expired).scalar()
+
+    user_ids = db.session.scalars(
+        update(User).where(*expired).values(is_pro=False).returning(User.id),
+        execution_options={"synchronize_session": False},
+    ).all()
+    # кеш користувачів веб-воркерів звідси не скинути — новий план видно через USER_CACHE_TTL
+    db.session.commit()
+    return len(user_ids)
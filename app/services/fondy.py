@@ -1,8 +1,13 @@
+import asyncio
 import hashlib
+import http.client
 import json
+import queue
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Iterable, Optional
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
+from urllib.parse import urlsplit
 
 from flask import current_app
 
@@ -18,6 +23,10 @@ REQUEST_SIGNATURE_ORDER: Iterable[str] = (
     "server_callback_url",
 )
 
+RETRY_STATUSES = {429, 502, 503, 504}
+# простійне з'єднання, яке сервер уже закрив; RemoteDisconnected — підклас ConnectionResetError
+_STALE_CONNECTION_ERRORS = (BrokenPipeError, ConnectionResetError)
+
 
 def _signature_string(
     params: Dict[str, Any],
@@ -57,30 +66,7 @@ def verify_signature(params: Dict[str, Any], secret_key: str) -> bool:
     return signature.lower() == expected.lower()
 
 
-def create_checkout_url(payload: Dict[str, Any]) -> str:
-    api_url = current_app.config.get("FONDY_API_URL")
-    secret_key = current_app.config.get("FONDY_SECRET_KEY")
-    if not api_url or not secret_key:
-        raise RuntimeError("Fondy configuration is missing")
-    secret_key = str(secret_key).strip()
-
-    payload = dict(payload)
-    payload["signature"] = generate_signature(payload, secret_key, field_order=REQUEST_SIGNATURE_ORDER)
-    request_body = json.dumps({"request": payload}).encode("utf-8")
-
-    req = Request(
-        api_url,
-        data=request_body,
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
-
-    try:
-        with urlopen(req, timeout=15) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-    except (HTTPError, URLError) as exc:
-        raise RuntimeError(f"Fondy request failed: {exc}") from exc
-
+def _checkout_url_from(data: Dict[str, Any], secret_key: str) -> str:
     response = data.get("response", {})
     if "signature" in response and not verify_signature(response, secret_key):
         raise RuntimeError("Fondy response signature invalid")
@@ -93,3 +79,243 @@ def create_checkout_url(payload: Dict[str, Any]) -> str:
     if not checkout_url:
         raise RuntimeError("Fondy response missing checkout_url")
     return checkout_url
+
+
+class _RetryableError(Exception):
+    pass
+
+
+class _ConnectionPool:
+    """Idle keep-alive connections to one host; size bounds idle sockets, not concurrency."""
+
+    def __init__(self, url: str, size: int, connect_timeout: float, read_timeout: float):
+        parts = urlsplit(url)
+        self.https = parts.scheme == "https"
+        self.host = parts.hostname
+        self.port = parts.port
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.size = size
+        self._idle: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue(maxsize=size)
+        self.opened = 0
+
+    def acquire(self):
+        """Return ``(connection, reused)``."""
+        try:
+            return self._idle.get_nowait(), True
+        except queue.Empty:
+            pass
+
+        cls = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+        conn = cls(self.host, self.port, timeout=self.connect_timeout)
+        conn.connect()
+        # після з'єднання чекаємо відповідь уже з read-таймаутом
+        conn.sock.settimeout(self.read_timeout)
+        self.opened += 1
+        return conn, False
+
+    def release(self, conn) -> None:
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class FondyClient:
+    """Checkout client over a keep-alive pool, with bounded retries and full jitter.
+
+    Retries cover connection errors, timeouts and 429/5xx gateway answers;
+    Fondy rejects a repeated ``order_id``, so a retried request cannot pay twice.
+    """
+
+    def __init__(
+        self,
+        api_url: str,
+        secret_key: str,
+        pool_size: int = 10,
+        connect_timeout: float = 3.0,
+        read_timeout: float = 10.0,
+        max_retries: int = 2,
+        backoff: float = 0.2,
+    ):
+        self.api_url = api_url
+        self.secret_key = str(secret_key).strip()
+        self.path = urlsplit(api_url).path or "/"
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.pool = _ConnectionPool(api_url, pool_size, connect_timeout, read_timeout)
+
+    @classmethod
+    def from_config(cls, config) -> "FondyClient":
+        api_url = config.get("FONDY_API_URL")
+        secret_key = config.get("FONDY_SECRET_KEY")
+        if not api_url or not secret_key:
+            raise RuntimeError("Fondy configuration is missing")
+        return cls(
+            api_url,
+            secret_key,
+            pool_size=config.get("FONDY_POOL_SIZE", 10),
+            connect_timeout=config.get("FONDY_CONNECT_TIMEOUT", 3.0),
+            read_timeout=config.get("FONDY_READ_TIMEOUT", 10.0),
+            max_retries=config.get("FONDY_MAX_RETRIES", 2),
+            backoff=config.get("FONDY_RETRY_BACKOFF", 0.2),
+        )
+
+    def request_body(self, payload: Dict[str, Any]) -> bytes:
+        payload = dict(payload)
+        payload["signature"] = generate_signature(payload, self.secret_key, field_order=REQUEST_SIGNATURE_ORDER)
+        return json.dumps({"request": payload}).encode("utf-8")
+
+    def retry_delay(self, attempt: int) -> float:
+        return random.uniform(0, self.backoff * (2 ** attempt))
+
+    def _post_once(self, body: bytes) -> Dict[str, Any]:
+        try:
+            conn, reused = self.pool.acquire()
+        except OSError as exc:
+            raise _RetryableError(f"Fondy connection failed: {exc}") from exc
+
+        try:
+            conn.request(
+                "POST",
+                self.path,
+                body=body,
+                headers={"Content-Type": "application/json", "Connection": "keep-alive"},
+            )
+            resp = conn.getresponse()
+        except _STALE_CONNECTION_ERRORS as exc:
+            conn.close()
+            if reused:
+                # сервер закрив простійне з'єднання, не відповівши, — пробуємо новим без спроби з ліміту
+                return self._post_once(body)
+            raise _RetryableError(f"Fondy request failed: {exc}") from exc
+        except (OSError, http.client.HTTPException) as exc:
+            # таймаут після відправки теж сюди: повтор лише через обмежений цикл спроб
+            conn.close()
+            raise _RetryableError(f"Fondy request failed: {exc}") from exc
+
+        try:
+            raw = resp.read()
+        except (OSError, http.client.HTTPException) as exc:
+            conn.close()
+            raise _RetryableError(f"Fondy request failed: {exc}") from exc
+
+        if resp.will_close:
+            conn.close()
+        else:
+            self.pool.release(conn)
+
+        if resp.status in RETRY_STATUSES:
+            raise _RetryableError(f"Fondy request failed: HTTP {resp.status}")
+        if resp.status >= 400:
+            raise RuntimeError(f"Fondy request failed: HTTP {resp.status}")
+        try:
+            return json.loads(raw.decode("utf-8"))
+        except ValueError as exc:
+            raise RuntimeError("Fondy response is not JSON") from exc
+
+    def create_checkout_url(self, payload: Dict[str, Any]) -> str:
+        body = self.request_body(payload)
+        for attempt in range(self.max_retries + 1):
+            try:
+                data = self._post_once(body)
+                break
+            except _RetryableError as exc:
+                if attempt == self.max_retries:
+                    raise RuntimeError(str(exc)) from exc
+                time.sleep(self.retry_delay(attempt))
+        return _checkout_url_from(data, self.secret_key)
+
+    def close(self) -> None:
+        self.pool.close()
+
+
+class AsyncFondyClient:
+    """``asyncio`` flavour of :class:`FondyClient`.
+
+    Uses ``aiohttp`` when it is installed; otherwise runs the pooled sync
+    client in a thread pool of the same size, so the event loop is never blocked.
+    """
+
+    def __init__(self, client: FondyClient):
+        self.client = client
+        self._session = None
+        self._executor = None
+        try:
+            import aiohttp
+        except ImportError:  # optional dependency
+            aiohttp = None
+        self._aiohttp = aiohttp
+
+    def _get_session(self):
+        if self._session is None:
+            pool = self.client.pool
+            self._session = self._aiohttp.ClientSession(
+                connector=self._aiohttp.TCPConnector(limit=pool.size, keepalive_timeout=30),
+                timeout=self._aiohttp.ClientTimeout(sock_connect=pool.connect_timeout, sock_read=pool.read_timeout),
+            )
+        return self._session
+
+    async def _post_once(self, body: bytes) -> Dict[str, Any]:
+        session = self._get_session()
+        try:
+            async with session.post(
+                self.client.api_url, data=body, headers={"Content-Type": "application/json"}
+            ) as resp:
+                raw = await resp.read()
+        except (self._aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            raise _RetryableError(f"Fondy request failed: {exc}") from exc
+
+        if resp.status in RETRY_STATUSES:
+            raise _RetryableError(f"Fondy request failed: HTTP {resp.status}")
+        if resp.status >= 400:
+            raise RuntimeError(f"Fondy request failed: HTTP {resp.status}")
+        try:
+            return json.loads(raw.decode("utf-8"))
+        except ValueError as exc:
+            raise RuntimeError("Fondy response is not JSON") from exc
+
+    async def create_checkout_url(self, payload: Dict[str, Any]) -> str:
+        if self._aiohttp is None:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.client.pool.size, thread_name_prefix="fondy")
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self.client.create_checkout_url, payload)
+
+        body = self.client.request_body(payload)
+        for attempt in range(self.client.max_retries + 1):
+            try:
+                data = await self._post_once(body)
+                break
+            except _RetryableError as exc:
+                if attempt == self.client.max_retries:
+                    raise RuntimeError(str(exc)) from exc
+                await asyncio.sleep(self.client.retry_delay(attempt))
+        return _checkout_url_from(data, self.client.secret_key)
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+def get_client() -> FondyClient:
+    """Per-app client, built on first use so the pool outlives single requests."""
+    client = current_app.extensions.get("fondy")
+    if client is None:
+        client = current_app.extensions.setdefault("fondy", FondyClient.from_config(current_app.config))
+    return client
+
+
+def create_checkout_url(payload: Dict[str, Any]) -> str:
+    return get_client().create_checkout_url(payload)
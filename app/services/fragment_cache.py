@@ -0,0 +1,195 @@
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from flask import current_app
+
+
+class MemoryBackend:
+    """Per-process LRU. Stale entries are never read because keys carry the data version."""
+
+    def __init__(self, maxsize: int = 512, ttl: float = 0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at and expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl else 0
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+class FileSystemBackend:
+    """One file per fragment in a local directory, shared by all workers on the host.
+
+    Keys carry the data version, so old fragments are never read again:
+    expired files are removed on read, and every ``sweep_every`` writes the
+    directory is trimmed to ``max_files`` (oldest first).
+    """
+
+    _TMP_PREFIX = ".tmp-"
+
+    def __init__(self, directory: str, ttl: float = 0, max_files: int = 10_000, sweep_every: int = 100):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_files = max_files
+        self.sweep_every = sweep_every
+        self._writes = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(key.encode("utf-8")).hexdigest())
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            # інший воркер встиг першим
+            return False
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            if self.ttl and os.path.getmtime(path) + self.ttl < time.time():
+                self._remove(path)
+                return None
+            with open(path, encoding="utf-8") as fh:
+                return fh.read()
+        except OSError:
+            return None
+
+    def set(self, key: str, value: str) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=self._TMP_PREFIX)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(value)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            self._remove(tmp_path)
+
+        with self._lock:
+            self._writes += 1
+            due = self.sweep_every and self._writes % self.sweep_every == 0
+        if due:
+            self.sweep()
+
+    def sweep(self) -> int:
+        """Delete expired fragments and the oldest ones above ``max_files``. Returns files removed."""
+        now = time.time()
+        removed = 0
+        live = []
+        try:
+            entries = list(os.scandir(self.directory))
+        except OSError:
+            return 0
+        for entry in entries:
+            try:
+                mtime = entry.stat().st_mtime
+            except OSError:
+                continue
+            if entry.name.startswith(self._TMP_PREFIX):
+                # недописаний файл упалого воркера
+                if mtime + 60 < now:
+                    removed += self._remove(entry.path)
+                continue
+            if self.ttl and mtime + self.ttl < now:
+                removed += self._remove(entry.path)
+            else:
+                live.append((mtime, entry.path))
+
+        if self.max_files and len(live) > self.max_files:
+            live.sort()
+            for _, path in live[: len(live) - self.max_files]:
+                removed += self._remove(path)
+        return removed
+
+
+class RedisBackend:
+    """Any Redis-protocol server (Redis, Valkey, KeyDB, ...)."""
+
+    def __init__(self, url: str, ttl: float = 0, prefix: str = "skilltracker:fragment:"):
+        try:
+            import redis
+        except ImportError as exc:  # optional dependency
+            raise RuntimeError("FRAGMENT_CACHE_BACKEND=redis needs the 'redis' package") from exc
+        self.client = redis.Redis.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.client.get(self.prefix + key)
+        return value.decode("utf-8") if value is not None else None
+
+    def set(self, key: str, value: str) -> None:
+        self.client.set(self.prefix + key, value.encode("utf-8"), ex=int(self.ttl) or None)
+
+
+class NullBackend:
+    def get(self, key: str) -> Optional[str]:
+        return None
+
+    def set(self, key: str, value: str) -> None:
+        pass
+
+
+def _make_backend(config):
+    name = (config.get("FRAGMENT_CACHE_BACKEND") or "memory").lower()
+    ttl = config.get("FRAGMENT_CACHE_TTL", 0)
+    if name == "memory":
+        return MemoryBackend(maxsize=config.get("FRAGMENT_CACHE_SIZE", 512), ttl=ttl)
+    if name == "filesystem":
+        return FileSystemBackend(
+            config.get("FRAGMENT_CACHE_DIR"),
+            ttl=ttl,
+            max_files=config.get("FRAGMENT_CACHE_DIR_MAX_FILES", 10_000),
+        )
+    if name == "redis":
+        return RedisBackend(config.get("FRAGMENT_CACHE_REDIS_URL"), ttl=ttl)
+    if name == "none":
+        return NullBackend()
+    raise RuntimeError(f"Unknown FRAGMENT_CACHE_BACKEND: {name}")
+
+
+def init_app(app) -> None:
+    app.extensions["fragment_cache"] = _make_backend(app.config)
+
+
+def make_key(name: str, *parts) -> str:
+    return ":".join([name] + [str(part) for part in parts])
+
+
+def fetch(key: str) -> Optional[str]:
+    return current_app.extensions["fragment_cache"].get(key)
+
+
+def store(key: str, value: str) -> None:
+    current_app.extensions["fragment_cache"].set(key, value)
+
+
+def sweep() -> int:
+    """Trim a backend that keeps dead entries around; memory and Redis evict by themselves."""
+    backend = current_app.extensions["fragment_cache"]
+    return backend.sweep() if hasattr(backend, "sweep") else 0
@@ -0,0 +1,94 @@
+from datetime import date, datetime
+from typing import List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import func, select, update
+
+from app.extensions import db
+from app.models.goal import Goal
+from app.models.task import Task
+from app.services import agenda
+
+
+class Progress(NamedTuple):
+    total: int
+    done: int
+    overdue: int
+    last_completed_at: Optional[datetime]
+
+    @property
+    def percent(self) -> int:
+        return round(self.done * 100 / self.total) if self.total else 0
+
+
+def _last_completed(goal_id):
+    # (goal_id, is_done, completed_at) індекс: один пошук по індексу
+    return (
+        select(func.max(Task.completed_at))
+        .where(Task.goal_id == goal_id, Task.is_done.is_(True))
+        .scalar_subquery()
+    )
+
+
+def record(goal_id: int, total: int = 0, done: int = 0) -> None:
+    """Shift the goal's counters in the current transaction.
+
+    ``done`` changes also refresh ``last_completed_at``, so call it after
+    the task rows themselves were changed (the UPDATE autoflushes them).
+    """
+    if not total and not done:
+        return
+    values = {}
+    if total:
+        values["task_count"] = Goal.task_count + total
+    if done:
+        values["done_count"] = Goal.done_count + done
+        values["last_completed_at"] = _last_completed(goal_id)
+    db.session.execute(
+        update(Goal).where(Goal.id == goal_id).values(**values),
+        execution_options={"synchronize_session": False},
+    )
+
+
+def rebuild(goal_id: Optional[int] = None) -> int:
+    """Recompute the counters from the task table. Returns the number of goals updated."""
+    task_count = select(func.count(Task.id)).where(Task.goal_id == Goal.id).scalar_subquery()
+    done_count = (
+        select(func.count(Task.id))
+        .where(Task.goal_id == Goal.id, Task.is_done.is_(True))
+        .scalar_subquery()
+    )
+    stmt = update(Goal).values(
+        task_count=task_count,
+        done_count=done_count,
+        last_completed_at=_last_completed(Goal.id),
+    )
+    if goal_id is not None:
+        stmt = stmt.where(Goal.id == goal_id)
+
+    result = db.session.execute(stmt, execution_options={"synchronize_session": False})
+    db.session.commit()
+    return result.rowcount
+
+
+def with_progress(user_id: int, today: date) -> List[Tuple[Goal, Progress]]:
+    """All goals of the user, newest first, with their progress, in one query.
+
+    ``overdue`` depends on today, so it is counted here rather than stored.
+    """
+    overdue = (
+        db.session.query(Task.goal_id, func.count(Task.id).label("overdue"))
+        .filter(*agenda.open_with_due(user_id), Task.due_date < today)
+        .group_by(Task.goal_id)
+        .subquery()
+    )
+    rows = (
+        db.session.query(Goal, func.coalesce(overdue.c.overdue, 0))
+        .outerjoin(overdue, overdue.c.goal_id == Goal.id)
+        .filter(Goal.user_id == user_id)
+        .order_by(Goal.id.desc())
+        .all()
+    )
+    return [
+        (goal, Progress(goal.task_count, goal.done_count, overdue_count, goal.last_completed_at))
+        for goal, overdue_count in rows
+    ]
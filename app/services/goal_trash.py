@@ -0,0 +1,93 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import with_loader_criteria
+
+from app.extensions import db
+from app.models.daily_completion import DailyCompletion
+from app.models.goal import Goal
+from app.models.recurring_task import RecurringTask
+from app.models.task import Task
+from app.services import data_version, rollup, streaks
+from app.services.db_routing import RoutingSession
+
+# execution option: запит бачить видалені цілі та їхні задачі (лише для очищення)
+INCLUDE_DELETED = "include_deleted"
+
+# Core-таблиця, а не Goal: критерій для Goal інакше спрацював би і в цьому підзапиті
+_goal = Goal.__table__
+_deleted_goal_ids = select(_goal.c.id).where(_goal.c.deleted_at.isnot(None))
+
+
+def _hide_deleted(state):
+    if (
+        not state.is_select
+        or state.is_column_load
+        or state.is_relationship_load
+        or state.execution_options.get(INCLUDE_DELETED, False)
+    ):
+        return
+    state.statement = state.statement.options(
+        with_loader_criteria(Goal, lambda cls: cls.deleted_at.is_(None), include_aliases=True),
+        # задачі й правила видаленої цілі живуть до очищення; таких цілей одиниці
+        with_loader_criteria(Task, lambda cls: cls.goal_id.not_in(_deleted_goal_ids), include_aliases=True),
+        with_loader_criteria(RecurringTask, lambda cls: cls.goal_id.not_in(_deleted_goal_ids), include_aliases=True),
+    )
+
+
+def init_app(app) -> None:
+    """Hide soft-deleted goals, their tasks and rules from every ORM SELECT."""
+    if not event.contains(RoutingSession, "do_orm_execute", _hide_deleted):
+        event.listen(RoutingSession, "do_orm_execute", _hide_deleted)
+
+
+def soft_delete(goal: Goal, user_id: int) -> None:
+    """Hide the goal at once; its rows are removed later by :func:`purge_batch`.
+
+    Only the small per-goal rollup is cleared here, so stats and streaks
+    stop counting the goal in the same transaction.
+    """
+    goal.deleted_at = datetime.utcnow()
+    rollup.forget_goal(goal.id)
+    streaks.recompute(user_id)
+    data_version.bump(user_id)
+
+
+def pending_goal_id() -> Optional[int]:
+    return db.session.execute(
+        select(Goal.id)
+        .where(Goal.deleted_at.isnot(None))
+        .order_by(Goal.deleted_at.asc(), Goal.id.asc())
+        .limit(1),
+        execution_options={INCLUDE_DELETED: True},
+    ).scalar()
+
+
+def purge_batch(chunk_size: int = 1000) -> int:
+    """Delete one chunk of a soft-deleted goal in its own short transaction.
+
+    Tasks go first, ``chunk_size`` at a time; once none are left the rules,
+    stray rollup rows and the goal row itself are removed. Returns the number
+    of rows deleted, 0 when nothing is pending.
+    """
+    goal_id = pending_goal_id()
+    if goal_id is None:
+        return 0
+
+    task_ids = db.session.execute(
+        select(Task.id).where(Task.goal_id == goal_id).limit(chunk_size),
+        execution_options={INCLUDE_DELETED: True},
+    ).scalars().all()
+
+    if task_ids:
+        Task.query.filter(Task.id.in_(task_ids)).delete(synchronize_session=False)
+        db.session.commit()
+        return len(task_ids)
+
+    # масові DELETE: каскад Goal.tasks не підвантажує дітей
+    RecurringTask.query.filter_by(goal_id=goal_id).delete(synchronize_session=False)
+    DailyCompletion.query.filter_by(goal_id=goal_id).delete(synchronize_session=False)
+    Goal.query.filter_by(id=goal_id).delete(synchronize_session=False)
+    db.session.commit()
+    return 1
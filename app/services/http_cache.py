@@ -0,0 +1,34 @@
+import hashlib
+
+from flask import current_app, request, session
+from flask_babel import get_locale
+
+
+def planner_etag(*parts) -> str:
+    """ETag for a planner page of the current user.
+
+    ``parts`` must include everything the page depends on besides the
+    template itself, normally the user's data version and the viewed range.
+    """
+    raw = "|".join(str(part) for part in parts + (get_locale(), session.get("lang")))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def not_modified(etag: str):
+    """Return a 304 response if the client already has this version, else None."""
+    # флеш-повідомлення рендеряться в base.html, їх не можна загубити на 304
+    if session.get("_flashes"):
+        return None
+    if not request.if_none_match.contains(etag):
+        return None
+
+    response = current_app.response_class(status=304)
+    return with_etag(response, etag)
+
+
+def with_etag(response, etag: str):
+    response = current_app.make_response(response)
+    response.set_etag(etag)
+    # сторінки персональні: браузер кешує, але щоразу перевіряє ETag
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
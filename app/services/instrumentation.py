@@ -0,0 +1,166 @@
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List
+
+from flask import before_render_template, current_app, g, has_request_context, request, template_rendered
+from sqlalchemy import event
+
+# межі гістограми тривалості запиту, секунди
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class Metrics:
+    """Per-endpoint totals since process start, rendered in Prometheus text format."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, dict] = defaultdict(lambda: {
+            "count": 0,
+            "seconds": 0.0,
+            "buckets": [0] * len(BUCKETS),
+            "sql_count": 0,
+            "sql_seconds": 0.0,
+            "template_seconds": 0.0,
+            "n_plus_one": 0,
+        })
+
+    def observe(self, endpoint: str, seconds: float, sql_count: int, sql_seconds: float,
+                template_seconds: float, n_plus_one: int) -> None:
+        with self._lock:
+            entry = self._endpoints[endpoint]
+            entry["count"] += 1
+            entry["seconds"] += seconds
+            for i, bound in enumerate(BUCKETS):
+                if seconds <= bound:
+                    entry["buckets"][i] += 1
+            entry["sql_count"] += sql_count
+            entry["sql_seconds"] += sql_seconds
+            entry["template_seconds"] += template_seconds
+            entry["n_plus_one"] += n_plus_one
+
+    def render(self) -> str:
+        with self._lock:
+            endpoints = {name: dict(entry, buckets=list(entry["buckets"])) for name, entry in self._endpoints.items()}
+
+        lines: List[str] = [
+            "# HELP skilltracker_request_duration_seconds Wall time per request.",
+            "# TYPE skilltracker_request_duration_seconds histogram",
+        ]
+        for name, entry in sorted(endpoints.items()):
+            label = f'endpoint="{name}"'
+            for bound, count in zip(BUCKETS, entry["buckets"]):
+                lines.append(f'skilltracker_request_duration_seconds_bucket{{{label},le="{bound}"}} {count}')
+            lines.append(f'skilltracker_request_duration_seconds_bucket{{{label},le="+Inf"}} {entry["count"]}')
+            lines.append(f"skilltracker_request_duration_seconds_sum{{{label}}} {entry['seconds']:.6f}")
+            lines.append(f"skilltracker_request_duration_seconds_count{{{label}}} {entry['count']}")
+
+        for metric, key, kind, help_text in (
+            ("skilltracker_sql_queries_total", "sql_count", "counter", "SQL statements executed."),
+            ("skilltracker_sql_duration_seconds_total", "sql_seconds", "counter", "Time spent in SQL statements."),
+            ("skilltracker_template_duration_seconds_total", "template_seconds", "counter", "Time spent rendering templates."),
+            ("skilltracker_n_plus_one_suspects_total", "n_plus_one", "counter", "Requests that repeated one statement too often."),
+        ):
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            for name, entry in sorted(endpoints.items()):
+                value = entry[key]
+                value = f"{value:.6f}" if isinstance(value, float) else str(value)
+                lines.append(f'{metric}{{endpoint="{name}"}} {value}')
+
+        return "\n".join(lines) + "\n"
+
+
+def _state():
+    if not has_request_context():
+        return None
+    return g.get("_instrumentation")
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # час живе на контексті виконання: якщо запит впаде, after не викличеться і нічого не залишиться
+    context._instrumentation_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_instrumentation_started", None)
+    state = _state()
+    if state is None or started is None:
+        return
+    state["sql_count"] += 1
+    state["sql_seconds"] += time.perf_counter() - started
+    state["statements"][statement] += 1
+
+
+def _before_render(sender, template, context, **extra):
+    state = _state()
+    if state is not None:
+        state["template_started"].append(time.perf_counter())
+
+
+def _rendered(sender, template, context, **extra):
+    state = _state()
+    if state is None or not state["template_started"]:
+        return
+    started = state["template_started"].pop()
+    # вкладений рендер (фрагмент у сторінці) рахується лише раз, у зовнішньому
+    if not state["template_started"]:
+        state["template_seconds"] += time.perf_counter() - started
+
+
+def watch_engine(engine) -> None:
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def init_app(app, engines) -> None:
+    """Opt-in per-request timing; off unless ``INSTRUMENTATION_ENABLED`` is set."""
+    if not app.config.get("INSTRUMENTATION_ENABLED"):
+        return
+
+    metrics = app.extensions["instrumentation"] = Metrics()
+    threshold = app.config.get("INSTRUMENTATION_N_PLUS_ONE", 5)
+
+    for engine in engines:
+        watch_engine(engine)
+    before_render_template.connect(_before_render, app)
+    template_rendered.connect(_rendered, app)
+
+    @app.before_request
+    def _start_timing():
+        g._instrumentation = {
+            "started": time.perf_counter(),
+            "sql_count": 0,
+            "sql_seconds": 0.0,
+            "statements": Counter(),
+            "template_started": [],
+            "template_seconds": 0.0,
+        }
+
+    @app.after_request
+    def _finish_timing(response):
+        state = _state()
+        if state is None:
+            return response
+
+        seconds = time.perf_counter() - state["started"]
+        endpoint = request.endpoint or "unmatched"
+
+        suspects = [(sql, n) for sql, n in state["statements"].items() if n >= threshold]
+        for sql, n in suspects:
+            app.logger.warning("N+1 suspect in %s: %d x %s", endpoint, n, " ".join(sql.split())[:300])
+
+        metrics.observe(endpoint, seconds, state["sql_count"], state["sql_seconds"],
+                        state["template_seconds"], 1 if suspects else 0)
+
+        response.headers.add(
+            "Server-Timing",
+            f'app;dur={seconds * 1000:.1f}, '
+            f'db;dur={state["sql_seconds"] * 1000:.1f};desc="{state["sql_count"]} queries", '
+            f'tpl;dur={state["template_seconds"] * 1000:.1f}',
+        )
+        return response
+
+
+def get_metrics():
+    return current_app.extensions.get("instrumentation")
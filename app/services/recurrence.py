@@ -0,0 +1,101 @@
+from datetime import date, datetime, timedelta
+from typing import Dict, List
+
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+
+from app.extensions import db
+from app.models.recurring_task import RecurringTask
+from app.models.task import Task
+from app.services import goal_counters
+
+RULES = ("daily", "weekdays", "interval")
+
+
+class Occurrence:
+    """Unsaved occurrence of a recurring rule; quacks like ``Task`` in templates."""
+
+    id = None
+    is_done = False
+    due_date = None
+    completed_at = None
+
+    def __init__(self, rule: RecurringTask, day: date):
+        self.recurrence_id = rule.id
+        self.goal_id = rule.goal_id
+        self.title = rule.title
+        self.task_type = rule.task_type
+        self.planned_for = day
+
+
+def occurs_on(rule: RecurringTask, day: date) -> bool:
+    if day < rule.starts_on or (rule.ends_on and day > rule.ends_on):
+        return False
+    if rule.rule == "weekdays":
+        return day.weekday() < 5
+    if rule.rule == "interval":
+        return (day - rule.starts_on).days % max(rule.interval_days or 1, 1) == 0
+    return True
+
+
+def occurrences(rule: RecurringTask, start: date, end: date) -> List[date]:
+    first = max(start, rule.starts_on)
+    last = min(end, rule.ends_on) if rule.ends_on else end
+    return [
+        first + timedelta(days=i)
+        for i in range((last - first).days + 1)
+        if occurs_on(rule, first + timedelta(days=i))
+    ]
+
+
+def rules_for_range(user_id: int, start: date, end: date) -> List[RecurringTask]:
+    return (
+        RecurringTask.query
+        .filter(RecurringTask.user_id == user_id, RecurringTask.starts_on <= end)
+        .filter(or_(RecurringTask.ends_on.is_(None), RecurringTask.ends_on >= start))
+        .order_by(RecurringTask.id.asc())
+        .all()
+    )
+
+
+def expand(user_id: int, start: date, end: date, tasks) -> Dict[date, List[Occurrence]]:
+    """Occurrences in ``start..end`` that have no saved ``Task`` among ``tasks`` yet."""
+    saved = {(t.recurrence_id, t.planned_for) for t in tasks if t.recurrence_id}
+    by_day: Dict[date, List[Occurrence]] = {}
+    for rule in rules_for_range(user_id, start, end):
+        for day in occurrences(rule, start, end):
+            if (rule.id, day) not in saved:
+                by_day.setdefault(day, []).append(Occurrence(rule, day))
+    return by_day
+
+
+def materialize(rule: RecurringTask, day: date) -> Task:
+    """Return the saved task for this occurrence, creating it if needed.
+
+    Call it before any other write of the request: a lost insert race rolls
+    the session back.
+    """
+    task = Task.query.filter_by(recurrence_id=rule.id, planned_for=day).first()
+    if task:
+        return task
+
+    task = Task(
+        title=rule.title,
+        goal_id=rule.goal_id,
+        user_id=rule.user_id,
+        planned_for=day,
+        task_type=rule.task_type,
+        is_done=False,
+        recurrence_id=rule.id,
+        created_at=datetime.utcnow(),
+    )
+    db.session.add(task)
+    try:
+        db.session.flush()
+    except IntegrityError:
+        db.session.rollback()
+        # паралельний запит встиг зберегти те саме входження
+        return Task.query.filter_by(recurrence_id=rule.id, planned_for=day).one()
+
+    goal_counters.record(rule.goal_id, total=1)
+    return task
@@ -0,0 +1,114 @@
+import time
+from datetime import date
+from typing import List, NamedTuple, Optional
+
+from sqlalchemy import false, func, select, true, update
+
+from app.extensions import db
+from app.models.goal import Goal
+from app.models.task import Task
+from app.models.user import User
+from app.services import data_version
+
+
+class Stale(NamedTuple):
+    user_id: int
+    tasks: int
+    oldest: date
+
+
+class Result(NamedTuple):
+    users: int
+    tasks: int
+    # False, якщо зупинились за time_limit — наступний запуск продовжить
+    finished: bool
+
+
+# Core-таблиця: UPDATE не проходить через фільтр goal_trash, видалені цілі відсікаємо самі
+_goal = Goal.__table__
+_deleted_goal_ids = select(_goal.c.id).where(_goal.c.deleted_at.isnot(None))
+
+
+def stale(user_id: int, today: date):
+    """Open one-off tasks planned before ``today``, served by ``ix_task_open_user_id_planned_for``.
+
+    Recurring occurrences are left alone: the rule shows the next one anyway,
+    and moving it could clash with ``uq_task_recurrence_id_planned_for``.
+    """
+    return (
+        Task.user_id == user_id,
+        Task.is_done == false(),
+        Task.planned_for < today,
+        Task.recurrence_id.is_(None),
+        Task.goal_id.not_in(_deleted_goal_ids),
+    )
+
+
+def opted_in_user_ids() -> List[int]:
+    return db.session.scalars(
+        select(User.id).where(User.rollover_tasks == true()).order_by(User.id)
+    ).all()
+
+
+def report(today: date) -> List[Stale]:
+    """What :func:`run` would move, per opted-in user; nothing is written."""
+    rows = []
+    for user_id in opted_in_user_ids():
+        count, oldest = db.session.execute(
+            select(func.count(Task.id), func.min(Task.planned_for)).where(*stale(user_id, today))
+        ).one()
+        if count:
+            rows.append(Stale(user_id, count, oldest))
+    return rows
+
+
+def roll_user(user_id: int, today: date, chunk_size: int = 1000) -> int:
+    """Move one chunk of the user's stale tasks to ``today`` in its own transaction.
+
+    Returns the number of tasks moved; 0 means the user is done. Moved rows
+    leave the ``stale`` range, so the next chunk needs no cursor.
+    """
+    task_ids = db.session.scalars(
+        select(Task.id).where(*stale(user_id, today)).order_by(Task.planned_for, Task.id).limit(chunk_size)
+    ).all()
+    if not task_ids:
+        return 0
+
+    db.session.execute(
+        update(Task)
+        .where(Task.id.in_(task_ids), *stale(user_id, today))
+        .values(
+            planned_for=today,
+            # перше перенесення запам'ятовує початкову дату, наступні її не чіпають
+            rolled_over_from=func.coalesce(Task.rolled_over_from, Task.planned_for),
+        ),
+        execution_options={"synchronize_session": False},
+    )
+    data_version.bump(user_id)
+    db.session.commit()
+    return len(task_ids)
+
+
+def run(today: date, chunk_size: int = 1000, time_limit: Optional[float] = None,
+        pause: float = 0.0) -> Result:
+    """Roll over every opted-in user, one short UPDATE per chunk.
+
+    With ``time_limit`` (seconds) the job stops between chunks once the time
+    is up, so a nightly run stays bounded however big the backlog is.
+    """
+    deadline = time.monotonic() + time_limit if time_limit else None
+    users = tasks = 0
+    for user_id in opted_in_user_ids():
+        moved_any = False
+        while True:
+            if deadline is not None and time.monotonic() >= deadline:
+                return Result(users + moved_any, tasks, False)
+            moved = roll_user(user_id, today, chunk_size)
+            if not moved:
+                break
+            moved_any = True
+            tasks += moved
+            if pause:
+                time.sleep(pause)
+        users += moved_any
+    return Result(users, tasks, True)
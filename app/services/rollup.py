@@ -0,0 +1,101 @@
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import insert
+
+from app.extensions import db
+from app.models.daily_completion import DailyCompletion
+from app.models.task import Task
+from app.services import stats_queries
+
+
+def completion_day(task: Task) -> Optional[date]:
+    if task.completed_at:
+        return task.completed_at.date()
+    if task.planned_for:
+        return task.planned_for
+    if task.created_at:
+        return task.created_at.date()
+    return None
+
+
+def _insert_stmt():
+    dialect = db.session.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        return None
+    return insert(DailyCompletion)
+
+
+def record(user_id: int, goal_id: int, day: Optional[date], delta: int) -> None:
+    """Add ``delta`` completions to the (user, day, goal) bucket.
+
+    Runs inside the caller's transaction, so the rollup is committed together
+    with the task change that caused it.
+    """
+    if not day or not delta:
+        return
+
+    key = dict(user_id=user_id, goal_id=goal_id, day=day)
+    stmt = _insert_stmt()
+
+    if stmt is not None:
+        stmt = stmt.values(**key, count=max(delta, 0))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "day", "goal_id"],
+            set_={"count": DailyCompletion.count + delta},
+        )
+        db.session.execute(stmt)
+    else:
+        updated = (
+            DailyCompletion.query
+            .filter_by(**key)
+            .update({DailyCompletion.count: DailyCompletion.count + delta}, synchronize_session=False)
+        )
+        if not updated and delta > 0:
+            db.session.add(DailyCompletion(**key, count=delta))
+
+    if delta < 0:
+        (
+            DailyCompletion.query
+            .filter_by(**key)
+            .filter(DailyCompletion.count <= 0)
+            .delete(synchronize_session=False)
+        )
+
+
+def forget_goal(goal_id: int) -> None:
+    DailyCompletion.query.filter_by(goal_id=goal_id).delete(synchronize_session=False)
+
+
+def day_counts(user_id: int, start: date, end: date):
+    """Return ``(day, goal_id, count)`` rows for the inclusive range."""
+    return (
+        db.session.query(DailyCompletion.day, DailyCompletion.goal_id, DailyCompletion.count)
+        .filter(
+            DailyCompletion.user_id == user_id,
+            DailyCompletion.day >= start,
+            DailyCompletion.day <= end,
+        )
+        .all()
+    )
+
+
+def rebuild(user_id: Optional[int] = None) -> int:
+    """Recompute the rollup from the task table. Returns the number of buckets written."""
+    existing = DailyCompletion.query
+    if user_id is not None:
+        existing = existing.filter_by(user_id=user_id)
+    existing.delete(synchronize_session=False)
+
+    result = db.session.execute(
+        insert(DailyCompletion).from_select(
+            ["user_id", "goal_id", "day", "count"],
+            stats_queries.completion_buckets(user_id),
+        )
+    )
+    db.session.commit()
+    return result.rowcount
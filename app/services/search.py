@@ -0,0 +1,152 @@
+import re
+from typing import List, NamedTuple, Optional
+
+from flask import current_app
+from markupsafe import Markup, escape
+from sqlalchemy import text
+
+from app.extensions import db
+from app.models.search import GOAL_TSVECTOR, SQLITE_TABLE, TASK_TSVECTOR
+
+MAX_TERMS = 8
+# межі збігу в title/snippet; замінюються на <mark> уже після екранування
+_START, _STOP = "\x02", "\x03"
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+class Hit(NamedTuple):
+    kind: str
+    id: int
+    goal_id: int
+    title: Markup
+    snippet: Markup
+    # більше — краще; шкали SQLite (bm25) і PostgreSQL (ts_rank) різні
+    score: float
+
+
+def terms(query: str) -> List[str]:
+    """Words of the user's query; FTS operators and quotes never reach the database."""
+    return _WORD.findall(query.lower())[:MAX_TERMS]
+
+
+def highlight(value: str) -> Markup:
+    return Markup(str(escape(value or "")).replace(_START, "<mark>").replace(_STOP, "</mark>"))
+
+
+def search(user_id: int, query: str, limit: Optional[int] = None, candidates: Optional[int] = None) -> List[Hit]:
+    """Tasks and goals of the user whose words start with every term, best first.
+
+    Only the newest ``candidates`` matches are ranked, so a one-letter
+    prefix over 100k tasks costs the same as a rare word.
+    """
+    words = terms(query)
+    if not words:
+        return []
+    limit = current_app.config.get("SEARCH_LIMIT", 20) if limit is None else limit
+    candidates = current_app.config.get("SEARCH_CANDIDATES", 1000) if candidates is None else candidates
+
+    dialect = db.session.get_bind().dialect.name
+    if dialect == "sqlite":
+        rows = _sqlite(user_id, words, limit, candidates)
+    elif dialect == "postgresql":
+        rows = _postgresql(user_id, words, limit, candidates)
+    else:
+        raise RuntimeError(f"search is not supported on {dialect}")
+
+    return [
+        Hit(row.kind, row.ref_id, row.goal_id, highlight(row.title), highlight(row.snippet), row.score)
+        for row in rows
+    ]
+
+
+def _sqlite(user_id: int, words: List[str], limit: int, candidates: int):
+    prefixes = " AND ".join(f'"{word}"*' for word in words)
+    match = f"owner:u{user_id} AND {{title body}}: ({prefixes})"
+    # rowid DESC FTS5 віддає без сортування; goal_id читається лише для кандидатів
+    return db.session.execute(
+        text(f"""
+            SELECT kind, ref_id, goal_id, title, snippet, score FROM (
+                SELECT kind, ref_id, goal_id,
+                       highlight({SQLITE_TABLE}, 0, :start, :stop) AS title,
+                       snippet({SQLITE_TABLE}, 1, :start, :stop, '…', 12) AS snippet,
+                       -bm25({SQLITE_TABLE}, 10.0, 4.0, 0.0) AS score
+                FROM {SQLITE_TABLE}
+                WHERE {SQLITE_TABLE} MATCH :match
+                ORDER BY rowid DESC
+                LIMIT :candidates
+            )
+            WHERE goal_id NOT IN (SELECT id FROM goal WHERE deleted_at IS NOT NULL)
+            ORDER BY score DESC
+            LIMIT :limit
+        """),
+        {"match": match, "candidates": candidates, "limit": limit, "start": _START, "stop": _STOP},
+    ).all()
+
+
+def _postgresql(user_id: int, words: List[str], limit: int, candidates: int):
+    tsquery = " & ".join(f"{word}:*" for word in words)
+    options = f"StartSel={_START}, StopSel={_STOP}, HighlightAll=true"
+    snippet_options = f"StartSel={_START}, StopSel={_STOP}, MaxWords=20, MinWords=5"
+    # ts_rank — лише для кандидатів, ts_headline — лише для верхніх limit рядків
+    return db.session.execute(
+        text(f"""
+            WITH q AS (SELECT to_tsquery('simple', :tsquery) AS query),
+            task_hits AS (
+                SELECT task.id, task.goal_id, task.title
+                FROM task, q
+                WHERE task.user_id = :user_id AND {TASK_TSVECTOR} @@ q.query
+                  AND task.goal_id NOT IN (SELECT id FROM goal WHERE deleted_at IS NOT NULL)
+                ORDER BY task.id DESC
+                LIMIT :candidates
+            ),
+            goal_hits AS (
+                SELECT goal.id, goal.title, coalesce(goal.description, '') AS description
+                FROM goal, q
+                WHERE goal.user_id = :user_id AND goal.deleted_at IS NULL AND {GOAL_TSVECTOR} @@ q.query
+                ORDER BY goal.id DESC
+                LIMIT :candidates
+            ),
+            ranked AS (
+                SELECT 'task' AS kind, id AS ref_id, goal_id, title, '' AS body,
+                       ts_rank(to_tsvector('simple', title), q.query) * 2.5 AS score
+                FROM task_hits, q
+                UNION ALL
+                SELECT 'goal', id, id, title, description,
+                       ts_rank(to_tsvector('simple', title || ' ' || description), q.query)
+                FROM goal_hits, q
+                ORDER BY score DESC
+                LIMIT :limit
+            )
+            SELECT kind, ref_id, goal_id,
+                   ts_headline('simple', title, q.query, :options) AS title,
+                   CASE WHEN body = '' THEN '' ELSE ts_headline('simple', body, q.query, :snippet_options) END AS snippet,
+                   score
+            FROM ranked, q
+            ORDER BY score DESC
+        """),
+        {
+            "tsquery": tsquery,
+            "user_id": user_id,
+            "candidates": candidates,
+            "limit": limit,
+            "options": options,
+            "snippet_options": snippet_options,
+        },
+    ).all()
+
+
+def rebuild() -> int:
+    """Refill the SQLite index from task and goal rows; PostgreSQL indexes need nothing."""
+    if db.session.get_bind().dialect.name != "sqlite":
+        return 0
+    db.session.execute(text(f"DELETE FROM {SQLITE_TABLE}"))
+    db.session.execute(text(f"""
+        INSERT INTO {SQLITE_TABLE}(rowid, title, body, owner, kind, ref_id, goal_id)
+        SELECT id * 2, title, '', 'u' || user_id, 'task', id, goal_id FROM task
+    """))
+    db.session.execute(text(f"""
+        INSERT INTO {SQLITE_TABLE}(rowid, title, body, owner, kind, ref_id, goal_id)
+        SELECT id * 2 + 1, title, coalesce(description, ''), 'u' || user_id, 'goal', id, id FROM goal
+    """))
+    db.session.commit()
+    return db.session.execute(text(f"SELECT count(*) FROM {SQLITE_TABLE}")).scalar()
@@ -0,0 +1,44 @@
+import sys
+import time
+from contextlib import contextmanager
+from typing import List, NamedTuple
+
+
+class Step(NamedTuple):
+    name: str
+    ms: float
+    # модулі, вперше імпортовані під час кроку
+    imported: int
+
+
+class StartupProfile:
+    """Wall time and fresh imports per ``create_app`` step; a no-op unless enabled."""
+
+    def __init__(self, enabled: bool):
+        self.enabled = enabled
+        self.steps: List[Step] = []
+
+    @contextmanager
+    def step(self, name: str):
+        if not self.enabled:
+            yield
+            return
+
+        modules = len(sys.modules)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps.append(Step(
+                name,
+                round((time.perf_counter() - started) * 1000, 2),
+                len(sys.modules) - modules,
+            ))
+
+    def total_ms(self) -> float:
+        return round(sum(step.ms for step in self.steps), 2)
+
+    def report(self) -> str:
+        lines = [f"{step.name:<24} {step.ms:>8.2f} ms  {step.imported:>4} modules" for step in self.steps]
+        lines.append(f"{'total':<24} {self.total_ms():>8.2f} ms")
+        return "\n".join(lines)
@@ -0,0 +1,91 @@
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import Date, DateTime, cast, func
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+
+from app.extensions import db
+from app.models.task import Task
+
+
+class completion_date(FunctionElement):
+    """SQL form of ``COALESCE(completed_at, planned_for, created_at)`` as a date.
+
+    Mirrors :func:`app.services.rollup.completion_day` so grouping can happen
+    in the database instead of on hydrated ``Task`` objects.
+    """
+
+    type = Date()
+    inherit_cache = True
+    name = "completion_date"
+
+
+@compiles(completion_date)
+def _compile_completion_date(element, compiler, **kw):
+    # PostgreSQL і решта: приводимо все до timestamp, потім до date
+    expr = cast(
+        func.coalesce(Task.completed_at, cast(Task.planned_for, DateTime), Task.created_at),
+        Date,
+    )
+    return compiler.process(expr, **kw)
+
+
+@compiles(completion_date, "sqlite")
+def _compile_completion_date_sqlite(element, compiler, **kw):
+    # SQLite зберігає дати рядками, CAST(... AS DATE) дав би число
+    expr = func.date(func.coalesce(Task.completed_at, Task.planned_for, Task.created_at))
+    return compiler.process(expr, **kw)
+
+
+def _completed_tasks(user_id: Optional[int], start: Optional[date], end: Optional[date]):
+    day = completion_date()
+    query = db.session.query().select_from(Task).filter(Task.is_done.is_(True))
+    if user_id is not None:
+        query = query.filter(Task.user_id == user_id)
+    if start is not None:
+        query = query.filter(day >= start)
+    if end is not None:
+        query = query.filter(day <= end)
+    return query, day
+
+
+def completion_counts(user_id: int, start: Optional[date] = None, end: Optional[date] = None):
+    """Return ``(day, goal_id, count)`` tuples for one user's completed tasks."""
+    query, day = _completed_tasks(user_id, start, end)
+    return (
+        query
+        .add_columns(day.label("day"), Task.goal_id, func.count(Task.id))
+        .group_by(day, Task.goal_id)
+        .all()
+    )
+
+
+def completion_buckets(user_id: Optional[int] = None):
+    """Select of ``(user_id, goal_id, day, count)`` for every completed task.
+
+    Returned un-executed so it can feed ``INSERT ... SELECT``.
+    """
+    query, day = _completed_tasks(user_id, None, None)
+    return (
+        query
+        .add_columns(Task.user_id, Task.goal_id, day.label("day"), func.count(Task.id).label("count"))
+        .group_by(Task.user_id, Task.goal_id, day)
+        .filter(day.isnot(None))
+        .statement
+    )
+
+
+def active_days(user_id: int):
+    """Distinct completion days of one user, oldest first, straight from ``task``."""
+    query, day = _completed_tasks(user_id, None, None)
+    rows = (
+        query
+        .add_columns(day.label("day"))
+        .filter(day.isnot(None))
+        .group_by(day)
+        .order_by(day.asc())
+    )
+    for (value,) in rows.yield_per(500):
+        # SQLite повертає date() рядком
+        yield date.fromisoformat(value) if isinstance(value, str) else value
@@ -0,0 +1,39 @@
+from datetime import date, timedelta
+from typing import Any, Dict
+
+from app.services import rollup, streaks
+
+HEATMAP_DAYS = 90
+
+
+def summary(user_id: int, today: date) -> Dict[str, Any]:
+    """Completion totals shared by the stats page and the JSON API."""
+    start_90 = today - timedelta(days=HEATMAP_DAYS - 1)
+    start_30 = today - timedelta(days=29)
+    start_week = today - timedelta(days=today.weekday())
+    start_month = today.replace(day=1)
+
+    # усе, що потрібно сторінці, лежить у вікні 90 днів; daily[i] — день start_90 + i
+    daily = [0] * HEATMAP_DAYS
+    goal_counts_30 = {}
+    offset_30 = (start_30 - start_90).days
+
+    for comp_date, goal_id, count in rollup.day_counts(user_id, start_90, today):
+        offset = (comp_date - start_90).days
+        daily[offset] += count
+
+        if offset >= offset_30:
+            goal_counts_30[goal_id] = goal_counts_30.get(goal_id, 0) + count
+
+    streak = streaks.load(user_id)
+
+    return {
+        "start": start_90,
+        "daily": daily,
+        "goal_counts_30": goal_counts_30,
+        "completed_today": daily[-1],
+        "completed_week": sum(daily[(start_week - start_90).days:]),
+        "completed_month": sum(daily[max((start_month - start_90).days, 0):]),
+        "streak": streaks.current_streak(streak, today),
+        "longest_streak": streak.longest,
+    }
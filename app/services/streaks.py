@@ -0,0 +1,155 @@
+from datetime import date, timedelta
+from typing import Iterable, Optional, Tuple
+
+from sqlalchemy import func
+
+from app.extensions import db
+from app.models.daily_completion import DailyCompletion
+from app.models.user_streak import UserStreak
+from app.services import db_routing, stats_queries
+
+Summary = Tuple[Optional[date], Optional[date], int]
+
+
+def summarize(days: Iterable[date]) -> Summary:
+    """Walk ascending active days once: ``(run_start, last_active_day, longest)``."""
+    run_start = last = None
+    longest = 0
+    for day in days:
+        if last is None or day != last + timedelta(days=1):
+            run_start = day
+        last = day
+        longest = max(longest, (last - run_start).days + 1)
+    return run_start, last, longest
+
+
+def _rollup_days(user_id: int):
+    rows = (
+        db.session.query(DailyCompletion.day)
+        .filter(DailyCompletion.user_id == user_id)
+        .group_by(DailyCompletion.day)
+        .having(func.sum(DailyCompletion.count) > 0)
+        .order_by(DailyCompletion.day.asc())
+    )
+    for (day,) in rows.yield_per(500):
+        yield day
+
+
+def _day_total(user_id: int, day: date) -> int:
+    return (
+        db.session.query(func.sum(DailyCompletion.count))
+        .filter(DailyCompletion.user_id == user_id, DailyCompletion.day == day)
+        .scalar()
+        or 0
+    )
+
+
+def _store(user_id: int, values: Summary) -> UserStreak:
+    state = db.session.get(UserStreak, user_id)
+    if state is None:
+        state = UserStreak(user_id=user_id)
+        db.session.add(state)
+    state.run_start, state.last_active_day, state.longest = values
+    return state
+
+
+def recompute(user_id: int) -> UserStreak:
+    """Rebuild the state from the rollup; one pass over the user's active days."""
+    return _store(user_id, summarize(_rollup_days(user_id)))
+
+
+def forget(user_id: Optional[int] = None) -> None:
+    """Drop stored state; it is recomputed on the next read."""
+    query = UserStreak.query
+    if user_id is not None:
+        query = query.filter_by(user_id=user_id)
+    query.delete(synchronize_session=False)
+
+
+def _run_length(state: UserStreak) -> int:
+    if state.last_active_day is None:
+        return 0
+    return (state.last_active_day - state.run_start).days + 1
+
+
+def _apply(state: UserStreak, user_id: int, day: date) -> bool:
+    """Fold one changed day into ``state``. Returns False when only a recompute can tell."""
+    run_start, last = state.run_start, state.last_active_day
+    in_run = last is not None and run_start <= day <= last
+
+    if _day_total(user_id, day) > 0:
+        if in_run:
+            return True
+        if last is None or day > last + timedelta(days=1):
+            state.run_start = state.last_active_day = day
+        elif day == last + timedelta(days=1):
+            state.last_active_day = day
+        else:
+            # день у минулому міг склеїти дві старі серії
+            return False
+        state.longest = max(state.longest, _run_length(state))
+        return True
+
+    if last is None or day > last:
+        return True
+    if not in_run or day == last:
+        # серія обірвалась з кінця або змінилась стара серія: шукати попередню
+        return False
+    if _run_length(state) >= state.longest:
+        # розірвано найдовшу серію, інша може бути коротшою
+        return False
+
+    # активний хвіст після дня, що випав, лишається поточною серією
+    state.run_start = day + timedelta(days=1)
+    return True
+
+
+def touch(user_id: int, days: Iterable[date]) -> None:
+    """Update the stored state after the rollup changed on ``days``.
+
+    Call it in the same transaction, after :func:`app.services.rollup.record`.
+    Extending or splitting the latest run costs one query per day; anything
+    that can change an older run falls back to :func:`recompute`.
+    """
+    state = db.session.get(UserStreak, user_id)
+    if state is None:
+        recompute(user_id)
+        return
+
+    for day in sorted(d for d in set(days) if d):
+        if not _apply(state, user_id, day):
+            recompute(user_id)
+            return
+
+
+def load(user_id: int) -> UserStreak:
+    """Stored state, computed and saved on first use."""
+    current = db.session.get(UserStreak, user_id)
+    if current is None:
+        # репліка може відставати: перерахунок і запис лише на primary
+        with db_routing.use_primary():
+            current = recompute(user_id)
+            db.session.commit()
+    return current
+
+
+def current_streak(streak: UserStreak, today: date) -> int:
+    return _run_length(streak) if streak.last_active_day == today else 0
+
+
+def reconcile(user_id: int, fix: bool = False) -> Optional[Tuple[Summary, Summary]]:
+    """Compare the stored state with one computed from ``task``.
+
+    Returns ``(stored, expected)`` on mismatch, otherwise None. With ``fix``
+    the expected values are written (the caller commits).
+    """
+    expected = summarize(stats_queries.active_days(user_id))
+    current = db.session.get(UserStreak, user_id)
+    stored = (current.run_start, current.last_active_day, current.longest) if current else None
+
+    # стан ще не збережено: нічого розходитись
+    if stored is None or stored == expected:
+        return None
+    if fix:
+        _store(user_id, expected)
+    return stored, expected
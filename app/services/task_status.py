@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from app.extensions import db
+from app.models.task import Task
+from app.services import data_version, goal_counters, rollup, streaks
+
+
+def set_done(task: Task, is_done: bool) -> None:
+    """Mark one task done or open, keeping the rollup, streaks and goal counters in step; commits."""
+    if task.is_done != is_done:
+        previous_day = rollup.completion_day(task) if task.is_done else None
+
+        task.is_done = is_done
+        task.completed_at = datetime.utcnow() if is_done else None
+
+        if is_done:
+            changed_day = rollup.completion_day(task)
+            rollup.record(task.user_id, task.goal_id, changed_day, 1)
+        else:
+            changed_day = previous_day
+            rollup.record(task.user_id, task.goal_id, changed_day, -1)
+        streaks.touch(task.user_id, [changed_day])
+        goal_counters.record(task.goal_id, done=1 if is_done else -1)
+
+    # щойно збережене входження теж змінює сітку тижня
+    data_version.bump(task.user_id)
+    db.session.commit()
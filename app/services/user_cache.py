@@ -0,0 +1,104 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from flask import current_app
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.extensions import db
+from app.models.user import User
+
+
+class UserCache:
+    """Small in-process TTL cache of user rows, keyed by user id.
+
+    Entries are plain column snapshots, never live ORM objects, so nothing
+    leaks between sessions or threads. ``invalidate`` only reaches the
+    current process: writes made elsewhere (other workers, CLI commands)
+    show up once the entry expires, so keep the TTL short.
+    """
+
+    def __init__(self, ttl: float = 5, maxsize: int = 10_000):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[user_id]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, user_id: int, snapshot: Dict[str, Any]) -> None:
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + self.ttl, snapshot)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+            }
+
+
+def init_app(app) -> None:
+    app.extensions["user_cache"] = UserCache(
+        ttl=app.config.get("USER_CACHE_TTL", 5),
+        maxsize=app.config.get("USER_CACHE_SIZE", 10_000),
+    )
+
+
+def get_cache() -> UserCache:
+    return current_app.extensions["user_cache"]
+
+
+def _snapshot(user: User) -> Dict[str, Any]:
+    return {column.key: getattr(user, column.key) for column in User.__table__.columns}
+
+
+def load(user_id: int) -> Optional[User]:
+    """Return the user attached to the current session, from cache when possible."""
+    cache = get_cache()
+    snapshot = cache.get(user_id)
+    if snapshot is None:
+        user = db.session.get(User, user_id)
+        if user is not None:
+            cache.put(user_id, _snapshot(user))
+        return user
+
+    # відновлюємо рядок без SELECT і приєднуємо до сесії, щоб зміни комітились
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return db.session.merge(user, load=False)
+
+
+def invalidate(user_id: int) -> None:
+    get_cache().invalidate(user_id)
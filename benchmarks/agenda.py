@@ -0,0 +1,139 @@
+"""Agenda queries for a user with many open tasks, with and without the partial index.
+
+Usage:
+    python -m benchmarks.agenda --sizes 10000 100000 300000
+
+Each size is the number of open tasks of a single user, with due dates
+spread over two years around today (a fifth without a due date), next
+to as many done tasks that the partial index leaves out. The
+baseline loads every open task and filters in Python, as a page built from
+the existing routes would. The database is a throwaway SQLite file; see
+``benchmarks.database`` for ``--database-url``.
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+from app.extensions import db
+from app.models.goal import Goal
+from app.models.task import Task
+from app.models.user import User
+from app.services import agenda
+from benchmarks.database import add_database_argument, bench_app
+
+INDEX = "ix_task_open_user_id_due_date"
+GOALS_PER_USER = 20
+REPEATS = 20
+
+
+def _seed(user_id, goal_ids, count, rng, today):
+    batch = []
+    for i in range(count * 2):
+        due = today + timedelta(days=rng.randrange(-365, 365)) if rng.random() < 0.8 else None
+        batch.append(dict(
+            title="Task",
+            is_done=i % 2 == 1,
+            planned_for=today - timedelta(days=rng.randrange(365)),
+            due_date=due,
+            goal_id=rng.choice(goal_ids),
+            user_id=user_id,
+            created_at=datetime(2025, 1, 1),
+        ))
+        if len(batch) == 50_000:
+            db.session.execute(Task.__table__.insert(), batch)
+            batch = []
+    if batch:
+        db.session.execute(Task.__table__.insert(), batch)
+    db.session.commit()
+
+
+def _python_filter(user_id, today):
+    # без індексу: усі відкриті задачі користувача, фільтр у Python
+    tasks = Task.query.filter(Task.user_id == user_id, Task.is_done.is_(False)).all()
+    horizon = today + timedelta(days=7)
+    overdue = sorted((t for t in tasks if t.due_date and t.due_date < today), key=lambda t: t.due_date)
+    soon = sorted((t for t in tasks if t.due_date and today <= t.due_date <= horizon), key=lambda t: t.due_date)
+    return overdue[:20], soon[:20]
+
+
+def _median_ms(fn, *args, repeats=REPEATS):
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn(*args)
+        timings.append(time.perf_counter() - started)
+        db.session.expunge_all()
+    return round(statistics.median(timings) * 1000, 3)
+
+
+def _set_index(present):
+    index = next(i for i in Task.__table__.indexes if i.name == INDEX)
+    with db.engine.begin() as conn:
+        if present:
+            index.create(conn, checkfirst=True)
+        else:
+            index.drop(conn, checkfirst=True)
+        conn.exec_driver_sql("ANALYZE") if conn.dialect.name == "sqlite" else conn.exec_driver_sql("ANALYZE task")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 300_000])
+    parser.add_argument(
+        "--python-limit",
+        type=int,
+        default=100_000,
+        help="Skip the load-everything baseline above this many open tasks.",
+    )
+    parser.add_argument("--json", dest="json_path", help="Also write results to this file.")
+    add_database_argument(parser)
+    args = parser.parse_args(argv)
+
+    results = []
+    rng = random.Random(42)
+    today = date.today()
+
+    with bench_app(args.database_url):
+        user = User(email="bench@example.com", password_hash="x")
+        db.session.add(user)
+        db.session.commit()
+        goals = [Goal(title=f"Goal {i}", user_id=user.id) for i in range(GOALS_PER_USER)]
+        db.session.add_all(goals)
+        db.session.commit()
+        goal_ids = [g.id for g in goals]
+        user_id = user.id
+
+        seeded = 0
+        for size in sorted(args.sizes):
+            _seed(user_id, goal_ids, size - seeded, rng, today)
+            seeded = size
+
+            _set_index(True)
+            row = {"open_tasks": size, "partial_index_ms": _median_ms(agenda.build, user_id, today)}
+            _set_index(False)
+            row["no_partial_index_ms"] = _median_ms(agenda.build, user_id, today)
+            _set_index(True)
+            if size <= args.python_limit:
+                row["load_all_ms"] = _median_ms(_python_filter, user_id, today, repeats=3)
+            results.append(row)
+
+            print(
+                f"{size:>9} open tasks | partial index {row['partial_index_ms']:>9} ms"
+                f" | without {row['no_partial_index_ms']:>9} ms"
+                + (f" | load all {row['load_all_ms']:>9} ms" if "load_all_ms" in row else " | load all skipped"),
+                flush=True,
+            )
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
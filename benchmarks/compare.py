@@ -0,0 +1,66 @@
+"""Flag regressions between two ``benchmarks.routes`` reports.
+
+Usage:
+    python -m benchmarks.compare benchmarks/baseline.json benchmarks/current.json --threshold 0.2
+
+A route regresses when its p50 or p95 grew by more than ``threshold``
+(a fraction) and by more than ``--min-ms`` (noise on sub-millisecond pages),
+or when it runs more queries than before. Cold (``routes``) and warm
+(``warm_routes``) numbers are compared separately; warm ones are reported
+as ``size/route (warm)``. Exits with 1 if anything regressed.
+"""
+import argparse
+import json
+import sys
+from typing import List
+
+LATENCY_KEYS = ("p50_ms", "p95_ms")
+# секція звіту -> суфікс у повідомленні
+SECTIONS = (("routes", ""), ("warm_routes", " (warm)"))
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.2, min_ms: float = 1.0) -> List[str]:
+    """Return one message per regression; routes, passes or sizes missing on either side are skipped."""
+    problems = []
+    for size, base_size in baseline.get("sizes", {}).items():
+        cur_size = current.get("sizes", {}).get(size)
+        if cur_size is None:
+            continue
+        for section, suffix in SECTIONS:
+            for route, base in base_size.get(section, {}).items():
+                cur = cur_size.get(section, {}).get(route)
+                if cur is None:
+                    continue
+                name = f"{size}/{route}{suffix}"
+                for key in LATENCY_KEYS:
+                    before, after = base[key], cur[key]
+                    if after - before > min_ms and after > before * (1 + threshold):
+                        problems.append(f"{name}: {key} {before} -> {after} (+{(after / before - 1) * 100:.0f}%)")
+                if cur["queries"] > base["queries"]:
+                    problems.append(f"{name}: queries {base['queries']} -> {cur['queries']}")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--min-ms", type=float, default=1.0)
+    args = parser.parse_args(argv)
+
+    with open(args.baseline, encoding="utf-8") as fh:
+        baseline = json.load(fh)
+    with open(args.current, encoding="utf-8") as fh:
+        current = json.load(fh)
+
+    problems = compare(baseline, current, threshold=args.threshold, min_ms=args.min_ms)
+    for line in problems:
+        print(f"REGRESSION {line}")
+    if not problems:
+        print("no regressions")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
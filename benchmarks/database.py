@@ -0,0 +1,47 @@
+"""Database setup shared by the standalone benchmark scripts.
+
+By default every run gets its own throwaway SQLite file, removed at the
+end. ``--database-url`` points a run at another database instead: missing
+tables are created there, the seeded rows are kept and nothing is dropped.
+DATABASE_URL from the environment is never used.
+"""
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from flask import Flask
+
+from app import create_app
+from app.extensions import db
+
+
+def add_database_argument(parser) -> None:
+    parser.add_argument(
+        "--database-url",
+        help="Run against this database instead of a temporary SQLite file; its tables are never dropped.",
+    )
+
+
+@contextmanager
+def bench_app(database_url: Optional[str] = None) -> Iterator[Flask]:
+    """Yield an app inside its app context, bound to a fresh temp database unless ``database_url`` is given."""
+    tmpdir = None
+    if database_url is None:
+        tmpdir = tempfile.mkdtemp(prefix="skilltracker-bench-")
+        database_url = f"sqlite:///{os.path.join(tmpdir, 'bench.db')}"
+
+    # URI передається в create_app, щоб DATABASE_URL з оточення не підхопився
+    app = create_app({"SQLALCHEMY_DATABASE_URI": database_url})
+    try:
+        with app.app_context():
+            db.create_all()
+            try:
+                yield app
+            finally:
+                db.session.remove()
+                db.engine.dispose()
+    finally:
+        if tmpdir is not None:
+            shutil.rmtree(tmpdir, ignore_errors=True)
@@ -0,0 +1,116 @@
+"""Deterministic synthetic data for benchmarks and load tests.
+
+Usage:
+    DATABASE_URL=sqlite:////tmp/load.db python -m benchmarks.datagen --users 50 --goals 10 --tasks 200
+
+Creates ``users`` accounts (``bench0@example.com`` … with password
+``BENCH_PASSWORD``), each with ``goals`` goals of ``tasks`` tasks spread over
+the last ``days`` days and the coming week. The same arguments and seed give
+the same rows, so runs on different commits are comparable.
+"""
+import argparse
+import random
+import sys
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+from app.extensions import bcrypt, db
+from app.models.goal import Goal
+from app.models.task import Task
+from app.models.user import User
+from app.services import goal_counters, rollup
+
+BENCH_PASSWORD = "bench-password"
+TASK_TYPES = ("study", "practice", "review", None)
+# частка виконаних серед минулих задач
+DONE_RATIO = 0.6
+BATCH = 10_000
+
+
+def email(index: int) -> str:
+    return f"bench{index}@example.com"
+
+
+def generate(users: int, goals: int, tasks: int, days: int = 90, seed: int = 42,
+             today: Optional[date] = None) -> Dict[str, List[int]]:
+    """Insert the data set into the current app's database. Returns the created ids."""
+    rng = random.Random(seed)
+    today = today or date.today()
+    first_day = today - timedelta(days=days - 1)
+    span = days + 7
+
+    # bcrypt навмисно повільний: один хеш на всіх
+    password_hash = bcrypt.generate_password_hash(BENCH_PASSWORD).decode("utf-8")
+    db.session.execute(User.__table__.insert(), [
+        dict(email=email(i), password_hash=password_hash, is_pro=False, created_at=datetime(2024, 1, 1))
+        for i in range(users)
+    ])
+    user_ids = [
+        user_id for (user_id,) in
+        db.session.query(User.id).filter(User.email.in_([email(i) for i in range(users)])).order_by(User.id)
+    ]
+
+    db.session.execute(Goal.__table__.insert(), [
+        dict(title=f"Goal {g + 1}", description=None, user_id=user_id, created_at=datetime(2024, 1, 1))
+        for user_id in user_ids
+        for g in range(goals)
+    ])
+    goal_rows = (
+        db.session.query(Goal.id, Goal.user_id)
+        .filter(Goal.user_id.in_(user_ids))
+        .order_by(Goal.id)
+        .all()
+    )
+
+    batch = []
+    for goal_id, user_id in goal_rows:
+        for t in range(tasks):
+            day = first_day + timedelta(days=rng.randrange(span))
+            done = day <= today and rng.random() < DONE_RATIO
+            created = datetime.combine(day, datetime.min.time())
+            batch.append(dict(
+                title=f"Task {t + 1}",
+                is_done=done,
+                planned_for=day,
+                task_type=rng.choice(TASK_TYPES),
+                due_date=day + timedelta(days=rng.randrange(7)) if rng.random() < 0.3 else None,
+                goal_id=goal_id,
+                user_id=user_id,
+                created_at=created,
+                completed_at=created + timedelta(hours=rng.randrange(8, 23)) if done else None,
+            ))
+            if len(batch) == BATCH:
+                db.session.execute(Task.__table__.insert(), batch)
+                batch = []
+    if batch:
+        db.session.execute(Task.__table__.insert(), batch)
+    db.session.commit()
+
+    # вставка йшла повз сервіси, тож зведення й лічильники будуємо з нуля
+    rollup.rebuild()
+    goal_counters.rebuild()
+    return {"users": user_ids, "goals": [goal_id for goal_id, _ in goal_rows]}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--goals", type=int, default=5, help="Goals per user.")
+    parser.add_argument("--tasks", type=int, default=100, help="Tasks per goal.")
+    parser.add_argument("--days", type=int, default=90, help="History length in days.")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    from app import create_app
+
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        ids = generate(args.users, args.goals, args.tasks, days=args.days, seed=args.seed)
+    print(f"{len(ids['users'])} users, {len(ids['goals'])} goals, {len(ids['goals']) * args.tasks} tasks; "
+          f"log in as {email(0)} / {BENCH_PASSWORD}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
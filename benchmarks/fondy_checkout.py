@@ -0,0 +1,118 @@
+"""Checkout-creation throughput against the local Fondy stub.
+
+Usage:
+    python -m benchmarks.fondy_checkout --users 1 8 32 --requests 400
+
+Compares the old one-connection-per-call ``urllib`` request with the pooled
+``FondyClient`` and its asyncio variant. The stub speaks plain HTTP, so the
+numbers show connection reuse only; against the real API each fresh
+connection also pays a TLS handshake.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.request import Request, urlopen
+
+from app.services.fondy import AsyncFondyClient, FondyClient
+from tests.fondy_stub import FondyStub
+
+SECRET = "bench-secret"
+
+
+def _payload(i):
+    return {"merchant_id": "1", "order_id": f"bench_{i}", "order_desc": "Pro", "amount": 100, "currency": "UAH"}
+
+
+def _urllib_call(url, client, payload):
+    # так працював create_checkout_url до пулу: нове з'єднання на кожен виклик
+    req = Request(url, data=client.request_body(payload), headers={"Content-Type": "application/json"}, method="POST")
+    with urlopen(req, timeout=15) as resp:
+        json.loads(resp.read().decode("utf-8"))
+
+
+def _run_threads(call, users, total):
+    latencies = []
+
+    def one(i):
+        started = time.perf_counter()
+        call(_payload(i))
+        latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=users) as pool:
+        list(pool.map(one, range(total)))
+    return time.perf_counter() - started, latencies
+
+
+def _run_async(client, users, total):
+    latencies = []
+
+    async def main():
+        limit = asyncio.Semaphore(users)
+
+        async def one(i):
+            async with limit:
+                started = time.perf_counter()
+                await client.create_checkout_url(_payload(i))
+                latencies.append(time.perf_counter() - started)
+
+        try:
+            await asyncio.gather(*(one(i) for i in range(total)))
+        finally:
+            await client.close()
+
+    started = time.perf_counter()
+    asyncio.run(main())
+    return time.perf_counter() - started, latencies
+
+
+def _report(name, users, elapsed, latencies, connections):
+    latencies.sort()
+    return {
+        "variant": name,
+        "users": users,
+        "requests": len(latencies),
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 2),
+        "connections": connections,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--delay", type=float, default=0.005, help="Stub response delay, seconds.")
+    parser.add_argument("--json", action="store_true", help="Print one JSON object per line.")
+    args = parser.parse_args()
+
+    results = []
+    for users in args.users:
+        for name in ("urllib", "pooled", "async"):
+            with FondyStub(secret_key=SECRET, delay=args.delay) as stub:
+                client = FondyClient(stub.url, SECRET, pool_size=users)
+                if name == "urllib":
+                    elapsed, latencies = _run_threads(lambda p: _urllib_call(stub.url, client, p), users, args.requests)
+                elif name == "pooled":
+                    elapsed, latencies = _run_threads(client.create_checkout_url, users, args.requests)
+                else:
+                    elapsed, latencies = _run_async(AsyncFondyClient(client), users, args.requests)
+                client.close()
+                results.append(_report(name, users, elapsed, latencies, stub.connections))
+
+    for row in results:
+        if args.json:
+            print(json.dumps(row))
+        else:
+            print(
+                f"{row['variant']:>7}  users={row['users']:<3} {row['rps']:>8} req/s  "
+                f"p50={row['p50_ms']}ms  p95={row['p95_ms']}ms  connections={row['connections']}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Concurrent load against a running server; needs ``pip install locust``.
+
+Usage:
+    DATABASE_URL=sqlite:////tmp/load.db python -m benchmarks.datagen --users 50
+    DATABASE_URL=sqlite:////tmp/load.db flask --app run run --port 8000
+    locust -f benchmarks/locustfile.py --host http://127.0.0.1:8000 -u 50 -r 10
+
+Each simulated user logs in as its own generated account, so requests do
+not all hit one user's rows. Set ``BENCH_USERS`` to the ``--users`` used.
+"""
+import itertools
+import os
+
+from locust import HttpUser, between, task
+
+from benchmarks.datagen import BENCH_PASSWORD, email
+
+_accounts = itertools.cycle(range(int(os.environ.get("BENCH_USERS", "10"))))
+
+
+class PlannerUser(HttpUser):
+    wait_time = between(0.5, 2)
+
+    def on_start(self):
+        self.client.post("/login", data={"email": email(next(_accounts)), "password": BENCH_PASSWORD})
+
+    @task(5)
+    def week(self):
+        self.client.get("/week")
+
+    @task(2)
+    def calendar(self):
+        self.client.get("/calendar")
+
+    @task(2)
+    def stats(self):
+        self.client.get("/stats")
+
+    @task(1)
+    def goals(self):
+        self.client.get("/goals")
+
+    @task(1)
+    def api_tasks(self):
+        self.client.get("/api/v1/tasks", name="/api/v1/tasks")
@@ -0,0 +1,178 @@
+"""Latency percentiles and query counts of the main pages at several data sizes.
+
+Usage:
+    python -m benchmarks.routes --sizes small medium --iterations 50 --json benchmarks/current.json
+    python -m benchmarks.compare benchmarks/baseline.json benchmarks/current.json
+
+Every size gets a fresh SQLite file filled by ``benchmarks.datagen``; the
+requests go through the Flask test client as the first generated user, so
+the numbers are app + database time without a network or a WSGI server.
+
+Each size is measured twice on the same database. The cold pass runs with
+``FRAGMENT_CACHE_BACKEND=none``, so /week and /calendar build their grids
+on every request; its numbers go to ``routes``. The warm pass uses the
+in-memory fragment cache, filled by the warm-up requests as in
+production; its numbers go to ``warm_routes``.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date
+
+from sqlalchemy import event
+
+from app import create_app
+from app.extensions import db
+from benchmarks.datagen import BENCH_PASSWORD, email, generate
+
+# ключ у звіті, мітка в консолі, FRAGMENT_CACHE_BACKEND
+PASSES = (
+    ("routes", "cold", "none"),
+    ("warm_routes", "warm", "memory"),
+)
+
+# users, goals per user, tasks per goal
+SIZES = {
+    "small": (5, 5, 20),
+    "medium": (20, 10, 100),
+    "large": (50, 20, 500),
+}
+
+ROUTES = (
+    ("week", "/week"),
+    ("calendar", "/calendar"),
+    ("stats", "/stats"),
+    ("goals", "/goals"),
+    ("goal_detail", "/goals/{goal_id}"),
+    ("api_tasks", "/api/v1/tasks?from={month_start}&to={today}&limit=100"),
+    ("api_stats", "/api/v1/stats"),
+)
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(1, -(-len(values) * pct // 100))
+    return values[int(rank) - 1]
+
+
+class _QueryCounter:
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, "after_cursor_execute", self._count)
+
+    def _count(self, *args):
+        self.count += 1
+
+
+def _measure(client, url, counter, iterations, warmup):
+    for _ in range(warmup):
+        resp = client.get(url)
+        if resp.status_code != 200:
+            raise RuntimeError(f"GET {url} returned {resp.status_code}")
+
+    latencies, queries = [], []
+    for _ in range(iterations):
+        before = counter.count
+        started = time.perf_counter()
+        client.get(url)
+        latencies.append(time.perf_counter() - started)
+        queries.append(counter.count - before)
+
+    latencies.sort()
+    return {
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p90_ms": round(percentile(latencies, 90) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+        "queries": max(queries),
+    }
+
+
+def _run_pass(app, label, size_name, params, iterations, warmup):
+    with app.app_context():
+        counter = _QueryCounter(db.engine)
+
+    client = app.test_client()
+    client.post("/login", data={"email": email(0), "password": BENCH_PASSWORD})
+
+    results = {}
+    for route, template in ROUTES:
+        results[route] = _measure(client, template.format(**params), counter, iterations, warmup)
+        row = results[route]
+        print(
+            f"{size_name:>7} {label:<4} {route:<12} p50={row['p50_ms']:>8}ms p95={row['p95_ms']:>8}ms "
+            f"p99={row['p99_ms']:>8}ms queries={row['queries']}",
+            flush=True,
+        )
+    return results
+
+
+def run_size(name, iterations, warmup, seed):
+    users, goals, tasks = SIZES[name]
+    tmpdir = tempfile.mkdtemp(prefix="skilltracker-bench-")
+    apps = {
+        key: create_app({
+            "SECRET_KEY": "bench",
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{os.path.join(tmpdir, 'bench.db')}",
+            "FRAGMENT_CACHE_BACKEND": backend,
+        })
+        for key, _, backend in PASSES
+    }
+    try:
+        with apps["routes"].app_context():
+            db.create_all()
+            ids = generate(users, goals, tasks, seed=seed)
+
+        today = date.today()
+        params = {
+            "goal_id": ids["goals"][0],
+            "month_start": today.replace(day=1).isoformat(),
+            "today": today.isoformat(),
+        }
+
+        report = {"users": users, "goals_per_user": goals, "tasks_per_goal": tasks}
+        for key, label, _ in PASSES:
+            report[key] = _run_pass(apps[key], label, name, params, iterations, warmup)
+        return report
+    finally:
+        for app in apps.values():
+            with app.app_context():
+                db.session.remove()
+                db.engine.dispose()
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", choices=sorted(SIZES), default=["small", "medium"])
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", dest="json_path", help="Write results to this file.")
+    args = parser.parse_args(argv)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "iterations": args.iterations,
+            "seed": args.seed,
+        },
+        "sizes": {name: run_size(name, args.iterations, args.warmup, args.seed) for name in args.sizes},
+    }
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""Full-text search latency for a user with many tasks.
+
+Usage:
+    python -m benchmarks.search --tasks 100000 --others 2
+
+Seeds one user with ``tasks`` tasks (titles drawn from a small vocabulary,
+so common prefixes match tens of thousands of rows) plus ``others`` users
+of the same size, then runs a fixed set of queries and prints p50/p95 per
+query. The database is a throwaway SQLite file; see ``benchmarks.database``
+for ``--database-url``.
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+from app.extensions import db
+from app.models.goal import Goal
+from app.models.task import Task
+from app.models.user import User
+from app.services import search
+from benchmarks.database import add_database_argument, bench_app
+
+WORDS = (
+    "read write review practice chapter lesson grammar vocabulary english polish "
+    "german spanish workout run swim stretch budget invoice report meeting draft "
+    "design refactor deploy release test fix bug docs plan call email book course "
+    "video article notes exam quiz project sprint backlog interview portfolio"
+).split()
+QUERIES = ("gr", "gram", "english gram", "report draft", "re", "portfolio interview", "zzz")
+GOALS_PER_USER = 50
+REPEATS = 50
+
+
+def _seed_user(index, tasks, rng, today):
+    user = User(email=f"bench{index}@example.com", password_hash="x")
+    db.session.add(user)
+    db.session.commit()
+    db.session.execute(Goal.__table__.insert(), [
+        dict(title=f"{rng.choice(WORDS).title()} {rng.choice(WORDS)}", description=" ".join(rng.choices(WORDS, k=12)),
+             user_id=user.id, created_at=datetime(2025, 1, 1))
+        for _ in range(GOALS_PER_USER)
+    ])
+    goal_ids = [g for (g,) in db.session.query(Goal.id).filter(Goal.user_id == user.id)]
+    batch = []
+    for _ in range(tasks):
+        batch.append(dict(
+            title=" ".join(rng.choices(WORDS, k=rng.randint(2, 6))).capitalize(),
+            is_done=rng.random() < 0.6,
+            planned_for=today - timedelta(days=rng.randrange(365)),
+            goal_id=rng.choice(goal_ids),
+            user_id=user.id,
+            created_at=datetime(2025, 1, 1),
+        ))
+        if len(batch) == 50_000:
+            db.session.execute(Task.__table__.insert(), batch)
+            batch = []
+    if batch:
+        db.session.execute(Task.__table__.insert(), batch)
+    db.session.commit()
+    return user.id
+
+
+def _timings(user_id, query):
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        hits = search.search(user_id, query)
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return {
+        "query": query,
+        "hits": len(hits),
+        "p50_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(timings[int(len(timings) * 0.95) - 1], 3),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=100_000, help="Tasks of the measured user.")
+    parser.add_argument("--others", type=int, default=2, help="Other users of the same size.")
+    parser.add_argument("--json", dest="json_path", help="Also write results to this file.")
+    add_database_argument(parser)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(42)
+    today = date.today()
+
+    with bench_app(args.database_url):
+        user_id = _seed_user(0, args.tasks, rng, today)
+        for index in range(1, args.others + 1):
+            _seed_user(index, args.tasks, rng, today)
+
+        results = [_timings(user_id, query) for query in QUERIES]
+        for row in results:
+            print(f"{row['query']!r:>24} | {row['hits']:>3} hits | p50 {row['p50_ms']:>8} ms | p95 {row['p95_ms']:>8} ms")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""Compare ORM hydration with SQL-side aggregation for the stats page.
+
+Usage:
+    python -m benchmarks.stats_aggregation --sizes 10000 100000 1000000
+
+Each size is the number of completed tasks owned by a single user. The
+database is a throwaway SQLite file; see ``benchmarks.database`` for
+``--database-url``.
+"""
+import argparse
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+
+from app.extensions import db
+from app.models.goal import Goal
+from app.models.task import Task
+from app.models.user import User
+from app.services import rollup, stats_queries
+from benchmarks.database import add_database_argument, bench_app
+
+GOALS_PER_USER = 20
+HISTORY_DAYS = 3 * 365
+
+
+def _seed(user_id, goal_ids, count, rng):
+    today = date.today()
+    batch = []
+    for _ in range(count):
+        day = today - timedelta(days=rng.randrange(HISTORY_DAYS))
+        batch.append(
+            dict(
+                title="Task",
+                is_done=True,
+                planned_for=day,
+                goal_id=rng.choice(goal_ids),
+                user_id=user_id,
+                created_at=datetime.combine(day, datetime.min.time()),
+                completed_at=datetime.combine(day, datetime.min.time()) + timedelta(hours=rng.randrange(24)),
+            )
+        )
+        if len(batch) == 50_000:
+            db.session.execute(Task.__table__.insert(), batch)
+            batch = []
+    if batch:
+        db.session.execute(Task.__table__.insert(), batch)
+    db.session.commit()
+
+
+def _orm_hydration(user_id, start):
+    tasks = (
+        Task.query
+        .join(Goal)
+        .filter(Goal.user_id == user_id, Task.is_done.is_(True))
+        .all()
+    )
+    counts = {}
+    for task in tasks:
+        day = rollup.completion_day(task)
+        if day and day >= start:
+            counts[(day, task.goal_id)] = counts.get((day, task.goal_id), 0) + 1
+    return len(counts)
+
+
+def _sql_aggregation(user_id, start):
+    return len(stats_queries.completion_counts(user_id, start, date.today()))
+
+
+def _measure(fn, *args):
+    gc.collect()
+    started = time.perf_counter()
+    fn(*args)
+    elapsed = time.perf_counter() - started
+    db.session.expunge_all()
+
+    gc.collect()
+    tracemalloc.start()
+    fn(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    db.session.expunge_all()
+
+    return {"ms": round(elapsed * 1000, 1), "peak_kib": round(peak / 1024, 1)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument(
+        "--orm-limit",
+        type=int,
+        default=100_000,
+        help="Skip the ORM hydration baseline above this many tasks (it needs gigabytes at 1M).",
+    )
+    parser.add_argument("--json", dest="json_path", help="Also write results to this file.")
+    add_database_argument(parser)
+    args = parser.parse_args(argv)
+
+    results = []
+    rng = random.Random(42)
+
+    with bench_app(args.database_url):
+        user = User(email="bench@example.com", password_hash="x")
+        db.session.add(user)
+        db.session.commit()
+        goals = [Goal(title=f"Goal {i}", user_id=user.id) for i in range(GOALS_PER_USER)]
+        db.session.add_all(goals)
+        db.session.commit()
+        goal_ids = [g.id for g in goals]
+        user_id = user.id
+
+        seeded = 0
+        start = date.today() - timedelta(days=89)
+        for size in sorted(args.sizes):
+            _seed(user_id, goal_ids, size - seeded, rng)
+            seeded = size
+
+            row = {"tasks": size, "sql": _measure(_sql_aggregation, user_id, start)}
+            if size <= args.orm_limit:
+                row["orm"] = _measure(_orm_hydration, user_id, start)
+            results.append(row)
+
+            orm = row.get("orm")
+            print(
+                f"{size:>9} tasks | sql {row['sql']['ms']:>8} ms {row['sql']['peak_kib']:>10} KiB"
+                + (f" | orm {orm['ms']:>8} ms {orm['peak_kib']:>10} KiB" if orm else " | orm skipped"),
+                flush=True,
+            )
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
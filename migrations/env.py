@@ -5,6 +5,8 @@ from flask import current_app
 
 from alembic import context
 
+from app.models.search import POSTGRESQL_INDEXES, SQLITE_TABLE
+
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
@@ -51,6 +53,17 @@ def get_metadata():
     return target_db.metadata
 
 
+def include_name(name, type_, parent_names):
+    # FTS5 table search_index, its shadow tables (search_index_data, ...)
+    # and the PostgreSQL GIN indexes are plain DDL outside the models, so
+    # autogenerate must not propose dropping them
+    if type_ == "table":
+        return not name.startswith(SQLITE_TABLE)
+    if type_ == "index":
+        return name not in POSTGRESQL_INDEXES
+    return True
+
+
 def run_migrations_offline():
     """Run migrations in 'offline' mode.
 
@@ -65,7 +78,8 @@ def run_migrations_offline():
     """
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
-        url=url, target_metadata=get_metadata(), literal_binds=True
+        url=url, target_metadata=get_metadata(), literal_binds=True,
+        include_name=include_name
     )
 
     with context.begin_transaction():
@@ -93,6 +107,7 @@ def run_migrations_online():
     conf_args = current_app.extensions['migrate'].configure_args
     if conf_args.get("process_revision_directives") is None:
         conf_args["process_revision_directives"] = process_revision_directives
+    conf_args.setdefault("include_name", include_name)
 
     connectable = get_engine()
 
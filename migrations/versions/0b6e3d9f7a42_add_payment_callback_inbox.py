@@ -0,0 +1,40 @@
+"""Add payment_callback inbox
+
+Revision ID: 0b6e3d9f7a42
+Revises: f4a9d2b6c815
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0b6e3d9f7a42"
+down_revision = "f4a9d2b6c815"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "payment_callback",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("order_id", sa.String(length=64), nullable=False),
+        sa.Column("order_status", sa.String(length=32), nullable=False),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.Column("received_at", sa.DateTime(), nullable=False),
+        sa.Column("processed_at", sa.DateTime(), nullable=True),
+        sa.Column("error", sa.String(length=255), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("order_id", "order_status", name="uq_payment_callback_order_status"),
+    )
+    with op.batch_alter_table("payment_callback", schema=None) as batch_op:
+        batch_op.create_index("ix_payment_callback_processed_at_id", ["processed_at", "id"], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table("payment_callback", schema=None) as batch_op:
+        batch_op.drop_index("ix_payment_callback_processed_at_id")
+
+    op.drop_table("payment_callback")
@@ -0,0 +1,25 @@
+"""Add user (is_pro, pro_until) index for the expiry sweeper
+
+Revision ID: 1c8f5a2e6b37
+Revises: 0b6e3d9f7a42
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "1c8f5a2e6b37"
+down_revision = "0b6e3d9f7a42"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("user", schema=None) as batch_op:
+        batch_op.create_index("ix_user_is_pro_pro_until", ["is_pro", "pro_until"], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table("user", schema=None) as batch_op:
+        batch_op.drop_index("ix_user_is_pro_pro_until")
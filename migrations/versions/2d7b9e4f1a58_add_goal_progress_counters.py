@@ -0,0 +1,42 @@
+"""Add goal progress counters
+
+Revision ID: 2d7b9e4f1a58
+Revises: 1c8f5a2e6b37
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "2d7b9e4f1a58"
+down_revision = "1c8f5a2e6b37"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("goal", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("task_count", sa.Integer(), nullable=False, server_default="0"))
+        batch_op.add_column(sa.Column("done_count", sa.Integer(), nullable=False, server_default="0"))
+        batch_op.add_column(sa.Column("last_completed_at", sa.DateTime(), nullable=True))
+
+    # початкові значення з наявних задач
+    op.execute(
+        """
+        UPDATE goal SET
+            task_count = (SELECT COUNT(*) FROM task WHERE task.goal_id = goal.id),
+            done_count = (SELECT COUNT(*) FROM task WHERE task.goal_id = goal.id AND task.is_done),
+            last_completed_at = (
+                SELECT MAX(task.completed_at) FROM task WHERE task.goal_id = goal.id AND task.is_done
+            )
+        """
+    )
+
+
+def downgrade():
+    with op.batch_alter_table("goal", schema=None) as batch_op:
+        batch_op.drop_column("last_completed_at")
+        batch_op.drop_column("done_count")
+        batch_op.drop_column("task_count")
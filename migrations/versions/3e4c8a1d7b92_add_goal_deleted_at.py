@@ -0,0 +1,28 @@
+"""Add goal deleted_at for soft deletion
+
+Revision ID: 3e4c8a1d7b92
+Revises: 2d7b9e4f1a58
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "3e4c8a1d7b92"
+down_revision = "2d7b9e4f1a58"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("goal", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("deleted_at", sa.DateTime(), nullable=True))
+        batch_op.create_index(batch_op.f("ix_goal_deleted_at"), ["deleted_at"], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table("goal", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_goal_deleted_at"))
+        batch_op.drop_column("deleted_at")
@@ -0,0 +1,36 @@
+"""Add per-user task access indexes
+
+Revision ID: 4b8e0d6c2a71
+Revises: c7d21e5a9f10
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "4b8e0d6c2a71"
+down_revision = "c7d21e5a9f10"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("goal", schema=None) as batch_op:
+        batch_op.create_index(batch_op.f("ix_goal_user_id"), ["user_id"], unique=False)
+
+    with op.batch_alter_table("task", schema=None) as batch_op:
+        batch_op.create_index("ix_task_goal_id_planned_for", ["goal_id", "planned_for"], unique=False)
+        batch_op.create_index(
+            "ix_task_goal_id_is_done_completed_at", ["goal_id", "is_done", "completed_at"], unique=False
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("task", schema=None) as batch_op:
+        batch_op.drop_index("ix_task_goal_id_is_done_completed_at")
+        batch_op.drop_index("ix_task_goal_id_planned_for")
+
+    with op.batch_alter_table("goal", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_goal_user_id"))
@@ -0,0 +1,31 @@
+"""Add partial index on open tasks by (user_id, due_date)
+
+Revision ID: 4f1a6c3e8d25
+Revises: 3e4c8a1d7b92
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "4f1a6c3e8d25"
+down_revision = "3e4c8a1d7b92"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_task_open_user_id_due_date",
+        "task",
+        ["user_id", "due_date", "goal_id"],
+        unique=False,
+        sqlite_where=sa.text("is_done = 0 AND due_date IS NOT NULL"),
+        postgresql_where=sa.text("NOT is_done AND due_date IS NOT NULL"),
+    )
+
+
+def downgrade():
+    op.drop_index("ix_task_open_user_id_due_date", table_name="task")
@@ -0,0 +1,43 @@
+"""Add task rollover opt-in, marker and open-task index
+
+Revision ID: 5a2d7f9b3c61
+Revises: 4f1a6c3e8d25
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "5a2d7f9b3c61"
+down_revision = "4f1a6c3e8d25"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("user", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("rollover_tasks", sa.Boolean(), nullable=False, server_default="0"))
+
+    with op.batch_alter_table("task", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("rolled_over_from", sa.Date(), nullable=True))
+
+    op.create_index(
+        "ix_task_open_user_id_planned_for",
+        "task",
+        ["user_id", "planned_for"],
+        unique=False,
+        sqlite_where=sa.text("is_done = 0"),
+        postgresql_where=sa.text("NOT is_done"),
+    )
+
+
+def downgrade():
+    op.drop_index("ix_task_open_user_id_planned_for", table_name="task")
+
+    with op.batch_alter_table("task", schema=None) as batch_op:
+        batch_op.drop_column("rolled_over_from")
+
+    with op.batch_alter_table("user", schema=None) as batch_op:
+        batch_op.drop_column("rollover_tasks")
@@ -0,0 +1,81 @@
+"""Add full-text search over task and goal titles
+
+Revision ID: 6b3e8a0c4d72
+Revises: 5a2d7f9b3c61
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "6b3e8a0c4d72"
+down_revision = "5a2d7f9b3c61"
+branch_labels = None
+depends_on = None
+
+TASK_ROW = "new.id * 2, new.title, '', 'u' || new.user_id, 'task', new.id, new.goal_id"
+GOAL_ROW = "new.id * 2 + 1, new.title, coalesce(new.description, ''), 'u' || new.user_id, 'goal', new.id, new.id"
+INSERT = "INSERT INTO search_index(rowid, title, body, owner, kind, ref_id, goal_id)"
+
+SQLITE_UPGRADE = [
+    """CREATE VIRTUAL TABLE search_index USING fts5(
+        title, body, owner, kind UNINDEXED, ref_id UNINDEXED, goal_id UNINDEXED,
+        tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+    )""",
+    f"""CREATE TRIGGER task_search_insert AFTER INSERT ON task BEGIN
+        {INSERT} VALUES ({TASK_ROW});
+    END""",
+    f"""CREATE TRIGGER task_search_update AFTER UPDATE OF title, user_id, goal_id ON task BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 2;
+        {INSERT} VALUES ({TASK_ROW});
+    END""",
+    """CREATE TRIGGER task_search_delete AFTER DELETE ON task BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 2;
+    END""",
+    f"""CREATE TRIGGER goal_search_insert AFTER INSERT ON goal BEGIN
+        {INSERT} VALUES ({GOAL_ROW});
+    END""",
+    f"""CREATE TRIGGER goal_search_update AFTER UPDATE OF title, description, user_id ON goal BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 2 + 1;
+        {INSERT} VALUES ({GOAL_ROW});
+    END""",
+    """CREATE TRIGGER goal_search_delete AFTER DELETE ON goal BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 2 + 1;
+    END""",
+    f"{INSERT} SELECT id * 2, title, '', 'u' || user_id, 'task', id, goal_id FROM task",
+    f"{INSERT} SELECT id * 2 + 1, title, coalesce(description, ''), 'u' || user_id, 'goal', id, id FROM goal",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS goal_search_delete",
+    "DROP TRIGGER IF EXISTS goal_search_update",
+    "DROP TRIGGER IF EXISTS goal_search_insert",
+    "DROP TRIGGER IF EXISTS task_search_delete",
+    "DROP TRIGGER IF EXISTS task_search_update",
+    "DROP TRIGGER IF EXISTS task_search_insert",
+    "DROP TABLE IF EXISTS search_index",
+]
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        for statement in SQLITE_UPGRADE:
+            op.execute(statement)
+    elif dialect == "postgresql":
+        op.execute("CREATE INDEX ix_task_title_search ON task USING gin (to_tsvector('simple', title))")
+        op.execute(
+            "CREATE INDEX ix_goal_search ON goal "
+            "USING gin (to_tsvector('simple', title || ' ' || coalesce(description, '')))"
+        )
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        for statement in SQLITE_DOWNGRADE:
+            op.execute(statement)
+    elif dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_goal_search")
+        op.execute("DROP INDEX IF EXISTS ix_task_title_search")
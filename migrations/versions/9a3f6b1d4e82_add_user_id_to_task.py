@@ -0,0 +1,38 @@
+"""Add denormalized user_id to task
+
+Revision ID: 9a3f6b1d4e82
+Revises: 4b8e0d6c2a71
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "9a3f6b1d4e82"
+down_revision = "4b8e0d6c2a71"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("task", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("user_id", sa.Integer(), nullable=True))
+
+    # backfill з власника цілі
+    op.execute(
+        "UPDATE task SET user_id = (SELECT goal.user_id FROM goal WHERE goal.id = task.goal_id)"
+    )
+
+    with op.batch_alter_table("task", schema=None) as batch_op:
+        batch_op.alter_column("user_id", existing_type=sa.Integer(), nullable=False)
+        batch_op.create_foreign_key("fk_task_user_id_user", "user", ["user_id"], ["id"])
+        batch_op.create_index("ix_task_user_id_planned_for", ["user_id", "planned_for"], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table("task", schema=None) as batch_op:
+        batch_op.drop_index("ix_task_user_id_planned_for")
+        batch_op.drop_constraint("fk_task_user_id_user", type_="foreignkey")
+        batch_op.drop_column("user_id")
@@ -0,0 +1,42 @@
+"""Add daily completion rollup
+
+Revision ID: c7d21e5a9f10
+Revises: f2c9b0b8c6a1
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c7d21e5a9f10"
+down_revision = "f2c9b0b8c6a1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "daily_completion",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("goal_id", sa.Integer(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["goal_id"], ["goal.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id", "day", "goal_id", name="uq_daily_completion_user_day_goal"),
+    )
+    with op.batch_alter_table("daily_completion", schema=None) as batch_op:
+        batch_op.create_index(batch_op.f("ix_daily_completion_goal_id"), ["goal_id"], unique=False)
+
+    # Existing databases: run `flask stats rebuild-rollup` after upgrading.
+
+
+def downgrade():
+    with op.batch_alter_table("daily_completion", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_daily_completion_goal_id"))
+
+    op.drop_table("daily_completion")
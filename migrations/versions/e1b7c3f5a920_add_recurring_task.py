@@ -0,0 +1,56 @@
+"""Add recurring_task and task.recurrence_id
+
+Revision ID: e1b7c3f5a920
+Revises: d5e8a2c4b913
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "e1b7c3f5a920"
+down_revision = "d5e8a2c4b913"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "recurring_task",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("goal_id", sa.Integer(), nullable=False),
+        sa.Column("title", sa.String(length=200), nullable=False),
+        sa.Column("task_type", sa.String(length=20), nullable=True),
+        sa.Column("rule", sa.String(length=16), nullable=False),
+        sa.Column("interval_days", sa.Integer(), nullable=True),
+        sa.Column("starts_on", sa.Date(), nullable=False),
+        sa.Column("ends_on", sa.Date(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["goal_id"], ["goal.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    with op.batch_alter_table("recurring_task", schema=None) as batch_op:
+        batch_op.create_index(batch_op.f("ix_recurring_task_user_id"), ["user_id"], unique=False)
+        batch_op.create_index(batch_op.f("ix_recurring_task_goal_id"), ["goal_id"], unique=False)
+
+    with op.batch_alter_table("task", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("recurrence_id", sa.Integer(), nullable=True))
+        batch_op.create_foreign_key("fk_task_recurrence_id_recurring_task", "recurring_task", ["recurrence_id"], ["id"])
+        batch_op.create_unique_constraint("uq_task_recurrence_id_planned_for", ["recurrence_id", "planned_for"])
+
+
+def downgrade():
+    with op.batch_alter_table("task", schema=None) as batch_op:
+        batch_op.drop_constraint("uq_task_recurrence_id_planned_for", type_="unique")
+        batch_op.drop_constraint("fk_task_recurrence_id_recurring_task", type_="foreignkey")
+        batch_op.drop_column("recurrence_id")
+
+    with op.batch_alter_table("recurring_task", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_recurring_task_goal_id"))
+        batch_op.drop_index(batch_op.f("ix_recurring_task_user_id"))
+
+    op.drop_table("recurring_task")
@@ -0,0 +1,34 @@
+"""Add user_streak
+
+Revision ID: f4a9d2b6c815
+Revises: e1b7c3f5a920
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "f4a9d2b6c815"
+down_revision = "e1b7c3f5a920"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "user_streak",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("run_start", sa.Date(), nullable=True),
+        sa.Column("last_active_day", sa.Date(), nullable=True),
+        sa.Column("longest", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"]),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+
+    # State is computed from the rollup on first read; no backfill needed.
+
+
+def downgrade():
+    op.drop_table("user_streak")
@@ -6,17 +6,21 @@ from app.extensions import db
 
 @pytest.fixture()
 def app(tmp_path):
-    app = create_app()
     db_path = tmp_path / "test.db"
-    app.config.update(
-        TESTING=True,
-        SECRET_KEY="test-secret-key",
-        SQLALCHEMY_DATABASE_URI=f"sqlite:///{db_path}",
-    )
+    # URI має бути відомий до db.init_app, інакше рушій дивиться в робочу базу
+    app = create_app({
+        "TESTING": True,
+        "SECRET_KEY": "test-secret-key",
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{db_path}",
+    })
 
     with app.app_context():
         db.create_all()
-        yield app
+
+    # requests push their own app context, like in production
+    yield app
+
+    with app.app_context():
         db.session.remove()
         db.drop_all()
 
@@ -0,0 +1,113 @@
+"""Local stand-in for the Fondy checkout API, used by tests and benchmarks.
+
+    with FondyStub(secret_key="test", fail_first=1) as stub:
+        app.config["FONDY_API_URL"] = stub.url
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from app.services.fondy import generate_signature
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    # заголовки й тіло йдуть окремими write; без цього Nagle + delayed ACK дають ~40 мс
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def setup(self):
+        # простійне keep-alive з'єднання сервер закриває через idle_timeout
+        self.timeout = self.server.idle_timeout
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_POST(self):
+        server = self.server
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+        with server.lock:
+            server.requests += 1
+            failing = server.fail_first > 0
+            if failing:
+                server.fail_first -= 1
+
+        if server.delay:
+            time.sleep(server.delay)
+
+        if failing:
+            self._reply(503, {"error": "unavailable"})
+            return
+
+        request = json.loads(body.decode("utf-8"))["request"]
+        server.orders.append(request)
+        response = {
+            "response_status": "success",
+            "checkout_url": f"https://pay.example.test/checkout/{request['order_id']}",
+            "order_id": request["order_id"],
+        }
+        response["signature"] = generate_signature(response, server.secret_key)
+        self._reply(200, {"response": response})
+
+    def _reply(self, status, payload):
+        raw = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def handle_error(self, request, client_address):
+        # клієнт обірвав з'єднання по таймауту — для заглушки це норма
+        pass
+
+
+class FondyStub:
+    def __init__(
+        self,
+        secret_key: str = "test-secret",
+        delay: float = 0.0,
+        fail_first: int = 0,
+        idle_timeout: Optional[float] = None,
+    ):
+        self.server = _Server(("127.0.0.1", 0), _Handler)
+        self.server.idle_timeout = idle_timeout
+        self.server.secret_key = secret_key
+        self.server.delay = delay
+        self.server.fail_first = fail_first
+        self.server.lock = threading.Lock()
+        self.server.connections = 0
+        self.server.requests = 0
+        self.server.orders = []
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address
+        return f"http://{host}:{port}/api/checkout/url"
+
+    @property
+    def connections(self) -> int:
+        return self.server.connections
+
+    @property
+    def requests(self) -> int:
+        return self.server.requests
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
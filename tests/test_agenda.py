@@ -0,0 +1,115 @@
+from datetime import date, timedelta
+
+from sqlalchemy import event
+
+from app.extensions import db, bcrypt
+from app.models.user import User
+from app.models.goal import Goal
+from app.models.task import Task
+from app.services import agenda
+
+
+def _create_user(email="test@example.com", password="password123"):
+    password_hash = bcrypt.generate_password_hash(password).decode("utf-8")
+    user = User(email=email, password_hash=password_hash)
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def _login(client, email="test@example.com", password="password123"):
+    return client.post(
+        "/login",
+        data={"email": email, "password": password},
+        follow_redirects=True,
+    )
+
+
+def _seed(today):
+    user = _create_user()
+    other = _create_user("other@example.com")
+    goal = Goal(title="Exam", user_id=user.id)
+    other_goal = Goal(title="Other", user_id=other.id)
+    db.session.add_all([goal, other_goal])
+    db.session.flush()
+
+    def task(title, due, done=False, owner=goal):
+        db.session.add(Task(title=title, goal_id=owner.id, user_id=owner.user_id, due_date=due, is_done=done))
+
+    task("late-2", today - timedelta(days=2))
+    task("late-5", today - timedelta(days=5))
+    task("late-done", today - timedelta(days=1), done=True)
+    task("due-today", today)
+    task("due-3", today + timedelta(days=3))
+    task("due-30", today + timedelta(days=30))
+    task("no-due", None)
+    task("someone-else", today - timedelta(days=1), owner=other_goal)
+    db.session.commit()
+    return user.id
+
+
+def test_build_splits_overdue_and_due_soon(app):
+    today = date(2026, 5, 10)
+    with app.app_context():
+        user_id = _seed(today)
+        result = agenda.build(user_id, today, days=7, limit=20)
+
+        assert [item.title for item in result.overdue] == ["late-5", "late-2"]
+        assert [item.title for item in result.due_soon] == ["due-today", "due-3"]
+        assert (result.overdue_total, result.due_soon_total) == (2, 2)
+        assert result.overdue[0].goal_title == "Exam"
+
+        limited = agenda.build(user_id, today, days=60, limit=1)
+        assert [item.title for item in limited.due_soon] == ["due-today"]
+        assert limited.due_soon_total == 3
+
+
+def test_queries_use_partial_index(app):
+    today = date.today()
+    with app.app_context():
+        user_id = _seed(today)
+        statements = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        event.listen(db.engine, "before_cursor_execute", _capture)
+        try:
+            agenda.build(user_id, today)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", _capture)
+
+        assert len(statements) == 4
+        for statement, parameters in statements:
+            plan = db.session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+            assert any("ix_task_open_user_id_due_date" in row[-1] for row in plan), plan
+
+
+def test_agenda_endpoint_and_week_panel(app, client):
+    today = date.today()
+    with app.app_context():
+        _seed(today)
+    _login(client)
+
+    resp = client.get("/api/v1/agenda?days=7")
+    data = resp.get_json()
+    assert [item["title"] for item in data["overdue"]] == ["late-5", "late-2"]
+    assert data["due_soon"][0] == {
+        "id": data["due_soon"][0]["id"],
+        "title": "due-today",
+        "due_date": today.isoformat(),
+        "goal_id": data["due_soon"][0]["goal_id"],
+        "goal_title": "Exam",
+    }
+    assert client.get("/api/v1/agenda?days=7", headers={"If-None-Match": resp.headers["ETag"]}).status_code == 304
+    assert client.get("/api/v1/agenda?days=999").status_code == 400
+
+    week = client.get("/week").get_data(as_text=True)
+    assert "Deadlines" in week and "late-5" in week and "someone-else" not in week
+
+    # виконана задача зникає з agenda: нова версія даних — новий список
+    with app.app_context():
+        late = Task.query.filter_by(title="late-5").one().id
+    client.post(f"/tasks/{late}/toggle")
+    titles = [item["title"] for item in client.get("/api/v1/agenda").get_json()["overdue"]]
+    assert titles == ["late-2"]
@@ -0,0 +1,218 @@
+from datetime import date, timedelta
+
+from app.extensions import db, bcrypt
+from app.models.user import User
+from app.models.goal import Goal
+from app.models.task import Task
+from app.routes.api import encode_cursor
+
+
+def _create_user(email="test@example.com", password="password123"):
+    password_hash = bcrypt.generate_password_hash(password).decode("utf-8")
+    user = User(email=email, password_hash=password_hash)
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def _login(client, email="test@example.com", password="password123"):
+    return client.post(
+        "/login",
+        data={"email": email, "password": password},
+        follow_redirects=True,
+    )
+
+
+def test_api_requires_login(client):
+    resp = client.get("/api/v1/tasks")
+    assert resp.status_code == 401
+    assert resp.get_json() == {"error": "unauthorized"}
+
+
+def test_tasks_keyset_pagination_and_projection(app, client):
+    today = date.today()
+    with app.app_context():
+        user = _create_user()
+        other = _create_user(email="other@example.com")
+        goal = Goal(title="Goal", user_id=user.id)
+        other_goal = Goal(title="Other", user_id=other.id)
+        db.session.add_all([goal, other_goal])
+        db.session.commit()
+
+        for offset in range(3):
+            for n in range(2):
+                db.session.add(Task(title=f"T{offset}-{n}", goal_id=goal.id, planned_for=today + timedelta(days=offset)))
+        db.session.add(Task(title="Foreign", goal_id=other_goal.id, planned_for=today))
+        db.session.add(Task(title="Outside", goal_id=goal.id, planned_for=today + timedelta(days=30)))
+        db.session.commit()
+
+    _login(client)
+
+    titles = []
+    cursor = None
+    pages = 0
+    while True:
+        params = {"from": today.isoformat(), "to": (today + timedelta(days=6)).isoformat(),
+                  "limit": 4, "fields": "title"}
+        if cursor:
+            params["cursor"] = cursor
+        resp = client.get("/api/v1/tasks", query_string=params)
+        assert resp.status_code == 200
+        body = resp.get_json()
+        assert all(set(item) == {"title"} for item in body["data"])
+        titles += [item["title"] for item in body["data"]]
+        pages += 1
+        cursor = body["next_cursor"]
+        if not cursor:
+            break
+
+    assert pages == 2
+    assert titles == ["T0-0", "T0-1", "T1-0", "T1-1", "T2-0", "T2-1"]
+
+
+def test_bad_parameters_are_rejected(app, client):
+    with app.app_context():
+        _create_user()
+    _login(client)
+
+    assert client.get("/api/v1/tasks?fields=password").status_code == 400
+    assert client.get("/api/v1/tasks?from=yesterday").status_code == 400
+    assert client.get("/api/v1/tasks?cursor=%%%").status_code == 400
+
+    # курсор правильної довжини, але з чужими типами — теж 400, а не помилка БД
+    for path, values in (
+        ("/api/v1/goals", ["1 OR 1=1"]),
+        ("/api/v1/goals", [[1]]),
+        ("/api/v1/goals", [True]),
+        ("/api/v1/tasks", ["2026-01-01", {"id": 1}]),
+        ("/api/v1/tasks", [20260101, 1]),
+    ):
+        resp = client.get(path, query_string={"cursor": encode_cursor(*values)})
+        assert resp.status_code == 400
+        assert resp.get_json() == {"error": "invalid cursor"}
+
+
+def test_goals_and_stats(app, client):
+    with app.app_context():
+        user = _create_user()
+        goals = [Goal(title=f"Goal {i}", user_id=user.id) for i in range(3)]
+        db.session.add_all(goals)
+        db.session.commit()
+        task = Task(title="Done", goal_id=goals[0].id)
+        db.session.add(task)
+        db.session.commit()
+        task_id = task.id
+
+    _login(client)
+    client.post(f"/tasks/{task_id}/toggle")
+
+    first = client.get("/api/v1/goals?limit=2&fields=id,title").get_json()
+    second = client.get(f"/api/v1/goals?limit=2&cursor={first['next_cursor']}").get_json()
+    assert [g["title"] for g in first["data"] + second["data"]] == ["Goal 2", "Goal 1", "Goal 0"]
+    assert second["next_cursor"] is None
+
+    stats = client.get("/api/v1/stats").get_json()
+    assert stats["completed_today"] == 1
+    assert stats["daily"][-1] == 1
+    assert len(stats["daily"]) == 90
+
+
+def test_bulk_create_validates_ownership_per_item(app, client):
+    today = date.today()
+    with app.app_context():
+        user = _create_user()
+        other = _create_user(email="other@example.com")
+        goal = Goal(title="Goal", user_id=user.id)
+        other_goal = Goal(title="Other", user_id=other.id)
+        db.session.add_all([goal, other_goal])
+        db.session.commit()
+        goal_id, other_goal_id, user_id = goal.id, other_goal.id, user.id
+
+    _login(client)
+    resp = client.post("/api/v1/tasks/bulk", json={"tasks": [
+        {"title": "Mon", "goal_id": goal_id, "planned_for": today.isoformat(), "task_type": "must"},
+        {"title": "Stolen", "goal_id": other_goal_id},
+        {"title": "", "goal_id": goal_id},
+        {"title": "Bad date", "goal_id": goal_id, "planned_for": "tomorrow"},
+        {"title": "Tue", "goal_id": goal_id, "planned_for": (today + timedelta(days=1)).isoformat()},
+        {"title": "Typed", "goal_id": goal_id, "task_type": ["must"]},
+        {"title": "Typed", "goal_id": goal_id, "task_type": "urgent"},
+        {"title": "x" * 201, "goal_id": goal_id},
+        {"title": {"text": "Object"}, "goal_id": goal_id},
+    ]})
+    assert resp.status_code == 200
+    results = resp.get_json()["results"]
+    assert [r["status"] for r in results] == ["created", "error", "error", "error", "created"] + ["error"] * 4
+    assert [r["error"] for r in results[5:]] == ["unknown task_type", "unknown task_type", "title too long", "title is required"]
+
+    with app.app_context():
+        created = db.session.get(Task, results[0]["id"])
+        assert created.title == "Mon"
+        assert created.user_id == user_id
+        assert created.task_type == "must"
+        assert db.session.get(Task, results[4]["id"]).title == "Tue"
+        assert Task.query.count() == 2
+
+
+def test_bulk_toggle_updates_tasks_and_rollup(app, client):
+    with app.app_context():
+        user = _create_user()
+        other = _create_user(email="other@example.com")
+        goal = Goal(title="Goal", user_id=user.id)
+        other_goal = Goal(title="Other", user_id=other.id)
+        db.session.add_all([goal, other_goal])
+        db.session.commit()
+        tasks = [Task(title=f"T{i}", goal_id=goal.id) for i in range(3)]
+        foreign = Task(title="Foreign", goal_id=other_goal.id)
+        db.session.add_all(tasks + [foreign])
+        db.session.commit()
+        ids = [t.id for t in tasks]
+        foreign_id = foreign.id
+
+    _login(client)
+    resp = client.post("/api/v1/tasks/bulk-toggle", json={"ids": ids + [foreign_id, ids[0]]})
+    results = resp.get_json()["results"]
+    assert [r["status"] for r in results] == ["ok", "ok", "ok", "not_found", "ok"]
+    assert all(r["is_done"] for r in results if r["status"] == "ok")
+
+    assert client.get("/api/v1/stats").get_json()["completed_today"] == 3
+
+    resp = client.post("/api/v1/tasks/bulk-toggle", json={"ids": ids[:2], "done": False})
+    assert [r["is_done"] for r in resp.get_json()["results"]] == [False, False]
+
+    with app.app_context():
+        assert [db.session.get(Task, i).is_done for i in ids] == [False, False, True]
+        assert db.session.get(Task, foreign_id).is_done is False
+    assert client.get("/api/v1/stats").get_json()["completed_today"] == 1
+
+
+def test_bulk_endpoints_reject_non_integer_ids(app, client):
+    with app.app_context():
+        user = _create_user()
+        goal = Goal(title="Goal", user_id=user.id)
+        db.session.add(goal)
+        db.session.commit()
+        task = Task(title="T", goal_id=goal.id)
+        db.session.add(task)
+        db.session.commit()
+        goal_id, task_id = goal.id, task.id
+    # id 1 існує, тож True == 1 пройшло б перевірку власника
+    assert goal_id == 1 and task_id == 1
+
+    _login(client)
+    resp = client.post("/api/v1/tasks/bulk", json={"tasks": [
+        {"title": "List", "goal_id": [goal_id]},
+        {"title": "Bool", "goal_id": True},
+        {"title": "Object", "goal_id": {"id": goal_id}},
+        {"title": "Ok", "goal_id": goal_id},
+    ]})
+    assert resp.status_code == 200
+    assert [r["status"] for r in resp.get_json()["results"]] == ["error", "error", "error", "created"]
+
+    resp = client.post("/api/v1/tasks/bulk-toggle", json={"ids": [[task_id], True, "1", {"id": task_id}, task_id]})
+    assert resp.status_code == 200
+    assert [r["status"] for r in resp.get_json()["results"]] == ["not_found"] * 4 + ["ok"]
+
+    with app.app_context():
+        assert Task.query.count() == 2
+        assert db.session.get(Task, task_id).is_done is True
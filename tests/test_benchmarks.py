@@ -0,0 +1,67 @@
+import os
+from datetime import date
+
+from app.extensions import db
+from app.models.task import Task
+from app.models.user import User
+from benchmarks.compare import compare
+from benchmarks.database import bench_app
+from benchmarks.datagen import generate
+
+
+def _rows():
+    return [
+        (t.user_id, t.goal_id, t.planned_for, t.is_done, t.task_type)
+        for t in Task.query.order_by(Task.id)
+    ]
+
+
+def test_datagen_is_deterministic(app):
+    with app.app_context():
+        ids = generate(2, 3, 4, days=30, seed=7, today=date(2026, 3, 10))
+        first = _rows()
+        assert len(ids["users"]) == 2 and len(ids["goals"]) == 6
+        assert len(first) == 24
+        assert all(date(2026, 2, 9) <= day <= date(2026, 3, 17) for _, _, day, _, _ in first)
+        # виконані лише минулі
+        assert all(day <= date(2026, 3, 10) for _, _, day, done, _ in first if done)
+
+        db.drop_all()
+        db.create_all()
+        generate(2, 3, 4, days=30, seed=7, today=date(2026, 3, 10))
+        assert _rows() == first
+
+
+def _report(p50, p95, queries, section="routes"):
+    return {"sizes": {"small": {section: {"week": {"p50_ms": p50, "p95_ms": p95, "queries": queries}}}}}
+
+
+def test_compare_flags_slower_routes_and_extra_queries():
+    baseline = _report(10.0, 20.0, 3)
+
+    assert compare(baseline, _report(11.0, 21.0, 3)) == []
+    # +50%, але менше за min_ms — шум
+    assert compare(_report(0.4, 0.6, 3), _report(0.6, 0.9, 3)) == []
+
+    problems = compare(baseline, _report(10.0, 30.0, 4))
+    assert problems == ["small/week: p95_ms 20.0 -> 30.0 (+50%)", "small/week: queries 3 -> 4"]
+
+    # холодні й теплі числа порівнюються окремо
+    warm = compare(_report(10.0, 20.0, 0, "warm_routes"), _report(10.0, 20.0, 1, "warm_routes"))
+    assert warm == ["small/week (warm): queries 0 -> 1"]
+    assert compare(baseline, _report(10.0, 30.0, 4, "warm_routes")) == []
+
+
+def test_bench_app_never_drops_an_external_database(tmp_path):
+    url = f"sqlite:///{tmp_path / 'external.db'}"
+    with bench_app(url):
+        db.session.add(User(email="keep@example.com", password_hash="x"))
+        db.session.commit()
+    with bench_app(url):
+        assert User.query.one().email == "keep@example.com"
+
+    with bench_app() as app:
+        path = db.engine.url.database
+        assert app.config["SQLALCHEMY_DATABASE_URI"] != url and os.path.exists(path)
+    # тимчасова база видаляється разом із каталогом
+    assert not os.path.exists(os.path.dirname(path))
@@ -0,0 +1,39 @@
+from datetime import date, timedelta
+
+from app.services import calendar_layout
+
+
+def test_month_layout_is_monday_first_and_memoized():
+    layout = calendar_layout.month(2026, 2)
+
+    assert layout.cells[:6] == (None,) * 6  # 1 лютого 2026 — неділя
+    assert layout.cells[6] == date(2026, 2, 1)
+    assert layout.last_day == date(2026, 2, 28)
+    assert len(layout.cells) % 7 == 0
+    assert (layout.prev_ym, layout.next_ym) == ("2026-01", "2026-03")
+    assert calendar_layout.month(2026, 2) is layout
+
+    december = calendar_layout.month(2026, 12)
+    assert (december.prev_ym, december.next_ym) == ("2026-11", "2027-01")
+
+
+def test_heatmap_layout_matches_day_grid():
+    start = date(2026, 7, 22)
+    span = 90
+    layout = calendar_layout.heatmap(start, span)
+
+    # та сама сітка, що й раніше будувалась циклом по датах
+    end = start + timedelta(days=span - 1)
+    current = start - timedelta(days=start.weekday())
+    expected = []
+    while current <= end:
+        expected.append(tuple(
+            (current + timedelta(days=i) - start).days if start <= current + timedelta(days=i) <= end else None
+            for i in range(7)
+        ))
+        current += timedelta(days=7)
+
+    assert layout.weeks == tuple(expected)
+    assert layout.labels[0] == "2026-07-22"
+    assert layout.labels[-1] == end.isoformat()
+    assert calendar_layout.heatmap(start, span) is layout
@@ -0,0 +1,84 @@
+from app.extensions import db, bcrypt
+from app.models.user import User
+from app.models.payment import Payment
+from app.models.payment_callback import PaymentCallback
+from app.services.fondy import generate_signature
+
+SECRET = "test-secret"
+
+
+def _create_user(email="test@example.com", password="password123"):
+    password_hash = bcrypt.generate_password_hash(password).decode("utf-8")
+    user = User(email=email, password_hash=password_hash)
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def _signed(**fields):
+    fields["signature"] = generate_signature(fields, SECRET)
+    return fields
+
+
+def _setup(app, order_id="pro_1"):
+    app.config["FONDY_SECRET_KEY"] = SECRET
+    with app.app_context():
+        user = _create_user()
+        db.session.add(Payment(user_id=user.id, order_id=order_id, amount=100, currency="UAH", status="pending"))
+        db.session.commit()
+        return user.id
+
+
+def test_callback_is_queued_and_deduplicated(app, client):
+    _setup(app)
+    payload = _signed(order_id="pro_1", order_status="approved", amount="100", currency="UAH")
+
+    for _ in range(3):
+        assert client.post("/billing/fondy/callback", json=payload).status_code == 200
+
+    with app.app_context():
+        assert PaymentCallback.query.count() == 1
+        # нічого не змінено до запуску воркера
+        assert Payment.query.one().status == "pending"
+
+    bad = dict(payload, signature="0" * 40)
+    assert client.post("/billing/fondy/callback", json=bad).status_code == 400
+
+
+def test_worker_applies_batch_once(app, client):
+    user_id = _setup(app)
+    client.post("/billing/fondy/callback", json=_signed(order_id="pro_1", order_status="processing"))
+    client.post("/billing/fondy/callback", json=_signed(order_id="pro_1", order_status="approved", amount="100"))
+    client.post("/billing/fondy/callback", json=_signed(order_id="missing", order_status="approved"))
+
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=["billing", "process-callbacks"])
+    assert "Callbacks processed: 3" in result.output
+
+    with app.app_context():
+        assert Payment.query.one().status == "paid"
+        user = db.session.get(User, user_id)
+        assert user.is_pro and user.pro_until is not None
+        assert PaymentCallback.query.filter_by(order_id="missing").one().error == "payment not found"
+
+    # пізній declined після оплати вже нічого не зіпсує
+    client.post("/billing/fondy/callback", json=_signed(order_id="pro_1", order_status="declined"))
+    runner.invoke(args=["billing", "process-callbacks"])
+    with app.app_context():
+        assert Payment.query.one().status == "paid"
+
+
+def test_inbox_metrics(app, client):
+    _setup(app)
+    app.config["OPS_TOKEN"] = "secret"
+    client.post("/billing/fondy/callback", json=_signed(order_id="pro_1", order_status="approved"))
+
+    data = client.get("/ops/callback-inbox", headers={"X-Ops-Token": "secret"}).get_json()
+    assert data["depth"] == 1
+    assert data["lag_seconds"] >= 0
+
+    app.test_cli_runner().invoke(args=["billing", "process-callbacks"])
+    data = client.get("/ops/callback-inbox", headers={"X-Ops-Token": "secret"}).get_json()
+    assert data["depth"] == 0
+    assert data["lag_seconds"] == 0.0
+    assert data["last_processed_at"] is not None
@@ -0,0 +1,82 @@
+from sqlalchemy import event
+
+from app.extensions import db, bcrypt
+from app.models.user import User
+from app.models.goal import Goal
+from app.models.task import Task
+
+
+def _create_user(email="test@example.com", password="password123"):
+    password_hash = bcrypt.generate_password_hash(password).decode("utf-8")
+    user = User(email=email, password_hash=password_hash)
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def _login(client, email="test@example.com", password="password123"):
+    return client.post(
+        "/login",
+        data={"email": email, "password": password},
+        follow_redirects=True,
+    )
+
+
+def test_planner_pages_answer_304_until_data_changes(app, client):
+    with app.app_context():
+        user = _create_user()
+        goal = Goal(title="Goal", user_id=user.id)
+        db.session.add(goal)
+        db.session.commit()
+        task = Task(title="Task", goal_id=goal.id)
+        db.session.add(task)
+        db.session.commit()
+        task_id = task.id
+
+    _login(client)
+
+    etags = {}
+    for path in ("/week", "/calendar", "/stats"):
+        resp = client.get(path)
+        assert resp.status_code == 200
+        assert resp.headers["Cache-Control"] == "private, no-cache"
+        etags[path] = resp.headers["ETag"]
+
+    statements = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with app.app_context():
+        event.listen(db.engine, "before_cursor_execute", _capture)
+        try:
+            for path, etag in etags.items():
+                resp = client.get(path, headers={"If-None-Match": etag})
+                assert resp.status_code == 304
+                assert resp.data == b""
+        finally:
+            event.remove(db.engine, "before_cursor_execute", _capture)
+
+    assert not [s for s in statements if "FROM task" in s or "FROM daily_completion" in s]
+
+    client.post(f"/tasks/{task_id}/toggle")
+
+    for path, etag in etags.items():
+        resp = client.get(path, headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.headers["ETag"] != etag
+
+
+def test_pending_flash_messages_bypass_304(app, client):
+    with app.app_context():
+        _create_user()
+
+    _login(client)
+    etag = client.get("/week").headers["ETag"]
+
+    with client.session_transaction() as sess:
+        sess["_flashes"] = [("info", "Hello")]
+
+    resp = client.get("/week", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert b"Hello" in resp.data
@@ -0,0 +1,57 @@
+import logging
+
+import pytest
+
+from app import create_app
+from app.extensions import db
+from app.services import db_tuning
+
+
+def test_sqlite_connections_get_pragmas(app, client):
+    with app.app_context():
+        with db.engine.connect() as connection:
+            pragmas = db_tuning.effective_pragmas(connection)
+
+    assert pragmas["journal_mode"] == "wal"
+    assert pragmas["synchronous"] == 1  # NORMAL
+    assert pragmas["busy_timeout"] == 5000
+    assert pragmas["cache_size"] == -65536
+
+    app.config["OPS_TOKEN"] = "secret"
+    data = client.get("/ops/db", headers={"X-Ops-Token": "secret"}).get_json()
+    assert data["backend"] == "sqlite"
+    assert data["pragmas"]["journal_mode"] == "WAL"
+    assert data["effective"]["journal_mode"] == "wal"
+
+
+def test_settings_are_logged_at_startup(tmp_path, caplog):
+    def tuning_levels(**config):
+        caplog.clear()
+        with caplog.at_level(logging.INFO):
+            create_app({"TESTING": True, "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'log.db'}", **config})
+        return [r.levelno for r in caplog.records if r.getMessage().startswith("database tuning: ")]
+
+    # кожен воркер, CLI-команда і тест створюють застосунок — без профілю це лише INFO
+    assert tuning_levels() == [logging.INFO]
+    assert tuning_levels(STARTUP_PROFILE=True) == [logging.WARNING]
+
+
+def test_engine_options_per_backend():
+    pg = db_tuning.engine_options({
+        "SQLALCHEMY_DATABASE_URI": "postgresql+psycopg://u:p@db/skilltracker",
+        "DB_POOL_SIZE": "5",
+        "DB_MAX_OVERFLOW": "",
+        "DB_POOL_RECYCLE": "600",
+        "DB_POOL_PRE_PING": "1",
+        "SQLALCHEMY_ENGINE_OPTIONS": {"pool_recycle": 300},
+    })
+    assert pg == {"pool_size": 5, "pool_recycle": 300, "pool_pre_ping": True}
+
+    lite = db_tuning.engine_options({"SQLALCHEMY_DATABASE_URI": "sqlite:///x.db", "SQLITE_BUSY_TIMEOUT_MS": "2500"})
+    assert lite == {"connect_args": {"timeout": 2.5}}
+
+
+def test_pragma_values_are_validated():
+    assert db_tuning.sqlite_pragmas({"SQLITE_JOURNAL_MODE": "", "SQLITE_CACHE_SIZE": "-2000"}) == {"cache_size": "-2000"}
+    with pytest.raises(ValueError):
+        db_tuning.sqlite_pragmas({"SQLITE_SYNCHRONOUS": "OFF; DROP TABLE user"})
@@ -0,0 +1,125 @@
+import time
+from datetime import datetime, timedelta
+
+from app import create_app
+from app.extensions import db, bcrypt
+from app.models.payment import Payment
+from app.models.user import User
+from app.services import entitlements
+from app.services.fondy import generate_signature
+
+NOW = datetime(2026, 10, 18, 12, 0, 0)
+
+
+def _create_user(email="test@example.com", password="password123", **fields):
+    password_hash = bcrypt.generate_password_hash(password).decode("utf-8")
+    user = User(email=email, password_hash=password_hash, **fields)
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def _login(client, email="test@example.com", password="password123"):
+    return client.post(
+        "/login",
+        data={"email": email, "password": password},
+        follow_redirects=True,
+    )
+
+
+def test_entitlement_follows_row_and_clock(app):
+    with app.app_context():
+        user = _create_user(is_pro=True, pro_until=NOW + timedelta(days=1))
+        user_id = user.id
+
+        assert entitlements.for_user(user_id, now=NOW) == entitlements.Entitlement("pro", NOW + timedelta(days=1))
+        assert entitlements.for_user(user_id, now=NOW + timedelta(days=2)) == entitlements.FREE
+
+        # рядок змінено в обхід сервісу: кеш ще показує старе, свіже читання — ні
+        db.session.get(User, user_id).pro_until = NOW - timedelta(days=1)
+        db.session.commit()
+        assert entitlements.for_user(user_id, now=NOW).is_pro
+        assert not entitlements.for_user(user_id, now=NOW, fresh=True).is_pro
+        assert not entitlements.for_user(user_id, now=NOW).is_pro
+
+        db.session.get(User, user_id).pro_until = NOW + timedelta(days=1)
+        db.session.commit()
+        entitlements.invalidate(user_id)
+        assert entitlements.for_user(user_id, now=NOW).is_pro
+        assert entitlements.for_user(user_id + 100, now=NOW) == entitlements.FREE
+
+
+def test_web_sees_upgrade_from_worker_process(app, client, tmp_path):
+    secret = "test-secret"
+    app.config.update(FONDY_MERCHANT_ID="1", FONDY_SECRET_KEY=secret)
+    # другий екземпляр застосунку з тією ж базою — як `flask billing process-callbacks`
+    worker = create_app({
+        "TESTING": True,
+        "SECRET_KEY": "test-secret-key",
+        "SQLALCHEMY_DATABASE_URI": app.config["SQLALCHEMY_DATABASE_URI"],
+    })
+
+    with app.app_context():
+        user = _create_user()
+        db.session.add(Payment(user_id=user.id, order_id="pro_1", amount=100, currency="UAH", status="pending"))
+        db.session.commit()
+
+    _login(client)
+    # кеш плану веб-процесу запам'ятовує Free; invalidate воркера сюди не дійде
+    app.extensions["entitlements"].ttl = 0.3
+    assert "Pro active" not in client.get("/settings/billing").get_data(as_text=True)
+
+    payload = {"order_id": "pro_1", "order_status": "approved", "amount": "100", "currency": "UAH"}
+    payload["signature"] = generate_signature(payload, secret)
+    assert client.post("/billing/fondy/callback", json=payload).status_code == 200
+    result = worker.test_cli_runner().invoke(args=["billing", "process-callbacks"])
+    assert "Callbacks processed: 1" in result.output
+
+    # оплата читає план свіжим, тож другий checkout не створюється одразу
+    response = client.post("/billing/fondy/create", follow_redirects=True)
+    assert "You already have an active Pro subscription" in response.get_data(as_text=True)
+    with app.app_context():
+        assert Payment.query.count() == 1
+
+    # сторінка плану наздоганяє, щойно минає TTL
+    time.sleep(0.35)
+    assert "Pro active" in client.get("/settings/billing").get_data(as_text=True)
+
+    with worker.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+
+def test_sweep_downgrades_expired_users_once(app):
+    with app.app_context():
+        expired = _create_user(email="expired@example.com", is_pro=True, pro_until=NOW - timedelta(seconds=1))
+        active = _create_user(email="active@example.com", is_pro=True, pro_until=NOW + timedelta(days=3))
+        free = _create_user(email="free@example.com")
+        ids = expired.id, active.id, free.id
+
+        assert entitlements.sweep(now=NOW, dry_run=True) == 1
+        assert entitlements.sweep(now=NOW) == 1
+        assert entitlements.sweep(now=NOW) == 0
+
+        db.session.expire_all()
+        assert [db.session.get(User, i).is_pro for i in ids] == [False, True, False]
+
+
+def test_cli_commands_use_frozen_clock(app):
+    with app.app_context():
+        user = _create_user(is_pro=True, pro_until=NOW + timedelta(days=1))
+        user_id = user.id
+
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=["billing", "entitlement", str(user_id), "--now", NOW.isoformat()])
+    assert f"user {user_id}: pro until" in result.output
+
+    result = runner.invoke(args=["billing", "expire-pro", "--now", NOW.isoformat()])
+    assert "Expired Pro users: 0" in result.output
+
+    later = (NOW + timedelta(days=2)).isoformat()
+    result = runner.invoke(args=["billing", "expire-pro", "--now", later])
+    assert "Expired Pro users: 1" in result.output
+
+    result = runner.invoke(args=["billing", "entitlement", str(user_id), "--now", later])
+    assert f"user {user_id}: free until -" in result.output
@@ -0,0 +1,123 @@
+import asyncio
+import time
+
+from app.extensions import db, bcrypt
+from app.models.user import User
+from app.models.payment import Payment
+from app.services.fondy import AsyncFondyClient, FondyClient
+from tests.fondy_stub import FondyStub
+
+SECRET = "test-secret"
+
+
+def _create_user(email="test@example.com", password="password123"):
+    password_hash = bcrypt.generate_password_hash(password).decode("utf-8")
+    user = User(email=email, password_hash=password_hash)
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def _login(client, email="test@example.com", password="password123"):
+    return client.post(
+        "/login",
+        data={"email": email, "password": password},
+        follow_redirects=True,
+    )
+
+
+def _payload(order_id):
+    return {"merchant_id": "1", "order_id": order_id, "order_desc": "Pro", "amount": 100, "currency": "UAH"}
+
+
+def test_client_reuses_connections():
+    with FondyStub(secret_key=SECRET) as stub:
+        client = FondyClient(stub.url, SECRET)
+        urls = [client.create_checkout_url(_payload(f"order_{i}")) for i in range(5)]
+        client.close()
+
+    assert urls[0] == "https://pay.example.test/checkout/order_0"
+    assert stub.requests == 5
+    assert stub.connections == 1
+
+
+def test_client_retries_gateway_errors_then_gives_up():
+    with FondyStub(secret_key=SECRET, fail_first=2) as stub:
+        client = FondyClient(stub.url, SECRET, max_retries=2, backoff=0.001)
+        assert client.create_checkout_url(_payload("order_retry")).endswith("order_retry")
+        assert stub.requests == 3
+
+    with FondyStub(secret_key=SECRET, fail_first=5) as stub:
+        client = FondyClient(stub.url, SECRET, max_retries=1, backoff=0.001)
+        try:
+            client.create_checkout_url(_payload("order_fail"))
+        except RuntimeError as exc:
+            assert "HTTP 503" in str(exc)
+        else:
+            raise AssertionError("expected RuntimeError")
+        assert stub.requests == 2
+
+
+def test_client_read_timeout_is_bounded():
+    with FondyStub(secret_key=SECRET, delay=0.5) as stub:
+        client = FondyClient(stub.url, SECRET, read_timeout=0.05, max_retries=0)
+        try:
+            client.create_checkout_url(_payload("order_slow"))
+        except RuntimeError as exc:
+            assert "timed out" in str(exc)
+        else:
+            raise AssertionError("expected RuntimeError")
+
+
+def test_client_resends_only_when_idle_connection_was_closed():
+    with FondyStub(secret_key=SECRET, idle_timeout=0.1) as stub:
+        client = FondyClient(stub.url, SECRET, max_retries=0)
+        client.create_checkout_url(_payload("order_1"))
+        time.sleep(0.3)
+        # пул віддає закрите сервером з'єднання: повтор безкоштовний і не витрачає спробу
+        assert client.create_checkout_url(_payload("order_2")).endswith("order_2")
+        assert stub.connections == 2
+        client.close()
+
+    with FondyStub(secret_key=SECRET) as stub:
+        client = FondyClient(stub.url, SECRET, read_timeout=0.1, max_retries=0)
+        client.create_checkout_url(_payload("order_1"))
+        stub.server.delay = 0.5
+        try:
+            client.create_checkout_url(_payload("order_2"))
+        except RuntimeError as exc:
+            assert "timed out" in str(exc)
+        else:
+            raise AssertionError("expected RuntimeError")
+        # таймаут на повторно використаному з'єднанні не відправляє платіж удруге
+        assert stub.requests == 2
+        client.close()
+
+
+def test_async_client():
+    async def run(url):
+        client = AsyncFondyClient(FondyClient(url, SECRET))
+        try:
+            return await asyncio.gather(*(client.create_checkout_url(_payload(f"a_{i}")) for i in range(4)))
+        finally:
+            await client.close()
+
+    with FondyStub(secret_key=SECRET) as stub:
+        urls = asyncio.run(run(stub.url))
+
+    assert sorted(urls) == [f"https://pay.example.test/checkout/a_{i}" for i in range(4)]
+
+
+def test_create_payment_redirects_to_stub_checkout(app, client):
+    with FondyStub(secret_key=SECRET) as stub:
+        app.config.update(FONDY_MERCHANT_ID="1", FONDY_SECRET_KEY=SECRET, FONDY_API_URL=stub.url)
+        with app.app_context():
+            _create_user()
+        _login(client)
+
+        resp = client.post("/billing/fondy/create")
+
+    assert resp.status_code == 302
+    assert resp.headers["Location"].startswith("https://pay.example.test/checkout/pro_")
+    with app.app_context():
+        assert Payment.query.one().status == "pending"
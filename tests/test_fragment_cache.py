@@ -0,0 +1,139 @@
+import os
+from datetime import date
+
+from sqlalchemy import event
+
+from app import create_app
+from app.extensions import db, bcrypt
+from app.models.user import User
+from app.models.goal import Goal
+from app.services.fragment_cache import FileSystemBackend, MemoryBackend
+
+
+def _create_user(email="test@example.com", password="password123"):
+    password_hash = bcrypt.generate_password_hash(password).decode("utf-8")
+    user = User(email=email, password_hash=password_hash)
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def _login(client, email="test@example.com", password="password123"):
+    return client.post(
+        "/login",
+        data={"email": email, "password": password},
+        follow_redirects=True,
+    )
+
+
+def _task_selects(app, client, path):
+    statements = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if "FROM task" in statement:
+            statements.append(statement)
+
+    with app.app_context():
+        event.listen(db.engine, "before_cursor_execute", _capture)
+        try:
+            resp = client.get(path)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", _capture)
+    return resp, statements
+
+
+def test_week_and_calendar_grids_are_cached_until_data_changes(app, client):
+    with app.app_context():
+        user = _create_user()
+        goal = Goal(title="Goal", user_id=user.id)
+        db.session.add(goal)
+        db.session.commit()
+        goal_id = goal.id
+
+    _login(client)
+
+    # логін уже відкрив /week, тож перший запит календаря рендерить сітку
+    _, statements = _task_selects(app, client, "/calendar")
+    assert statements
+
+    for path in ("/week", "/calendar"):
+        _, statements = _task_selects(app, client, path)
+        assert statements == []
+
+    client.post(
+        "/tasks/create",
+        data={"title": "Fresh task", "goal_id": goal_id, "planned_for": date.today().isoformat()},
+    )
+
+    for path in ("/week", "/calendar"):
+        resp, statements = _task_selects(app, client, path)
+        assert statements
+        assert b"Fresh task" in resp.data
+
+
+def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryBackend(maxsize=2)
+    backend.set("a", "1")
+    backend.set("b", "2")
+    assert backend.get("a") == "1"
+    backend.set("c", "3")
+
+    assert backend.get("b") is None
+    assert backend.get("a") == "1"
+    assert backend.get("c") == "3"
+
+
+def test_filesystem_backend_round_trip(tmp_path):
+    backend = FileSystemBackend(str(tmp_path / "fragments"))
+    assert backend.get("week:1") is None
+
+    backend.set("week:1", "<div>привіт</div>")
+    assert FileSystemBackend(str(tmp_path / "fragments")).get("week:1") == "<div>привіт</div>"
+
+
+def test_filesystem_backend_drops_expired_and_surplus_files(tmp_path):
+    directory = tmp_path / "fragments"
+    backend = FileSystemBackend(str(directory), ttl=60, max_files=3, sweep_every=0)
+    for n in range(5):
+        backend.set(f"week:{n}", str(n))
+        os.utime(backend._path(f"week:{n}"), (1000 + n, 1000 + n))
+    backend.ttl = 0
+
+    # понад max_files — найстаріші файли йдуть першими
+    assert backend.sweep() == 2
+    assert sorted(os.listdir(directory)) == sorted(
+        os.path.basename(backend._path(f"week:{n}")) for n in (2, 3, 4)
+    )
+
+    # прострочений файл видаляється вже при читанні
+    backend.ttl = 60
+    assert backend.get("week:4") is None
+    assert len(os.listdir(directory)) == 2
+
+
+def test_filesystem_backend_sweeps_while_writing(tmp_path):
+    backend = FileSystemBackend(str(tmp_path / "fragments"), max_files=2, sweep_every=4)
+    for n in range(8):
+        backend.set(f"week:{n}", str(n))
+        os.utime(backend._path(f"week:{n}"), (1000 + n, 1000 + n))
+    assert len(os.listdir(tmp_path / "fragments")) == 2
+    assert backend.get("week:7") == "7"
+
+
+def test_sweep_fragments_command(tmp_path):
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'test.db'}",
+        "FRAGMENT_CACHE_BACKEND": "filesystem",
+        "FRAGMENT_CACHE_DIR": str(tmp_path / "fragments"),
+        "FRAGMENT_CACHE_TTL": 60,
+    })
+    backend = app.extensions["fragment_cache"]
+    backend.set("week:old", "x")
+    os.utime(backend._path("week:old"), (1000, 1000))
+    backend.set("week:new", "y")
+
+    result = app.test_cli_runner().invoke(args=["stats", "sweep-fragments"])
+    assert result.exit_code == 0, result.output
+    assert "Fragments removed: 1" in result.output
+    assert backend.get("week:new") == "y"
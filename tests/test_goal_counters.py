@@ -0,0 +1,164 @@
+import re
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import event
+
+from app.extensions import db, bcrypt
+from app.models.user import User
+from app.models.goal import Goal
+from app.models.recurring_task import RecurringTask
+from app.models.task import Task
+from app.routes import goals as goals_routes
+from app.services import goal_counters
+
+
+def _create_user(email="test@example.com", password="password123"):
+    password_hash = bcrypt.generate_password_hash(password).decode("utf-8")
+    user = User(email=email, password_hash=password_hash)
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def _login(client, email="test@example.com", password="password123"):
+    return client.post(
+        "/login",
+        data={"email": email, "password": password},
+        follow_redirects=True,
+    )
+
+
+def _counters(goal_id):
+    goal = db.session.get(Goal, goal_id)
+    db.session.refresh(goal)
+    return goal.task_count, goal.done_count, goal.last_completed_at
+
+
+def test_counters_follow_create_toggle_and_bulk(app, client):
+    with app.app_context():
+        user = _create_user()
+        goal = Goal(title="Goal", user_id=user.id)
+        db.session.add(goal)
+        db.session.commit()
+        goal_id = goal.id
+
+    _login(client)
+    client.post("/tasks/create", data={"title": "A", "goal_id": goal_id})
+    client.post("/tasks/create", data={"title": "B", "goal_id": goal_id})
+    resp = client.post("/api/v1/tasks/bulk", json={"tasks": [
+        {"title": "C", "goal_id": goal_id},
+        {"title": "D", "goal_id": goal_id},
+    ]})
+    ids = [r["id"] for r in resp.get_json()["results"]]
+
+    with app.app_context():
+        first = Task.query.filter_by(title="A").one().id
+        assert _counters(goal_id) == (4, 0, None)
+
+    client.post(f"/tasks/{first}/toggle")
+    client.post("/api/v1/tasks/bulk-toggle", json={"ids": ids, "done": True})
+    with app.app_context():
+        total, done, last = _counters(goal_id)
+        assert (total, done) == (4, 3)
+        assert last == db.session.query(db.func.max(Task.completed_at)).scalar()
+
+    # зняли позначку з усіх — last_completed_at теж скидається
+    client.post(f"/tasks/{first}/toggle")
+    client.post("/api/v1/tasks/bulk-toggle", json={"ids": ids, "done": False})
+    with app.app_context():
+        assert _counters(goal_id) == (4, 0, None)
+
+
+def test_recurring_occurrence_counts_once(app, client):
+    today = date.today()
+    with app.app_context():
+        user = _create_user()
+        goal = Goal(title="Goal", user_id=user.id)
+        db.session.add(goal)
+        db.session.commit()
+        rule = RecurringTask(user_id=user.id, goal_id=goal.id, title="Daily", rule="daily", starts_on=today)
+        db.session.add(rule)
+        db.session.commit()
+        goal_id, rule_id = goal.id, rule.id
+
+    _login(client)
+    client.post(f"/recurring/{rule_id}/{today.isoformat()}/toggle")
+    client.post(f"/recurring/{rule_id}/{today.isoformat()}/toggle")
+    with app.app_context():
+        assert _counters(goal_id)[:2] == (1, 0)
+
+
+def test_goals_page_uses_one_query_for_progress(app, client):
+    today = date.today()
+    with app.app_context():
+        user = _create_user()
+        for n in range(5):
+            goal = Goal(title=f"Goal {n}", user_id=user.id)
+            db.session.add(goal)
+            db.session.flush()
+            db.session.add_all([
+                Task(title="late", goal_id=goal.id, user_id=user.id, due_date=today - timedelta(days=2)),
+                Task(title="later", goal_id=goal.id, user_id=user.id, due_date=today + timedelta(days=2)),
+                Task(title="done", goal_id=goal.id, user_id=user.id, is_done=True,
+                     due_date=today - timedelta(days=3), completed_at=datetime(2026, 1, 2, 10)),
+            ])
+        db.session.commit()
+        goal_counters.rebuild()
+        engine = db.engine
+
+    _login(client)
+    statements = []
+
+    def _count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        html = client.get("/goals").get_data(as_text=True)
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert len([s for s in statements if "FROM goal" in s]) == 1
+    assert not [s for s in statements if s.lstrip().startswith("SELECT task.")]
+    assert html.count("Done: 1/3") == 5
+    assert html.count("Overdue: 1") == 5
+    assert "2026-01-02" in html
+
+
+def test_goal_detail_pages_open_and_done_lists(app, client, monkeypatch):
+    monkeypatch.setattr(goals_routes, "TASKS_PAGE_SIZE", 2)
+    with app.app_context():
+        user = _create_user()
+        goal = Goal(title="Goal", user_id=user.id)
+        db.session.add(goal)
+        db.session.flush()
+        for n in range(5):
+            db.session.add(Task(title=f"open-{n}", goal_id=goal.id, user_id=user.id))
+        for n in range(3):
+            db.session.add(Task(title=f"done-{n}", goal_id=goal.id, user_id=user.id, is_done=True,
+                                completed_at=datetime(2026, 1, 1 + n)))
+        db.session.commit()
+        goal_id = goal.id
+
+    _login(client)
+
+    def titles(html, prefix):
+        return [part.split("<")[0] for part in html.split(f">{prefix}-")[1:]]
+
+    def next_link(html, anchor):
+        match = re.search(rf'id="{anchor}"[^>]*href="([^"]+)"', html)
+        return match.group(1).replace("&amp;", "&") if match else None
+
+    seen_open, url = [], f"/goals/{goal_id}"
+    while url:
+        html = client.get(url).get_data(as_text=True)
+        seen_open += titles(html, "open")
+        url = next_link(html, "open-more")
+    assert seen_open == ["4", "3", "2", "1", "0"]
+
+    seen_done, url = [], f"/goals/{goal_id}"
+    while url:
+        html = client.get(url).get_data(as_text=True)
+        seen_done += titles(html, "done")
+        url = next_link(html, "done-more")
+    assert seen_done == ["2", "1", "0"]
@@ -0,0 +1,98 @@
+from datetime import date
+
+from sqlalchemy import func, select
+
+from app.extensions import db, bcrypt
+from app.models.user import User
+from app.models.goal import Goal
+from app.models.recurring_task import RecurringTask
+from app.models.task import Task
+from app.services import goal_trash
+
+
+def _create_user(email="test@example.com", password="password123"):
+    password_hash = bcrypt.generate_password_hash(password).decode("utf-8")
+    user = User(email=email, password_hash=password_hash)
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def _login(client, email="test@example.com", password="password123"):
+    return client.post(
+        "/login",
+        data={"email": email, "password": password},
+        follow_redirects=True,
+    )
+
+
+def _seed(tasks=7):
+    today = date.today()
+    user = _create_user()
+    kept = Goal(title="Kept goal", user_id=user.id)
+    doomed = Goal(title="Doomed goal", user_id=user.id)
+    db.session.add_all([kept, doomed])
+    db.session.flush()
+    db.session.add(Task(title="kept-task", goal_id=kept.id, user_id=user.id, planned_for=today))
+    for n in range(tasks):
+        db.session.add(Task(title=f"doomed-task-{n}", goal_id=doomed.id, user_id=user.id, planned_for=today))
+    db.session.add(RecurringTask(user_id=user.id, goal_id=doomed.id, title="doomed-rule", rule="daily", starts_on=today))
+    db.session.commit()
+    return kept.id, doomed.id
+
+
+def _raw_count(model, **filters):
+    stmt = select(func.count()).select_from(model).filter_by(**filters)
+    return db.session.execute(stmt, execution_options={goal_trash.INCLUDE_DELETED: True}).scalar()
+
+
+def test_deleted_goal_is_hidden_at_once(app, client):
+    with app.app_context():
+        kept_id, doomed_id = _seed()
+
+    _login(client)
+    assert client.post(f"/goals/{doomed_id}/delete").status_code == 302
+
+    goals_page = client.get("/goals").get_data(as_text=True)
+    assert "Kept goal" in goals_page and "Doomed goal" not in goals_page
+
+    week = client.get("/week").get_data(as_text=True)
+    assert "kept-task" in week
+    assert "doomed-task" not in week and "doomed-rule" not in week
+
+    assert client.get(f"/goals/{doomed_id}").status_code == 404
+    titles = [t["title"] for t in client.get("/api/v1/tasks").get_json()["data"]]
+    assert titles == ["kept-task"]
+    assert client.post("/tasks/create", data={"title": "x", "goal_id": doomed_id}).status_code == 302
+
+    with app.app_context():
+        # рядки ще на місці — їх прибирає фонове очищення
+        assert _raw_count(Task, goal_id=doomed_id) == 7
+        assert Task.query.filter_by(goal_id=doomed_id).count() == 0
+        assert db.session.get(Goal, doomed_id) is None
+        assert db.session.get(Goal, kept_id) is not None
+
+
+def test_purge_removes_rows_in_chunks(app, client):
+    with app.app_context():
+        kept_id, doomed_id = _seed()
+    _login(client)
+    client.post(f"/goals/{doomed_id}/delete")
+
+    with app.app_context():
+        assert [goal_trash.purge_batch(3) for _ in range(5)] == [3, 3, 1, 1, 0]
+        assert _raw_count(Task, goal_id=doomed_id) == 0
+        assert _raw_count(RecurringTask, goal_id=doomed_id) == 0
+        assert _raw_count(Goal, id=doomed_id) == 0
+        assert _raw_count(Task, goal_id=kept_id) == 1
+
+
+def test_purge_command(app, client):
+    with app.app_context():
+        _, doomed_id = _seed(tasks=5)
+    _login(client)
+    client.post(f"/goals/{doomed_id}/delete")
+
+    result = app.test_cli_runner().invoke(args=["goals", "purge-deleted", "--chunk-size", "2", "--pause", "0"])
+    assert result.exit_code == 0, result.output
+    assert "Rows purged: 6" in result.output
@@ -0,0 +1,110 @@
+import logging
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app import create_app
+from app.extensions import db, bcrypt
+from app.models.user import User
+from app.models.goal import Goal
+
+
+@pytest.fixture()
+def instrumented_app(tmp_path):
+    app = create_app({
+        "TESTING": True,
+        "SECRET_KEY": "test-secret-key",
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'test.db'}",
+        "INSTRUMENTATION_ENABLED": True,
+        "INSTRUMENTATION_N_PLUS_ONE": 3,
+        "OPS_TOKEN": "secret",
+    })
+
+    # навмисний N+1: окремий SELECT на кожну ціль
+    def goal_titles():
+        ids = [goal_id for (goal_id,) in db.session.query(Goal.id)]
+        return ",".join(db.session.get(Goal, goal_id).title for goal_id in ids)
+
+    app.add_url_rule("/_test/n-plus-one", "n_plus_one", goal_titles)
+
+    # запит, що падає, а за ним звичайний — у тому самому з'єднанні
+    def failing_then_ok():
+        connection = db.session.connection()
+        try:
+            connection.exec_driver_sql("SELECT * FROM no_such_table")
+        except OperationalError:
+            pass
+        connection.exec_driver_sql("SELECT 1")
+        return ",".join(sorted(connection.info))
+
+    app.add_url_rule("/_test/failing", "failing", failing_then_ok)
+
+    with app.app_context():
+        db.create_all()
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+def _create_user(email="test@example.com", password="password123"):
+    password_hash = bcrypt.generate_password_hash(password).decode("utf-8")
+    user = User(email=email, password_hash=password_hash)
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def _login(client, email="test@example.com", password="password123"):
+    return client.post(
+        "/login",
+        data={"email": email, "password": password},
+        follow_redirects=True,
+    )
+
+
+def test_server_timing_and_metrics(instrumented_app):
+    with instrumented_app.app_context():
+        _create_user()
+    client = instrumented_app.test_client()
+    _login(client)
+
+    resp = client.get("/week")
+    timing = resp.headers["Server-Timing"]
+    assert timing.startswith("app;dur=")
+    assert 'queries"' in timing and "tpl;dur=" in timing
+
+    text = client.get("/ops/metrics", headers={"X-Ops-Token": "secret"}).get_data(as_text=True)
+    assert 'skilltracker_request_duration_seconds_count{endpoint="tasks.week_view"}' in text
+    assert 'skilltracker_sql_queries_total{endpoint="tasks.week_view"}' in text
+    assert "# TYPE skilltracker_request_duration_seconds histogram" in text
+
+
+def test_repeated_statements_are_logged(instrumented_app, caplog):
+    with instrumented_app.app_context():
+        user = _create_user()
+        db.session.add_all([Goal(title=f"G{i}", user_id=user.id) for i in range(4)])
+        db.session.commit()
+
+    client = instrumented_app.test_client()
+    with caplog.at_level(logging.WARNING):
+        assert client.get("/_test/n-plus-one").status_code == 200
+
+    assert any("N+1 suspect in n_plus_one: 4 x SELECT" in r.getMessage() for r in caplog.records)
+    text = client.get("/ops/metrics", headers={"X-Ops-Token": "secret"}).get_data(as_text=True)
+    assert 'skilltracker_n_plus_one_suspects_total{endpoint="n_plus_one"} 1' in text
+
+
+def test_failed_statement_leaves_no_timing_state(instrumented_app):
+    client = instrumented_app.test_client()
+    for _ in range(3):
+        resp = client.get("/_test/failing")
+        assert resp.status_code == 200
+        assert "_instrumentation_started" not in resp.get_data(as_text=True)
+    assert 'queries"' in resp.headers["Server-Timing"]
+
+
+def test_disabled_by_default(app, client):
+    app.config["OPS_TOKEN"] = "secret"
+    assert "Server-Timing" not in client.get("/login").headers
+    assert client.get("/ops/metrics", headers={"X-Ops-Token": "secret"}).status_code == 404
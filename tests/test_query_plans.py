@@ -0,0 +1,106 @@
+import re
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.extensions import db, bcrypt
+from app.models.user import User
+from app.models.goal import Goal
+from app.models.task import Task
+
+
+# FTS5: "SCAN search_index VIRTUAL TABLE INDEX ..." — це пошук по повнотекстовому індексу
+FULL_SCAN = re.compile(r"^SCAN (\w+)\b(?! USING (COVERING )?INDEX| VIRTUAL TABLE INDEX)")
+
+
+def _create_user(email="test@example.com", password="password123"):
+    password_hash = bcrypt.generate_password_hash(password).decode("utf-8")
+    user = User(email=email, password_hash=password_hash)
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def _login(client, email="test@example.com", password="password123"):
+    return client.post(
+        "/login",
+        data={"email": email, "password": password},
+        follow_redirects=True,
+    )
+
+
+@contextmanager
+def _captured_statements(engine):
+    statements = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+
+def _full_scans(statement, parameters):
+    plan = db.session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    return [row[-1] for row in plan if FULL_SCAN.match(row[-1])]
+
+
+@pytest.fixture()
+def seeded(app):
+    today = date.today()
+    with app.app_context():
+        user = _create_user()
+        other = _create_user(email="other@example.com")
+        goals = [Goal(title=f"Goal {i}", user_id=owner.id) for i in range(3) for owner in (user, other)]
+        db.session.add_all(goals)
+        db.session.commit()
+
+        for goal in goals:
+            for offset in range(-10, 10):
+                db.session.add(Task(
+                    title="Task",
+                    goal_id=goal.id,
+                    planned_for=today + timedelta(days=offset),
+                    is_done=offset % 2 == 0,
+                ))
+        db.session.commit()
+
+        own_goal = next(g for g in goals if g.user_id == user.id)
+        own_task = Task.query.filter_by(goal_id=own_goal.id).first()
+        return {"goal_id": own_goal.id, "task_id": own_task.id}
+
+
+def test_route_queries_use_indexes(app, client, seeded):
+    _login(client)
+
+    requests = [
+        ("get", "/week"),
+        ("get", "/calendar"),
+        ("get", "/stats"),
+        ("get", "/goals"),
+        ("get", f"/goals/{seeded['goal_id']}"),
+        ("get", "/api/v1/agenda"),
+        ("get", "/api/v1/search?q=tas"),
+        ("get", "/goals/search?q=tas"),
+        ("post", f"/tasks/{seeded['task_id']}/toggle"),
+        ("post", f"/goals/{seeded['goal_id']}/delete"),
+    ]
+
+    problems = []
+    for method, path in requests:
+        with app.app_context():
+            with _captured_statements(db.engine) as statements:
+                resp = getattr(client, method)(path)
+            assert resp.status_code in (200, 302), path
+
+            for statement, parameters in statements:
+                for detail in _full_scans(statement, parameters):
+                    problems.append(f"{method.upper()} {path}: {detail}\n    {statement}")
+
+    assert not problems, "full table scans:\n" + "\n".join(problems)
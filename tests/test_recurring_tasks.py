@@ -0,0 +1,174 @@
+from datetime import date, timedelta
+
+from app.extensions import db, bcrypt
+from app.models.user import User
+from app.models.goal import Goal
+from app.models.recurring_task import RecurringTask
+from app.models.task import Task
+from app.models.daily_completion import DailyCompletion
+from app.services import recurrence
+
+
+def _create_user(email="test@example.com", password="password123"):
+    password_hash = bcrypt.generate_password_hash(password).decode("utf-8")
+    user = User(email=email, password_hash=password_hash)
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def _login(client, email="test@example.com", password="password123"):
+    return client.post(
+        "/login",
+        data={"email": email, "password": password},
+        follow_redirects=True,
+    )
+
+
+def test_rules_expand_without_rows():
+    monday = date(2026, 10, 12)
+    daily = RecurringTask(id=1, rule="daily", starts_on=monday)
+    weekdays = RecurringTask(id=2, rule="weekdays", starts_on=monday)
+    every_3 = RecurringTask(id=3, rule="interval", interval_days=3, starts_on=monday, ends_on=monday + timedelta(days=7))
+
+    sunday = monday + timedelta(days=6)
+    assert len(recurrence.occurrences(daily, monday, sunday)) == 7
+    assert len(recurrence.occurrences(weekdays, monday, sunday)) == 5
+    assert recurrence.occurrences(every_3, monday - timedelta(days=5), monday + timedelta(days=30)) == [
+        monday, monday + timedelta(days=3), monday + timedelta(days=6),
+    ]
+
+
+def test_toggle_materializes_one_occurrence(app, client):
+    today = date.today()
+    with app.app_context():
+        user = _create_user()
+        goal = Goal(title="Habits", user_id=user.id)
+        db.session.add(goal)
+        db.session.commit()
+        goal_id = goal.id
+
+    _login(client)
+    resp = client.post(
+        f"/goals/{goal_id}/recurring",
+        data={"title": "Stretching", "rule": "daily", "starts_on": today.isoformat()},
+    )
+    assert resp.status_code == 302
+
+    with app.app_context():
+        rule_id = RecurringTask.query.one().id
+        assert Task.query.count() == 0
+
+    # входження видно на тижні, хоча рядків task ще немає
+    page = client.get("/week").get_data(as_text=True)
+    assert "Stretching" in page
+    assert f"/recurring/{rule_id}/{today.isoformat()}/toggle" in page
+
+    resp = client.post(f"/recurring/{rule_id}/{today.isoformat()}/toggle")
+    assert resp.status_code == 302
+
+    with app.app_context():
+        task = Task.query.one()
+        assert task.recurrence_id == rule_id
+        assert task.planned_for == today
+        assert task.is_done
+        assert db.session.query(db.func.sum(DailyCompletion.count)).scalar() == 1
+
+    # повторне перемикання працює з тим самим рядком
+    client.post(f"/recurring/{rule_id}/{today.isoformat()}/toggle")
+    with app.app_context():
+        assert Task.query.count() == 1
+        assert not Task.query.one().is_done
+        assert (db.session.query(db.func.sum(DailyCompletion.count)).scalar() or 0) == 0
+
+    # збережене входження не дублюється розгорнутим
+    with app.app_context():
+        task_id = Task.query.one().id
+    page = client.get("/week").get_data(as_text=True)
+    assert f"/tasks/{task_id}/toggle" in page
+    assert f"/recurring/{rule_id}/{today.isoformat()}/toggle" not in page
+
+
+def test_toggle_rejects_day_outside_rule(app, client):
+    monday = date(2026, 10, 12)
+    with app.app_context():
+        user = _create_user()
+        goal = Goal(title="Work", user_id=user.id)
+        db.session.add(goal)
+        db.session.commit()
+        rule = RecurringTask(user_id=user.id, goal_id=goal.id, title="Standup", rule="weekdays", starts_on=monday)
+        db.session.add(rule)
+        db.session.commit()
+        rule_id = rule.id
+
+    _login(client)
+    assert client.post(f"/recurring/{rule_id}/2026-10-17/toggle").status_code == 404
+    assert client.post(f"/recurring/{rule_id}/2026-10-09/toggle").status_code == 404
+    assert client.post(f"/recurring/{rule_id}/2026-10-16/toggle").status_code == 302
+
+    with app.app_context():
+        assert Task.query.count() == 1
+
+
+def test_create_rejects_non_positive_interval(app, client):
+    with app.app_context():
+        user = _create_user()
+        goal = Goal(title="Goal", user_id=user.id)
+        db.session.add(goal)
+        db.session.commit()
+        goal_id = goal.id
+    _login(client)
+
+    for value in ("-3", "0", "abc", ""):
+        resp = client.post(f"/goals/{goal_id}/recurring", data={
+            "title": "Every n days", "rule": "interval", "interval_days": value,
+        }, follow_redirects=True)
+        assert "Repeat rule ❌" in resp.get_data(as_text=True), value
+
+    client.post(f"/goals/{goal_id}/recurring", data={"title": "Every 2 days", "rule": "interval", "interval_days": "2"})
+    with app.app_context():
+        assert [(r.title, r.interval_days) for r in RecurringTask.query.all()] == [("Every 2 days", 2)]
+
+
+def test_api_lists_and_toggles_occurrences(app, client):
+    monday = date.today() - timedelta(days=date.today().weekday())
+    with app.app_context():
+        user = _create_user()
+        goal = Goal(title="Habits", user_id=user.id)
+        db.session.add(goal)
+        db.session.commit()
+        rule = RecurringTask(user_id=user.id, goal_id=goal.id, title="Stretching", rule="weekdays", starts_on=monday)
+        db.session.add(rule)
+        db.session.commit()
+        rule_id, goal_id = rule.id, goal.id
+
+    _login(client)
+    params = {"from": monday.isoformat(), "to": (monday + timedelta(days=6)).isoformat()}
+    body = client.get("/api/v1/tasks", query_string=params).get_json()
+    # той самий планер, що й /week: п'ять буднів, рядків task ще немає
+    assert body["data"] == []
+    assert [o["planned_for"] for o in body["occurrences"]] == [
+        (monday + timedelta(days=i)).isoformat() for i in range(5)
+    ]
+    assert body["occurrences"][0] == {
+        "recurrence_id": rule_id, "goal_id": goal_id, "title": "Stretching",
+        "task_type": None, "planned_for": monday.isoformat(), "is_done": False,
+    }
+
+    url = f"/api/v1/recurring/{rule_id}/{monday.isoformat()}/toggle"
+    resp = client.post(url, json={"done": True})
+    assert resp.status_code == 200
+    task_id = resp.get_json()["id"]
+    assert resp.get_json() == {"id": task_id, "is_done": True}
+    assert client.post(url, json={"done": True}).get_json() == {"id": task_id, "is_done": True}
+
+    body = client.get("/api/v1/tasks", query_string=params).get_json()
+    assert [(t["id"], t["recurrence_id"], t["is_done"]) for t in body["data"]] == [(task_id, rule_id, True)]
+    assert len(body["occurrences"]) == 4
+    with app.app_context():
+        assert db.session.query(db.func.sum(DailyCompletion.count)).scalar() == 1
+
+    saturday = (monday + timedelta(days=5)).isoformat()
+    assert client.post(f"/api/v1/recurring/{rule_id}/{saturday}/toggle").status_code == 404
+    assert client.post(f"/api/v1/recurring/{rule_id}/{monday.isoformat()}/toggle", json={"done": "yes"}).status_code == 400
+    assert client.get("/api/v1/tasks?from=2026-01-01&to=2027-06-01").status_code == 400
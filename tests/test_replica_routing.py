@@ -0,0 +1,99 @@
+import pytest
+
+from app import create_app
+from app.extensions import db, bcrypt
+from app.models.user import User
+from app.models.goal import Goal
+from app.models.user_streak import UserStreak
+from app.services.db_routing import replica_engine
+
+
+@pytest.fixture()
+def replica_app(tmp_path):
+    # два SQLite-файли замість primary і репліки; реплікації немає, тож видно, хто відповів
+    app = create_app({
+        "TESTING": True,
+        "SECRET_KEY": "test-secret-key",
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'primary.db'}",
+        "REPLICA_DATABASE_URL": f"sqlite:///{tmp_path / 'replica.db'}",
+    })
+
+    with app.app_context():
+        db.create_all()
+        db.metadata.create_all(replica_engine())
+
+        password_hash = bcrypt.generate_password_hash("password123").decode("utf-8")
+        user = User(email="test@example.com", password_hash=password_hash)
+        db.session.add(user)
+        db.session.commit()
+
+        with replica_engine().begin() as conn:
+            conn.execute(User.__table__.insert(), [{
+                "id": user.id,
+                "email": user.email,
+                "password_hash": password_hash,
+                "created_at": user.created_at,
+                "is_pro": False,
+                "data_version": 0,
+            }])
+            conn.execute(Goal.__table__.insert(), [{"title": "Replica goal", "user_id": user.id}])
+
+    yield app
+
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+        db.metadata.drop_all(replica_engine())
+        replica_engine().dispose()
+
+
+def _login(client, email="test@example.com", password="password123"):
+    return client.post(
+        "/login",
+        data={"email": email, "password": password},
+        follow_redirects=True,
+    )
+
+
+def test_read_only_views_use_replica(replica_app):
+    client = replica_app.test_client()
+    _login(client)
+
+    page = client.get("/goals").get_data(as_text=True)
+    assert "Replica goal" in page
+
+    assert client.get("/stats").status_code == 200
+    with replica_app.app_context():
+        # стан серії записано на primary, а не на репліку
+        assert db.session.get(UserStreak, 1) is not None
+        with replica_engine().connect() as conn:
+            assert conn.execute(UserStreak.__table__.select()).first() is None
+
+
+def test_reads_after_write_stick_to_primary(replica_app):
+    client = replica_app.test_client()
+    _login(client)
+
+    resp = client.post("/goals/create", data={"title": "Fresh goal"})
+    assert resp.status_code == 302
+
+    page = client.get("/goals").get_data(as_text=True)
+    assert "Fresh goal" in page
+    assert "Replica goal" not in page
+
+    # інший клієнт без щойно зробленого запису читає репліку
+    other = replica_app.test_client()
+    _login(other)
+    page = other.get("/goals").get_data(as_text=True)
+    assert "Replica goal" in page
+    assert "Fresh goal" not in page
+
+
+def test_sticky_window_expires(replica_app):
+    replica_app.config["REPLICA_STICKY_SECONDS"] = 0
+    client = replica_app.test_client()
+    _login(client)
+
+    client.post("/goals/create", data={"title": "Fresh goal"})
+    page = client.get("/goals").get_data(as_text=True)
+    assert "Replica goal" in page
@@ -0,0 +1,122 @@
+from datetime import date, timedelta
+
+from app.extensions import db, bcrypt
+from app.models.user import User
+from app.models.goal import Goal
+from app.models.recurring_task import RecurringTask
+from app.models.task import Task
+from app.services import rollover
+
+
+def _create_user(email="test@example.com", password="password123", rollover_tasks=False):
+    password_hash = bcrypt.generate_password_hash(password).decode("utf-8")
+    user = User(email=email, password_hash=password_hash, rollover_tasks=rollover_tasks)
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def _login(client, email="test@example.com", password="password123"):
+    return client.post(
+        "/login",
+        data={"email": email, "password": password},
+        follow_redirects=True,
+    )
+
+
+def _seed(user, today):
+    goal = Goal(title="Goal", user_id=user.id)
+    db.session.add(goal)
+    db.session.flush()
+    rule = RecurringTask(user_id=user.id, goal_id=goal.id, title="rule", rule="daily", starts_on=today - timedelta(days=9))
+    db.session.add(rule)
+    db.session.flush()
+    db.session.add_all([
+        Task(title="stale-1", goal_id=goal.id, user_id=user.id, planned_for=today - timedelta(days=3)),
+        Task(title="stale-2", goal_id=goal.id, user_id=user.id, planned_for=today - timedelta(days=1)),
+        Task(title="stale-3", goal_id=goal.id, user_id=user.id, planned_for=today - timedelta(days=1)),
+        Task(title="done", goal_id=goal.id, user_id=user.id, planned_for=today - timedelta(days=2), is_done=True),
+        Task(title="today", goal_id=goal.id, user_id=user.id, planned_for=today),
+        Task(title="occurrence", goal_id=goal.id, user_id=user.id, planned_for=today - timedelta(days=2),
+             recurrence_id=rule.id),
+    ])
+    db.session.commit()
+    return goal
+
+
+def _planned(title):
+    task = Task.query.filter_by(title=title).one()
+    return task.planned_for, task.rolled_over_from
+
+
+def test_rollover_moves_only_opted_in_stale_tasks(app):
+    today = date(2026, 3, 10)
+    with app.app_context():
+        _seed(_create_user("in@example.com", rollover_tasks=True), today)
+        other = _create_user("out@example.com")
+        goal = Goal(title="Other", user_id=other.id)
+        db.session.add(goal)
+        db.session.flush()
+        db.session.add(Task(title="not-opted-in", goal_id=goal.id, user_id=other.id, planned_for=today - timedelta(days=1)))
+        db.session.commit()
+
+        assert [r.tasks for r in rollover.report(today)] == [3]
+
+        result = rollover.run(today, chunk_size=2)
+        assert result == rollover.Result(users=1, tasks=3, finished=True)
+
+        assert _planned("stale-1") == (today, today - timedelta(days=3))
+        assert _planned("stale-2") == (today, today - timedelta(days=1))
+        assert _planned("done")[0] == today - timedelta(days=2)
+        assert _planned("occurrence")[0] == today - timedelta(days=2)
+        assert _planned("not-opted-in")[0] == today - timedelta(days=1)
+
+        # наступної ночі вже перенесена задача зберігає першу дату
+        tomorrow = today + timedelta(days=1)
+        assert rollover.run(tomorrow).tasks == 4
+        assert _planned("stale-1") == (tomorrow, today - timedelta(days=3))
+
+
+def test_rollover_command_dry_run_and_time_limit(app):
+    today = date(2026, 3, 10)
+    with app.app_context():
+        _seed(_create_user(rollover_tasks=True), today)
+
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=["tasks", "rollover", "--today", today.isoformat(), "--dry-run"])
+    assert result.exit_code == 0, result.output
+    assert "3 tasks since 2026-03-07" in result.output
+    assert "Tasks to roll over: 3 (dry run)" in result.output
+
+    with app.app_context():
+        assert Task.query.filter(Task.planned_for == today).count() == 1
+        # вичерпаний ліміт часу: жодного чанка, наступний запуск продовжить
+        assert rollover.run(today, time_limit=1e-9) == rollover.Result(0, 0, False)
+
+    result = runner.invoke(args=["tasks", "rollover", "--today", today.isoformat(), "--chunk-size", "1"])
+    assert result.exit_code == 0, result.output
+    assert "Tasks rolled over: 3 for 1 users" in result.output
+
+
+def test_week_toggle_opts_in(app, client):
+    with app.app_context():
+        user = _create_user()
+        db.session.add(Goal(title="Goal", user_id=user.id))
+        db.session.commit()
+    _login(client)
+
+    page = client.get("/week").get_data(as_text=True)
+    assert "☐" in page and 'name="enabled" value="1"' in page
+    # повторна відправка (дві вкладки, подвійний клік) не вимикає назад
+    for _ in range(2):
+        assert client.post("/settings/rollover", data={"enabled": "1"}).status_code == 302
+    page = client.get("/week").get_data(as_text=True)
+    assert "☑" in page and 'name="enabled" value="0"' in page
+    with app.app_context():
+        assert User.query.one().rollover_tasks is True
+
+    assert client.post("/settings/rollover").status_code == 400
+    client.post("/settings/rollover", data={"enabled": "0"})
+    assert "☐" in client.get("/week").get_data(as_text=True)
+    with app.app_context():
+        assert User.query.one().rollover_tasks is False
@@ -0,0 +1,97 @@
+from app.extensions import db, bcrypt
+from app.models.user import User
+from app.models.goal import Goal
+from app.models.task import Task
+from app.services import search
+
+
+def _create_user(email="test@example.com", password="password123"):
+    password_hash = bcrypt.generate_password_hash(password).decode("utf-8")
+    user = User(email=email, password_hash=password_hash)
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def _login(client, email="test@example.com", password="password123"):
+    return client.post(
+        "/login",
+        data={"email": email, "password": password},
+        follow_redirects=True,
+    )
+
+
+def _seed():
+    user = _create_user()
+    other = _create_user("other@example.com")
+    goal = Goal(title="Вивчити англійську", description="Граматика <b>щодня</b>", user_id=user.id)
+    foreign = Goal(title="Grammar club", user_id=other.id)
+    db.session.add_all([goal, foreign])
+    db.session.flush()
+    db.session.add_all([
+        Task(title="Present Perfect grammar drill", goal_id=goal.id, user_id=user.id),
+        Task(title="Англійська: граматика", goal_id=goal.id, user_id=user.id),
+        Task(title="Grammar of someone else", goal_id=foreign.id, user_id=other.id),
+    ])
+    db.session.commit()
+    return user.id, goal.id
+
+
+def test_prefix_search_is_scoped_ranked_and_escaped(app):
+    with app.app_context():
+        user_id, goal_id = _seed()
+
+        hits = search.search(user_id, "gram")
+        assert [(h.kind, str(h.title)) for h in hits] == [
+            ("task", "Present Perfect <mark>grammar</mark> drill"),
+        ]
+
+        hits = search.search(user_id, "ГРАМ")
+        assert {h.kind for h in hits} == {"task", "goal"}
+        goal_hit = next(h for h in hits if h.kind == "goal")
+        assert goal_hit.goal_id == goal_id
+        assert str(goal_hit.snippet) == "<mark>Граматика</mark> &lt;b&gt;щодня&lt;/b&gt;"
+
+        # обидва слова в назві задачі важать більше, ніж назва + опис цілі
+        assert [str(h.title) for h in search.search(user_id, "англ грам")] == [
+            "<mark>Англійська</mark>: <mark>граматика</mark>",
+            "Вивчити <mark>англійську</mark>",
+        ]
+        # оператори FTS з запиту не доходять до бази
+        assert search.search(user_id, '"pres* OR) NEAR(') == []
+        assert search.search(user_id, "   ") == []
+
+
+def test_index_follows_edits_and_deletes(app, client):
+    with app.app_context():
+        user_id, goal_id = _seed()
+        task = Task.query.filter_by(title="Present Perfect grammar drill").one()
+        task.title = "Past Simple drill"
+        db.session.commit()
+
+        assert search.search(user_id, "perfect") == []
+        assert [str(h.title) for h in search.search(user_id, "simp")] == ["Past <mark>Simple</mark> drill"]
+
+    _login(client)
+    client.post(f"/goals/{goal_id}/delete")
+    with app.app_context():
+        # м'яко видалена ціль і її задачі зникають одразу, ще до очищення
+        assert search.search(user_id, "drill") == []
+        assert search.search(user_id, "англ") == []
+
+
+def test_search_endpoints(app, client):
+    with app.app_context():
+        _seed()
+    _login(client)
+
+    response = client.get("/api/v1/search?q=gram")
+    assert response.status_code == 200
+    assert [item["title"] for item in response.get_json()["data"]] == ["Present Perfect <mark>grammar</mark> drill"]
+    assert client.get("/api/v1/search?q=gram", headers={"If-None-Match": response.headers["ETag"]}).status_code == 304
+    assert client.get("/api/v1/search?q=%20").status_code == 400
+
+    page = client.get("/goals/search?q=drill").get_data(as_text=True)
+    assert "Present Perfect <mark>grammar</mark> drill" not in page
+    assert "<mark>drill</mark>" in page
+    assert "Grammar of someone else" not in page
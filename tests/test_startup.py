@@ -0,0 +1,42 @@
+import subprocess
+import sys
+
+from app import create_app
+
+
+def test_create_app_defers_rarely_used_modules(tmp_path):
+    code = (
+        "import sys; from app import create_app; "
+        f"create_app({{'SQLALCHEMY_DATABASE_URI': 'sqlite:///{tmp_path / 'x.db'}'}}); "
+        "print(sorted(m for m in ('app.services.fondy', 'flask_migrate') "
+        "if m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"
+
+
+def test_billing_and_ops_routes_work(app, client):
+    assert client.get("/ops/db").status_code == 404
+    app.config["OPS_TOKEN"] = "secret"
+    assert client.get("/ops/db").status_code == 403
+    assert client.get("/ops/db", headers={"X-Ops-Token": "secret"}).status_code == 200
+    assert client.get("/billing").status_code == 302
+
+
+def test_startup_profile(tmp_path):
+    app = create_app({
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'x.db'}",
+        "STARTUP_PROFILE": True,
+    })
+    profile = app.extensions["startup_profile"]
+    names = [step.name for step in profile.steps]
+    assert names[0] == "database" and "blueprints" in names and names[-1] == "cli"
+    assert "total" in profile.report()
+
+
+def test_db_command_sets_up_migrate_on_demand(app):
+    assert "migrate" not in app.extensions
+    result = app.test_cli_runner().invoke(args=["db", "heads"])
+    assert result.exit_code == 0, result.output
+    assert "(head)" in result.output
+    assert "migrate" in app.extensions
@@ -0,0 +1,50 @@
+from datetime import date, datetime, timedelta
+
+from app.extensions import db, bcrypt
+from app.models.user import User
+from app.models.goal import Goal
+from app.models.task import Task
+from app.services import stats_queries
+
+
+def _create_user(email="test@example.com", password="password123"):
+    password_hash = bcrypt.generate_password_hash(password).decode("utf-8")
+    user = User(email=email, password_hash=password_hash)
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def test_completion_counts_groups_by_coalesced_day(app):
+    today = date.today()
+    yesterday = today - timedelta(days=1)
+
+    with app.app_context():
+        user = _create_user()
+        other = _create_user(email="other@example.com")
+        goal = Goal(title="Goal", user_id=user.id)
+        other_goal = Goal(title="Other", user_id=other.id)
+        db.session.add_all([goal, other_goal])
+        db.session.commit()
+
+        db.session.add_all([
+            # completed_at wins over planned_for
+            Task(title="a", goal_id=goal.id, is_done=True, planned_for=yesterday,
+                 completed_at=datetime.combine(today, datetime.min.time())),
+            # planned_for when there is no completed_at
+            Task(title="b", goal_id=goal.id, is_done=True, planned_for=yesterday),
+            Task(title="c", goal_id=goal.id, is_done=True, planned_for=yesterday),
+            # created_at as the last resort
+            Task(title="d", goal_id=goal.id, is_done=True,
+                 created_at=datetime.combine(today, datetime.min.time())),
+            Task(title="open", goal_id=goal.id, is_done=False, planned_for=today),
+            Task(title="old", goal_id=goal.id, is_done=True, planned_for=today - timedelta(days=200)),
+            Task(title="foreign", goal_id=other_goal.id, is_done=True, planned_for=today),
+        ])
+        db.session.commit()
+
+        rows = stats_queries.completion_counts(user.id, today - timedelta(days=89), today)
+        assert sorted(tuple(r) for r in rows) == [
+            (yesterday, goal.id, 2),
+            (today, goal.id, 2),
+        ]
@@ -0,0 +1,114 @@
+from datetime import date, datetime, timedelta
+
+from app.extensions import db, bcrypt
+from app.models.user import User
+from app.models.goal import Goal
+from app.models.task import Task
+from app.models.daily_completion import DailyCompletion
+
+
+def _create_user(email="test@example.com", password="password123"):
+    password_hash = bcrypt.generate_password_hash(password).decode("utf-8")
+    user = User(email=email, password_hash=password_hash)
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def _login(client, email="test@example.com", password="password123"):
+    return client.post(
+        "/login",
+        data={"email": email, "password": password},
+        follow_redirects=True,
+    )
+
+
+def _create_goal_with_task(user):
+    goal = Goal(title="Goal", description=None, user_id=user.id)
+    db.session.add(goal)
+    db.session.commit()
+
+    task = Task(title="Task", goal_id=goal.id, is_done=False)
+    db.session.add(task)
+    db.session.commit()
+    return goal.id, task.id
+
+
+def test_toggle_task_keeps_rollup_current(app, client):
+    with app.app_context():
+        user = _create_user()
+        goal_id, task_id = _create_goal_with_task(user)
+
+    _login(client)
+
+    client.post(f"/tasks/{task_id}/toggle")
+    with app.app_context():
+        rows = DailyCompletion.query.filter_by(goal_id=goal_id).all()
+        assert [(r.day, r.count) for r in rows] == [(datetime.utcnow().date(), 1)]
+
+    client.post(f"/tasks/{task_id}/toggle")
+    with app.app_context():
+        assert DailyCompletion.query.filter_by(goal_id=goal_id).count() == 0
+
+
+def test_delete_goal_removes_rollup_rows(app, client):
+    with app.app_context():
+        user = _create_user()
+        goal_id, task_id = _create_goal_with_task(user)
+
+    _login(client)
+    client.post(f"/tasks/{task_id}/toggle")
+
+    resp = client.post(f"/goals/{goal_id}/delete")
+    assert resp.status_code == 302
+
+    with app.app_context():
+        assert DailyCompletion.query.count() == 0
+
+
+def test_rebuild_rollup_backfills_and_feeds_stats(app, client):
+    today = date.today()
+
+    with app.app_context():
+        user = _create_user()
+        goal = Goal(title="Goal", description=None, user_id=user.id)
+        db.session.add(goal)
+        db.session.commit()
+
+        for offset in range(3):
+            db.session.add(Task(title="Done", goal_id=goal.id, is_done=True, planned_for=today - timedelta(days=offset)))
+        db.session.add(Task(title="Old", goal_id=goal.id, is_done=True, planned_for=today - timedelta(days=400)))
+        db.session.add(Task(title="Open", goal_id=goal.id, is_done=False, planned_for=today))
+        db.session.commit()
+
+    result = app.test_cli_runner().invoke(args=["stats", "rebuild-rollup"])
+    assert result.exit_code == 0
+    assert "4 buckets" in result.output
+
+    with app.app_context():
+        assert db.session.query(db.func.sum(DailyCompletion.count)).scalar() == 4
+
+    _login(client)
+    resp = client.get("/stats")
+    assert resp.status_code == 200
+    assert b'<div class="streak-value">3</div>' in resp.data
+
+
+def test_streak_continues_past_heatmap_window(app, client):
+    today = date.today()
+
+    with app.app_context():
+        user = _create_user()
+        goal = Goal(title="Goal", description=None, user_id=user.id)
+        db.session.add(goal)
+        db.session.commit()
+
+        for offset in range(120):
+            db.session.add(Task(title="Daily", goal_id=goal.id, is_done=True, planned_for=today - timedelta(days=offset)))
+        db.session.commit()
+
+    app.test_cli_runner().invoke(args=["stats", "rebuild-rollup"])
+
+    _login(client)
+    resp = client.get("/stats")
+    assert b'<div class="streak-value">120</div>' in resp.data
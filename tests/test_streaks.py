@@ -0,0 +1,115 @@
+import random
+from datetime import date, timedelta
+
+from app.extensions import db, bcrypt
+from app.models.user import User
+from app.models.goal import Goal
+from app.models.task import Task
+from app.models.daily_completion import DailyCompletion
+from app.models.user_streak import UserStreak
+from app.services import rollup, streaks
+
+
+def _create_user(email="test@example.com", password="password123"):
+    password_hash = bcrypt.generate_password_hash(password).decode("utf-8")
+    user = User(email=email, password_hash=password_hash)
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def _login(client, email="test@example.com", password="password123"):
+    return client.post(
+        "/login",
+        data={"email": email, "password": password},
+        follow_redirects=True,
+    )
+
+
+def _rollup_count(user_id, day):
+    return db.session.query(DailyCompletion.count).filter_by(user_id=user_id, day=day).scalar() or 0
+
+
+def test_summarize_finds_latest_and_longest_run():
+    d = date(2026, 1, 1)
+    days = [d, d + timedelta(days=1), d + timedelta(days=2), d + timedelta(days=5), d + timedelta(days=6)]
+    assert streaks.summarize(days) == (d + timedelta(days=5), d + timedelta(days=6), 3)
+    assert streaks.summarize([]) == (None, None, 0)
+
+
+def test_incremental_updates_match_recompute(app):
+    rnd = random.Random(7)
+    base = date(2026, 3, 1)
+
+    with app.app_context():
+        user = _create_user()
+        goal = Goal(title="Goal", user_id=user.id)
+        db.session.add(goal)
+        db.session.commit()
+        user_id, goal_id = user.id, goal.id
+
+        streaks.load(user_id)
+        active = set()
+        for _ in range(300):
+            # переважно біля кінця серії, іноді глибоко в минулому
+            day = base + timedelta(days=rnd.choice([rnd.randint(0, 40), rnd.randint(35, 40)]))
+            delta = -1 if day in active and rnd.random() < 0.6 else 1
+            if delta < 0:
+                active.discard(day)
+                rollup.record(user_id, goal_id, day, -_rollup_count(user_id, day))
+            else:
+                active.add(day)
+                rollup.record(user_id, goal_id, day, 1)
+            streaks.touch(user_id, [day])
+            db.session.commit()
+
+            state = db.session.get(UserStreak, user_id)
+            got = (state.run_start, state.last_active_day, state.longest)
+            assert got == streaks.summarize(sorted(active)), day
+
+
+def test_stats_show_current_and_longest(app, client):
+    today = date.today()
+
+    with app.app_context():
+        user = _create_user()
+        goal = Goal(title="Goal", user_id=user.id)
+        db.session.add(goal)
+        db.session.commit()
+        for offset in list(range(2)) + list(range(10, 15)):
+            db.session.add(Task(title="Done", goal_id=goal.id, is_done=True, planned_for=today - timedelta(days=offset)))
+        db.session.commit()
+
+    app.test_cli_runner().invoke(args=["stats", "rebuild-rollup"])
+
+    _login(client)
+    resp = client.get("/stats")
+    assert b'<div class="streak-value">2</div>' in resp.data
+    assert b'<strong class="streak-longest">5</strong>' in resp.data
+
+
+def test_reconcile_reports_and_fixes_drift(app):
+    today = date.today()
+
+    with app.app_context():
+        user = _create_user()
+        goal = Goal(title="Goal", user_id=user.id)
+        db.session.add(goal)
+        db.session.commit()
+        db.session.add(Task(title="Done", goal_id=goal.id, is_done=True, planned_for=today))
+        db.session.add(UserStreak(user_id=user.id, run_start=today, last_active_day=today, longest=9))
+        db.session.commit()
+        user_id = user.id
+
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=["stats", "reconcile-streaks"])
+    assert "1 mismatched" in result.output
+
+    result = runner.invoke(args=["stats", "reconcile-streaks", "--fix"])
+    assert "(fixed)" in result.output
+
+    with app.app_context():
+        assert db.session.get(UserStreak, user_id).longest == 1
+
+    result = runner.invoke(args=["stats", "reconcile-streaks"])
+    assert "0 mismatched" in result.output
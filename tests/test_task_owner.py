@@ -0,0 +1,59 @@
+from datetime import date
+
+from app.extensions import db, bcrypt
+from app.models.user import User
+from app.models.goal import Goal
+from app.models.task import Task
+
+
+def _create_user(email="test@example.com", password="password123"):
+    password_hash = bcrypt.generate_password_hash(password).decode("utf-8")
+    user = User(email=email, password_hash=password_hash)
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def _login(client, email="test@example.com", password="password123"):
+    return client.post(
+        "/login",
+        data={"email": email, "password": password},
+        follow_redirects=True,
+    )
+
+
+def test_task_user_id_follows_goal_owner(app, client):
+    with app.app_context():
+        user = _create_user()
+        other = _create_user(email="other@example.com")
+        goal = Goal(title="Mine", user_id=user.id)
+        other_goal = Goal(title="Theirs", user_id=other.id)
+        db.session.add_all([goal, other_goal])
+        db.session.commit()
+        goal_id, user_id = goal.id, user.id
+        other_goal_id, other_id = other_goal.id, other.id
+
+    _login(client)
+    resp = client.post(
+        "/tasks/create",
+        data={"title": "Reassigned task", "goal_id": goal_id, "planned_for": date.today().isoformat()},
+    )
+    assert resp.status_code == 302
+
+    with app.app_context():
+        task = Task.query.filter_by(title="Reassigned task").one()
+        assert task.user_id == user_id
+
+        # задача без явного user_id отримує власника цілі
+        orphan = Task(title="Inserted", goal_id=goal_id)
+        db.session.add(orphan)
+        db.session.commit()
+        assert orphan.user_id == user_id
+
+        # перенесення в чужу ціль переносить і власника
+        task.goal_id = other_goal_id
+        db.session.commit()
+        assert db.session.get(Task, task.id).user_id == other_id
+
+    resp = client.get("/week")
+    assert b"Reassigned task" not in resp.data
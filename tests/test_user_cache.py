@@ -0,0 +1,89 @@
+from sqlalchemy import event
+
+from app.extensions import db, bcrypt
+from app.models.user import User
+from app.services import user_cache
+
+
+def _create_user(email="test@example.com", password="password123"):
+    password_hash = bcrypt.generate_password_hash(password).decode("utf-8")
+    user = User(email=email, password_hash=password_hash)
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def _login(client, email="test@example.com", password="password123"):
+    return client.post(
+        "/login",
+        data={"email": email, "password": password},
+        follow_redirects=True,
+    )
+
+
+def _user_selects(app, client, path):
+    statements = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if "FROM user" in statement:
+            statements.append(statement)
+
+    with app.app_context():
+        event.listen(db.engine, "before_cursor_execute", _capture)
+        try:
+            client.get(path)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", _capture)
+    return statements
+
+
+def test_cached_user_skips_select_on_following_requests(app, client):
+    with app.app_context():
+        _create_user()
+
+    _login(client)
+    client.get("/")
+
+    assert _user_selects(app, client, "/") == []
+
+    stats = app.extensions["user_cache"].stats()
+    assert stats["hits"] >= 1
+    assert stats["misses"] >= 1
+
+
+def test_fake_activate_invalidates_cached_user(app, client):
+    app.config["BILLING_PROVIDER"] = "fake"
+    with app.app_context():
+        user_id = _create_user().id
+
+    _login(client)
+    client.get("/")
+    assert app.extensions["user_cache"].get(user_id)["is_pro"] is False
+
+    client.post("/billing/fake/activate")
+    assert app.extensions["user_cache"].get(user_id) is None
+
+    client.get("/")
+    assert app.extensions["user_cache"].get(user_id)["is_pro"] is True
+
+
+def test_cache_entries_expire():
+    cache = user_cache.UserCache(ttl=0.01)
+    cache.put(1, {"id": 1})
+    assert cache.get(1) == {"id": 1}
+
+    import time
+    time.sleep(0.02)
+    assert cache.get(1) is None
+    assert cache.stats() == {"size": 0, "hits": 1, "misses": 1, "invalidations": 0}
+
+
+def test_ops_endpoint_reports_counters(app, client):
+    assert client.get("/ops/user-cache").status_code == 404
+
+    app.config["OPS_TOKEN"] = "secret"
+    assert client.get("/ops/user-cache").status_code == 403
+
+    resp = client.get("/ops/user-cache", headers={"X-Ops-Token": "secret"})
+    assert resp.status_code == 200
+    assert set(resp.get_json()) == {"size", "hits", "misses", "invalidations"}